@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Adaptation Audit
+
+Regenerates `ide_adaptations_audit_report.md`: line, word, byte and section counts
+for every generic framework file, and per-IDE coverage showing which generic
+sections appear in each `framework/*-specific/` output. Used by
+`create_ide_adaptations.py audit`.
+
+Each file is read in one streaming pass that counts lines, words and bytes,
+collects headings (outside fenced code) and runs every generic heading through a
+single Aho-Corasick automaton, so coverage needs no second read. Results are cached
+by content hash in `framework/.cache/audit.json`; unchanged files are not rescanned.
+
+The report is deterministic (sorted, no timestamps or absolute paths) so CI can
+regenerate it and fail when it is out of date (`--check`).
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from decision_router import AhoCorasick
+
+AUDIT_REPORT = "ide_adaptations_audit_report.md"
+CACHE_VERSION = 1
+LINK_TARGET_RE = re.compile(r"\]\([^)]*\)")
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+
+
+def normalize(text):
+    """Lowercase text with Markdown link targets removed (IDE outputs rewrite `.md` links)."""
+    return " ".join(LINK_TARGET_RE.sub("]", text).lower().split())
+
+
+def scan(lines, matcher=None, keys=()):
+    """One pass over an iterable of byte lines: counts, headings and matched heading keys."""
+    stats = {"lines": 0, "words": 0, "bytes": 0, "sections": [], "matches": set()}
+    in_fence = False
+    for raw in lines:
+        stats["lines"] += 1
+        stats["bytes"] += len(raw)
+        line = raw.decode("utf-8", errors="replace")
+        stats["words"] += len(line.split())
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+            continue
+        if not in_fence:
+            match = HEADING_RE.match(line)
+            if match:
+                stats["sections"].append([len(match.group(1)), match.group(2)])
+        if matcher is not None:
+            for pattern_id, _, _ in matcher.iter_matches(normalize(line)):
+                stats["matches"].add(keys[pattern_id])
+    stats["matches"] = sorted(stats["matches"])
+    return stats
+
+
+class AdaptationAuditor:
+    def __init__(self, base_dir, cache_file=None):
+        self.base_dir = Path(base_dir)
+        self.framework_dir = self.base_dir / "framework"
+        self.generic_dir = self.framework_dir / "generic"
+        self.cache_file = Path(cache_file) if cache_file else self.framework_dir / ".cache" / "audit.json"
+        self.cache = self.load_cache()
+        self.scanned = 0
+
+    def load_cache(self):
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+                if cache.get("version") == CACHE_VERSION:
+                    return cache
+            except (OSError, ValueError):
+                pass
+        return {"version": CACHE_VERSION, "files": {}}
+
+    def save_cache(self, used):
+        self.cache["files"] = {k: v for k, v in self.cache["files"].items() if k in used}
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.cache, f, separators=(",", ":"))
+        os.replace(tmp_file, self.cache_file)
+
+    def file_stats(self, data, matcher, keys, keys_digest, used):
+        """Stats of one file's bytes, served from the hash cache when possible."""
+        key = f"{hashlib.sha1(data).hexdigest()}:{keys_digest}"
+        used.add(key)
+        cached = self.cache["files"].get(key)
+        if cached is None:
+            cached = scan(data.splitlines(keepends=True), matcher, keys)
+            self.cache["files"][key] = cached
+            self.scanned += 1
+        return cached
+
+    @staticmethod
+    def read_tree(folder):
+        """{relative path: bytes} for every file below an IDE output folder."""
+        outputs = {}
+        for root, dirs, files in os.walk(folder):
+            dirs[:] = sorted(d for d in dirs if d not in (".cache", ".store"))
+            for name in files:
+                if name.endswith(".backup"):
+                    continue
+                path = Path(root) / name
+                with open(path, "rb") as f:
+                    outputs[path.relative_to(folder).as_posix()] = f.read()
+        return outputs
+
+    def ide_outputs(self):
+        return {path.name: self.read_tree(path) for path in sorted(self.framework_dir.glob("*-specific"))
+                if path.is_dir()}
+
+    def run(self, rendered=None):
+        """Build the report text from the on-disk outputs, or from {ide: {path: bytes}} when given."""
+        used = set()
+        generic = {path.name: path.read_bytes() for path in sorted(self.generic_dir.glob("*.md"))}
+        generic_stats = {name: self.file_stats(data, None, (), "", used) for name, data in generic.items()}
+
+        # Every generic heading becomes one automaton pattern; coverage is the set of matched keys
+        keys = sorted({normalize(title) for stats in generic_stats.values() for _, title in stats["sections"]})
+        keys_digest = hashlib.sha1("\n".join(keys).encode("utf-8")).hexdigest()[:12]
+        matcher = AhoCorasick(keys)
+
+        outputs = rendered if rendered is not None else self.ide_outputs()
+        ide_stats = {}
+        for ide_name in sorted(outputs):
+            ide_stats[ide_name] = {path: self.file_stats(data, matcher, keys, keys_digest, used)
+                                   for path, data in sorted(outputs[ide_name].items())}
+        self.save_cache(used)
+        return self.render(generic_stats, ide_stats)
+
+    def render(self, generic_stats, ide_stats):
+        generic_names = list(generic_stats)
+        lines = [
+            "# IDE Adaptations Audit Report",
+            "",
+            "Generated by: `python3 create_ide_adaptations.py audit`",
+            "",
+            "## Generic Folder Analysis",
+            "",
+            f"Found {len(generic_names)} generic files:",
+            "",
+        ]
+        for name, stats in generic_stats.items():
+            lines += [
+                f"### {name}",
+                f"- Lines: {stats['lines']}",
+                f"- Words: {stats['words']}",
+                f"- Size: {stats['bytes']} bytes",
+                f"- Sections: {len(stats['sections'])}",
+                "",
+            ]
+            lines += [f"  - {'#' * level} {title}" for level, title in stats["sections"]]
+            lines.append("")
+
+        coverage = {}
+        for ide_name, files in ide_stats.items():
+            matched = set().union(*(set(stats["matches"]) for stats in files.values())) if files else set()
+            coverage[ide_name] = {}
+            for name, stats in generic_stats.items():
+                wanted = [title for _, title in stats["sections"]]
+                missing = [title for title in wanted if normalize(title) not in matched]
+                coverage[ide_name][name] = (len(wanted) - len(missing), len(wanted), missing)
+
+        lines += ["## Coverage Matrix", "",
+                  "Share of each generic file's sections that appear in the IDE output.", "",
+                  "| IDE | " + " | ".join(name[:-3] for name in generic_names) + " |",
+                  "|-----|" + "|".join("---:" for _ in generic_names) + "|"]
+        for ide_name in ide_stats:
+            cells = []
+            for name in generic_names:
+                found, total, _ = coverage[ide_name][name]
+                cells.append(f"{100 * found // total}%" if total else "—")
+            lines.append(f"| {ide_name} | " + " | ".join(cells) + " |")
+        lines += ["", "## IDE Adaptations Analysis", ""]
+
+        for ide_name, files in ide_stats.items():
+            lines += [f"### {ide_name}", "", f"**Files Found**: {len(files)}", "", "#### Files:"]
+            lines += [f"- `{path}`: {stats['lines']} lines, {stats['words']} words, {stats['bytes']} bytes"
+                      for path, stats in files.items()]
+            lines.append("")
+            gaps = [(name, missing) for name, (_, _, missing) in coverage[ide_name].items() if missing]
+            if gaps:
+                lines.append("#### Missing Content:")
+                for name, missing in gaps:
+                    lines.append(f"- **{name}**: Missing {len(missing)} sections")
+                    lines += [f"  - {title}" for title in missing]
+                lines.append("")
+            else:
+                lines += ["✅ **All generic content appears to be present**", ""]
+        return "\n".join(lines).rstrip("\n") + "\n"
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Adaptation Bundles
+
+Packs rendered IDE adaptations into reproducible archives, one per IDE, straight
+from `IDEAdaptationGenerator.generate_all()` – the {IDE: {path: bytes}} outputs
+of the in-memory generator API – so nothing is written to
+`framework/*-specific/` first. Used by `create_ide_adaptations.py bundle`.
+
+Archives are deterministic: entries are sorted, every entry gets the same mtime
+(`SOURCE_DATE_EPOCH`, or 1980-01-01), owners and permissions are normalized and
+compressor headers carry no timestamps or file names. Building the same sources
+twice produces byte-identical archives.
+
+Formats:
+- tar.xz – solid LZMA stream; the Markdown payloads share one compression window,
+           which is where most of the savings across the near-duplicate docs come from
+- tar.gz – solid gzip stream, for consumers without xz
+- zip    – per-entry deflate, for Windows users
+"""
+
+import gzip
+import io
+import lzma
+import os
+import tarfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BUNDLE_FORMATS = ("tar.xz", "tar.gz", "zip")
+DEFAULT_FORMAT = "tar.xz"
+DEFAULT_EPOCH = 315532800  # 1980-01-01, the earliest timestamp zip can store
+BUNDLE_PREFIX = "ai-epic-framework"
+FILE_MODE = 0o644
+
+
+def source_date_epoch():
+    """Fixed archive timestamp, overridable with the reproducible-builds SOURCE_DATE_EPOCH variable."""
+    try:
+        return max(int(os.environ["SOURCE_DATE_EPOCH"]), DEFAULT_EPOCH)
+    except (KeyError, ValueError):
+        return DEFAULT_EPOCH
+
+
+def write_tar(outputs, stream, mtime):
+    with tarfile.open(fileobj=stream, mode="w", format=tarfile.GNU_FORMAT) as archive:
+        for name in sorted(outputs):
+            data = outputs[name]
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = mtime
+            info.mode = FILE_MODE
+            info.uid = info.gid = 0
+            info.uname = info.gname = ""
+            archive.addfile(info, io.BytesIO(data))
+
+
+def write_zip(outputs, stream, mtime):
+    date_time = time.gmtime(mtime)[:6]
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as archive:
+        for name in sorted(outputs):
+            info = zipfile.ZipInfo(name, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = (0o100000 | FILE_MODE) << 16
+            info.create_system = 3  # Unix, so the mode above is honored everywhere
+            archive.writestr(info, outputs[name])
+
+
+def write_bundle(outputs, target, fmt=DEFAULT_FORMAT, mtime=None):
+    """Write one archive of {path: bytes} to `target` atomically. Returns the archive size."""
+    if fmt not in BUNDLE_FORMATS:
+        raise ValueError(f"Unknown bundle format '{fmt}'. Expected one of: {', '.join(BUNDLE_FORMATS)}")
+    mtime = source_date_epoch() if mtime is None else mtime
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = target.with_name(f".{target.name}.tmp")
+    with open(tmp_file, "wb") as raw:
+        if fmt == "zip":
+            write_zip(outputs, raw, mtime)
+        elif fmt == "tar.gz":
+            with gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0, compresslevel=9) as stream:
+                write_tar(outputs, stream, mtime)
+        else:
+            with lzma.LZMAFile(raw, "wb", preset=9 | lzma.PRESET_EXTREME) as stream:
+                write_tar(outputs, stream, mtime)
+    os.replace(tmp_file, target)
+    return target.stat().st_size
+
+
+def bundle_name(ide_name, fmt):
+    return f"{BUNDLE_PREFIX}-{ide_name.replace('-specific', '')}.{fmt}"
+
+
+def write_bundles(rendered, out_dir, fmt=DEFAULT_FORMAT, workers=None):
+    """Compress every {ide name: outputs} entry in parallel. Returns [(ide, path, files, bytes)].
+
+    zlib and lzma release the GIL while compressing, so threads scale across cores
+    without copying the rendered outputs into worker processes.
+    """
+    out_dir = Path(out_dir)
+    mtime = source_date_epoch()
+
+    def build(ide_name):
+        target = out_dir / bundle_name(ide_name, fmt)
+        size = write_bundle(rendered[ide_name], target, fmt, mtime)
+        return ide_name, target, len(rendered[ide_name]), size
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(build, sorted(rendered)))
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Adaptation Server
+
+Serves the rendered IDE adaptations over HTTP from memory, so repositories can
+fetch them instead of committing generated files. Used by
+`create_ide_adaptations.py serve`.
+
+URLs:
+    /                          JSON list of IDE adaptations
+    /<ide>/                    JSON list of files of one adaptation, with ETags
+    /<ide>/<path>              one generated file
+
+Every response is precomputed when the outputs are rendered: the body, its gzip
+variant (and brotli when the optional `brotli` package is installed) and a strong
+ETag per representation. Requests are a dictionary lookup; `If-None-Match` is
+answered with 304. The generic sources are checked at most once per second and
+the adaptations are re-rendered only when a file in `framework/generic/` changed.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+try:
+    import brotli
+except ImportError:  # optional: gzip is always available
+    brotli = None
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+RECHECK_INTERVAL = 1.0
+MIN_COMPRESS_BYTES = 256
+CONTENT_TYPES = {
+    ".md": "text/markdown; charset=utf-8",
+    ".mdc": "text/markdown; charset=utf-8",
+    ".json": "application/json",
+    ".yaml": "application/yaml",
+}
+DEFAULT_CONTENT_TYPE = "text/plain; charset=utf-8"
+
+
+def content_type(path):
+    return CONTENT_TYPES.get(os.path.splitext(path)[1], DEFAULT_CONTENT_TYPE)
+
+
+def build_response(body, mime):
+    """Precompute every representation of one resource: {encoding: (body, etag)} plus its type."""
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    variants = {"identity": (body, f'"{digest}"')}
+    if len(body) >= MIN_COMPRESS_BYTES:
+        variants["gzip"] = (gzip.compress(body, compresslevel=9, mtime=0), f'"{digest}-gz"')
+        if brotli is not None:
+            variants["br"] = (brotli.compress(body), f'"{digest}-br"')
+    return {"type": mime, "variants": variants}
+
+
+def preferred_encoding(accept_encoding, variants):
+    """Pick br, then gzip, when the client accepts them (q=0 disables an encoding)."""
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in ("br", "gzip"):
+        if encoding in variants and accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return "identity"
+
+
+class AdaptationSite:
+    """Precomputed responses for every IDE adaptation, refreshed when the generic sources change."""
+
+    def __init__(self, generator):
+        self.generator = generator
+        self.lock = threading.Lock()
+        self.responses = {}
+        self.signature = None
+        self.checked_at = 0.0
+        self.renders = 0
+
+    def source_signature(self):
+        signature = []
+        for root, dirs, files in os.walk(self.generator.generic_dir):
+            dirs.sort()
+            for name in sorted(files):
+                stat = os.stat(os.path.join(root, name))
+                signature.append((os.path.join(root, name), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def render(self):
+        rendered = self.generator.generate_all()
+        responses = {}
+        listing = []
+        for ide_name, outputs in sorted(rendered.items()):
+            files = {}
+            for path, data in sorted(outputs.items()):
+                response = build_response(data, content_type(path))
+                responses[f"/{ide_name}/{path}"] = response
+                files[path] = {"size": len(data), "etag": response["variants"]["identity"][1]}
+            responses[f"/{ide_name}/"] = build_response(
+                json.dumps({"ide": ide_name, "files": files}, indent=2).encode("utf-8"), "application/json")
+            listing.append({"ide": ide_name, "url": f"/{ide_name}/", "files": len(files)})
+        responses["/"] = build_response(json.dumps(listing, indent=2).encode("utf-8"), "application/json")
+        return responses
+
+    def refresh(self):
+        """Re-render when the generic sources changed since the last check (at most once per interval)."""
+        now = time.monotonic()
+        if self.responses and now - self.checked_at < RECHECK_INTERVAL:
+            return
+        with self.lock:
+            if self.responses and now - self.checked_at < RECHECK_INTERVAL:
+                return
+            signature = self.source_signature()
+            if signature != self.signature or not self.responses:
+                self.responses = self.render()
+                self.signature = signature
+                self.renders += 1
+            self.checked_at = time.monotonic()
+
+    def lookup(self, path):
+        self.refresh()
+        return self.responses.get(path)
+
+
+class AdaptationRequestHandler(BaseHTTPRequestHandler):
+    server_version = "AIEpicFramework"
+    site = None
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def respond(self, send_body):
+        path = unquote(urlsplit(self.path).path)
+        if path.count("/") == 1 and path != "/" and self.site.lookup(path + "/"):
+            path += "/"
+        response = self.site.lookup(path)
+        if response is None:
+            self.send_error(404, "Not Found")
+            return
+
+        encoding = preferred_encoding(self.headers.get("Accept-Encoding"), response["variants"])
+        body, etag = response["variants"][encoding]
+        etags = {tag.strip() for tag in (self.headers.get("If-None-Match") or "").split(",")}
+        not_modified = etag in etags or "*" in etags
+
+        self.send_response(304 if not_modified else 200)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if not not_modified:
+            self.send_header("Content-Type", response["type"])
+            self.send_header("Content-Length", str(len(body)))
+            if encoding != "identity":
+                self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        if send_body and not not_modified:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(generator, host=DEFAULT_HOST, port=DEFAULT_PORT, verbose=True):
+    """Create (but do not start) the HTTP server; port 0 picks a free port."""
+    site = AdaptationSite(generator)
+    site.refresh()
+    handler = type("BoundAdaptationRequestHandler", (AdaptationRequestHandler,), {"site": site})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.verbose = verbose
+    server.site = site
+    return server
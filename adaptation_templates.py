@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Adaptation Templates
+
+The fixed text of the IDE adaptations (Roo Code rules, `.rooignore`, Windsurf
+rules, the Copilot header, the Gemini prompt, ...) lives in `framework/templates/`
+instead of inline strings in `create_ide_adaptations.py`. Templates mirror the
+output paths (`<ide>-specific/<path>`; `shared/` holds bodies used by several
+IDEs) and may contain `{{ name }}` placeholders, e.g. `{{ user_rules }}` for the
+IDE's copy of the user rules template.
+
+Each template is compiled once into a segment list: the invariant text between
+placeholders becomes prebuilt UTF-8 bytes, so rendering is a join of those bytes
+with the encoded values. `save_cache()` stores compiled segments in
+`framework/.cache/templates.json`, keyed by each template's mtime and size, so
+unchanged templates are not even read on the next run; the generator calls it
+only when it writes the adaptations to disk.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+
+CACHE_VERSION = 1
+PLACEHOLDER_RE = re.compile(r"\{\{\s*([a-z_]+)\s*\}\}")
+
+
+class TemplateError(KeyError):
+    """A missing template or an unfilled placeholder."""
+
+
+def compile_template(text):
+    """Split template text into segments: bytes for literal text, str for placeholder names."""
+    segments = []
+    position = 0
+    for match in PLACEHOLDER_RE.finditer(text):
+        if match.start() > position:
+            segments.append(text[position:match.start()].encode("utf-8"))
+        segments.append(match.group(1))
+        position = match.end()
+    if position < len(text):
+        segments.append(text[position:].encode("utf-8"))
+    return segments
+
+
+class TemplateLibrary:
+    def __init__(self, template_dir, cache_file=None):
+        self.template_dir = Path(template_dir)
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.compiled = {}
+        self.cache = self.load_cache()
+        self.dirty = False
+
+    def load_cache(self):
+        if self.cache_file is not None and self.cache_file.exists():
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+                if cache.get("version") == CACHE_VERSION:
+                    return cache
+            except (OSError, ValueError):
+                pass
+        return {"version": CACHE_VERSION, "templates": {}}
+
+    def save_cache(self):
+        """Persist newly compiled templates (a no-op when nothing was recompiled)."""
+        if self.cache_file is None or not self.dirty:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.cache, f, separators=(",", ":"))
+        os.replace(tmp_file, self.cache_file)
+        self.dirty = False
+
+    def segments(self, name):
+        """Compiled segments of one template, from memory, the disk cache or the template file."""
+        segments = self.compiled.get(name)
+        if segments is not None:
+            return segments
+        path = self.template_dir / name
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise TemplateError(f"Template not found: {path}")
+        signature = [stat.st_mtime_ns, stat.st_size]
+        cached = self.cache["templates"].get(name)
+        if cached and cached["signature"] == signature:
+            # JSON keeps literals as text and placeholders as one-item lists
+            segments = [part[0] if isinstance(part, list) else part.encode("utf-8") for part in cached["segments"]]
+        else:
+            segments = compile_template(path.read_text(encoding="utf-8"))
+            self.cache["templates"][name] = {
+                "signature": signature,
+                "segments": [[part] if isinstance(part, str) else part.decode("utf-8") for part in segments],
+            }
+            self.dirty = True
+        self.compiled[name] = segments
+        return segments
+
+    def render(self, name, omit=(), **values):
+        """Render a template to bytes; invariant templates return their prebuilt bytes.
+
+        Placeholders listed in `omit` are dropped together with the blank lines around
+        them (the prompt-cache layout moves the user rules out of the template).
+        """
+        segments = self.segments(name)
+        if len(segments) == 1 and isinstance(segments[0], bytes):
+            return segments[0]
+        parts = []
+        join_next = False
+        for part in segments:
+            if isinstance(part, bytes):
+                parts.append(part.lstrip(b"\n") if join_next else part)
+                join_next = False
+            elif part in omit:
+                parts = [b"".join(parts).rstrip(b"\n") + b"\n\n"]
+                join_next = True
+            elif part in values:
+                value = values[part]
+                parts.append(value if isinstance(value, bytes) else value.encode("utf-8"))
+            else:
+                raise TemplateError(f"Template {name} needs a value for '{part}'")
+        return b"".join(parts)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Batch Adaptation Variants
+
+Renders the IDE adaptations for many parameter sets (project name, stack,
+compliance profile, task root) in one process. Used by
+`create_ide_adaptations.py batch`.
+
+The generic sources are parsed and every IDE adaptation is rendered once. A
+variant only differs from that base in a few places: the task root path, the
+compliance placeholder of the epic template and a "Project Context" section
+appended to each IDE's entry rules file. Files without those tokens are shared
+between all variants as the same bytes object, substituted files are memoized
+per parameter set, and variants are written in parallel, each into its own
+output root (`<out>/<variant name>/<ide>-specific/`). With the shared content
+store, the shared files of thousands of variants are backed by one object each.
+
+Variants file: a JSON list (or {"variants": [...]}), or JSON Lines (`.jsonl`)
+with one variant per line:
+
+    {"name": "payments", "project_name": "Payments API", "stack": "Python, PostgreSQL",
+     "compliance": "PCI-DSS", "task_root": "planning/tasks", "ides": ["cursor", "cline"]}
+
+Only `name` is required; it must be a plain folder name.
+"""
+
+import json
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+DEFAULT_TASK_ROOT = ".epic-workflows/tasks"
+COMPLIANCE_PLACEHOLDER = "[Any regulatory or security standards to meet]"
+VARIANT_FIELDS = ("name", "project_name", "stack", "compliance", "task_root", "ides")
+NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+TASK_ROOT_RE = re.compile(r"^[A-Za-z0-9._-]+(?:/[A-Za-z0-9._-]+)*$")
+
+
+class VariantError(ValueError):
+    """An invalid variants file or variant definition."""
+
+
+def normalize_variant(raw, ide_names, number):
+    """Validate one variant and fill in the defaults."""
+    if not isinstance(raw, dict):
+        raise VariantError(f"Variant {number}: expected an object")
+    unknown = sorted(set(raw) - set(VARIANT_FIELDS))
+    if unknown:
+        raise VariantError(f"Variant {number}: unknown field(s) {', '.join(unknown)}")
+    name = str(raw.get("name", ""))
+    if not NAME_RE.match(name):
+        raise VariantError(f"Variant {number}: 'name' must be a plain folder name, got '{name}'")
+    task_root = str(raw.get("task_root") or DEFAULT_TASK_ROOT).strip("/")
+    if not TASK_ROOT_RE.match(task_root) or ".." in task_root.split("/"):
+        raise VariantError(f"Variant '{name}': invalid task_root '{task_root}'")
+    requested = raw.get("ides") or list(ide_names)
+    if not isinstance(requested, list) or not all(isinstance(ide, str) for ide in requested):
+        raise VariantError(f"Variant '{name}': 'ides' must be a list of IDE names")
+    ides = []
+    for ide in requested:
+        # "Cline", "cline" and "cline-specific" all name the same adaptation
+        key = ide.strip().lower()
+        if key.endswith("-specific"):
+            key = key[:-len("-specific")]
+        ide_name = f"{key}-specific"
+        if ide_name not in ide_names:
+            raise VariantError(f"Variant '{name}': unknown IDE '{ide}'")
+        if ide_name not in ides:
+            ides.append(ide_name)
+    return {
+        "name": name,
+        "project_name": str(raw.get("project_name") or name),
+        "stack": str(raw.get("stack") or ""),
+        "compliance": str(raw.get("compliance") or ""),
+        "task_root": task_root,
+        "ides": ides,
+    }
+
+
+def load_variants(path, ide_names):
+    """Read a JSON or JSON Lines variants file into a list of normalized variants."""
+    path = Path(path)
+    with open(path, "r", encoding="utf-8") as f:
+        if path.suffix == ".jsonl":
+            raw_variants = [json.loads(line) for line in f if line.strip()]
+        else:
+            raw_variants = json.load(f)
+    if isinstance(raw_variants, dict):
+        raw_variants = raw_variants.get("variants", [])
+    variants = [normalize_variant(raw, ide_names, number) for number, raw in enumerate(raw_variants, 1)]
+    names = set()
+    for variant in variants:
+        if variant["name"] in names:
+            raise VariantError(f"Duplicate variant name '{variant['name']}'")
+        names.add(variant["name"])
+    return variants
+
+
+def project_context(variant):
+    """The Markdown section appended to each IDE's entry rules file."""
+    lines = ["", "## Project Context", "", f"- **Project**: {variant['project_name']}"]
+    if variant["stack"]:
+        lines.append(f"- **Stack**: {variant['stack']}")
+    if variant["compliance"]:
+        lines.append(f"- **Compliance Profile**: {variant['compliance']}")
+    lines.append(f"- **Task Root**: `/{variant['task_root']}/`")
+    return "\n".join(lines) + "\n"
+
+
+class VariantRenderer:
+    """Derives variant outputs from one base rendering of every IDE adaptation."""
+
+    def __init__(self, rendered, ide_configs):
+        self.rendered = rendered
+        self.entries = {ide_name: config["entry"] for ide_name, config in ide_configs.items()}
+        tokens = (DEFAULT_TASK_ROOT.encode("utf-8"), COMPLIANCE_PLACEHOLDER.encode("utf-8"))
+        # Only these files change between variants; everything else is shared as-is
+        self.templated = {ide_name: [path for path, data in outputs.items() if any(t in data for t in tokens)]
+                          for ide_name, outputs in rendered.items()}
+        self.substituted = {}
+
+    def substitute(self, ide_name, path, task_root, compliance):
+        key = (ide_name, path, task_root, compliance)
+        data = self.substituted.get(key)
+        if data is None:
+            data = self.rendered[ide_name][path]
+            if task_root != DEFAULT_TASK_ROOT:
+                data = data.replace(DEFAULT_TASK_ROOT.encode("utf-8"), task_root.encode("utf-8"))
+            if compliance:
+                data = data.replace(COMPLIANCE_PLACEHOLDER.encode("utf-8"), compliance.encode("utf-8"))
+            self.substituted[key] = data
+        return data
+
+    def render(self, variant):
+        """{IDE name: {path: bytes}} for one variant."""
+        context = project_context(variant).encode("utf-8")
+        result = {}
+        for ide_name in variant["ides"]:
+            outputs = dict(self.rendered[ide_name])
+            for path in self.templated[ide_name]:
+                outputs[path] = self.substitute(ide_name, path, variant["task_root"], variant["compliance"])
+            entry = self.entries[ide_name]
+            outputs[entry] = outputs[entry].rstrip(b"\n") + b"\n" + context
+            result[ide_name] = outputs
+        return result
+
+
+def write_variant(outputs_by_ide, variant_dir, content_store=None):
+    """Write one variant's adaptations, removing files a previous run left behind. Returns the file count."""
+    count = 0
+    for ide_name, outputs in outputs_by_ide.items():
+        ide_dir = variant_dir / ide_name
+        if ide_dir.is_dir():
+            for root, dirs, files in os.walk(ide_dir):
+                for name in files:
+                    path = Path(root) / name
+                    if path.relative_to(ide_dir).as_posix() not in outputs:
+                        path.unlink()
+        for relative_path, data in sorted(outputs.items()):
+            path = ide_dir / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if content_store is not None:
+                content_store.materialize(data, path)
+            else:
+                # A --shared-store run may have left a hardlink into the store here: replace it, never write through it
+                if path.exists() or path.is_symlink():
+                    path.unlink()
+                with open(path, "wb") as f:
+                    f.write(data)
+            count += 1
+    return count
+
+
+def render_variants(rendered, ide_configs, variants, out_dir, workers=None, content_store=None):
+    """Render and write every variant in parallel. Returns [(name, folder, files)] in input order.
+
+    Rendering a variant is a handful of byte replacements, so the work is file I/O,
+    which releases the GIL; threads share the base rendering without copying it.
+    """
+    out_dir = Path(out_dir)
+    renderer = VariantRenderer(rendered, ide_configs)
+
+    def build(variant):
+        variant_dir = out_dir / variant["name"]
+        stale = [ide_dir for ide_dir in variant_dir.glob("*-specific") if ide_dir.name not in variant["ides"]]
+        for ide_dir in stale:
+            shutil.rmtree(ide_dir)
+        return variant["name"], variant_dir, write_variant(renderer.render(variant), variant_dir, content_store)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(build, variants))
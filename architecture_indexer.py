@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Architecture Index Generator
+
+This script maintains the mandatory `index.md` file in every folder under
+`docs/architecture/` (see architecture-lifecycle.md §1.4). Each index holds a
+`| Domain | Description | Location |` table built from the canonical header of
+every document in the folder (title and Purpose) plus one row per child folder.
+
+Regeneration is incremental:
+- Document headers are cached by (mtime, size), so unchanged files are only stat'ed
+- Every folder gets a digest of its rows plus the (mtime, size) of the index.md last
+  written; a folder is re-rendered when either changed, so hand edits are repaired too
+- Unchanged index.md files are never touched
+- `--check` skips the digests and compares every rendered table with its index.md
+
+The table is written between marker comments so any hand-written text around it
+is preserved.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+INDEX_START = "<!-- architecture-index:start -->"
+INDEX_END = "<!-- architecture-index:end -->"
+TABLE_HEADER = "| Domain | Description | Location |"
+TABLE_DIVIDER = "|--------|-------------|----------|"
+DESCRIPTION_LIMIT = 160
+CACHE_VERSION = 2
+
+HEADER_FIELD_RE = re.compile(r"^\*\*(Status|Last Updated|Stakeholders|Related Docs)\*\*:\s*(.*?)\s*$")
+
+
+def humanize(name):
+    """Turn a kebab-case file or folder name into a display title."""
+    stem = name[:-3] if name.endswith(".md") else name
+    return " ".join(part.capitalize() for part in re.split(r"[-_]+", stem) if part)
+
+
+def parse_doc_header(path):
+    """Read the canonical header of an architecture document.
+
+    Returns a dict with `title`, `status`, `last_updated`, `stakeholders`,
+    `related_docs` and `purpose`. The file is streamed and reading stops as soon
+    as the Purpose paragraph is complete, so large documents are cheap to parse.
+    """
+    header = {
+        "title": "",
+        "status": "",
+        "last_updated": "",
+        "stakeholders": "",
+        "related_docs": "",
+        "purpose": "",
+    }
+    purpose_lines = []
+    in_purpose = False
+    in_fence = False
+
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for raw_line in f:
+            line = raw_line.strip()
+            if line.startswith("```"):
+                in_fence = not in_fence
+                continue
+            if in_fence:
+                continue
+
+            if in_purpose:
+                if line.startswith("#"):
+                    break
+                if not line:
+                    if purpose_lines:
+                        break
+                    continue
+                purpose_lines.append(line)
+                continue
+
+            if not header["title"] and line.startswith("# "):
+                header["title"] = line[2:].strip()
+                continue
+
+            match = HEADER_FIELD_RE.match(line)
+            if match:
+                key = match.group(1).lower().replace(" ", "_")
+                header[key] = match.group(2)
+                continue
+
+            if re.match(r"^##\s+Purpose\s*$", line, re.IGNORECASE):
+                in_purpose = True
+
+    header["purpose"] = " ".join(purpose_lines)
+    return header
+
+
+def table_cell(text, limit=DESCRIPTION_LIMIT):
+    """Collapse text into a single Markdown table cell."""
+    text = " ".join(text.split()).replace("|", "\\|")
+    if len(text) > limit:
+        text = text[: limit - 1].rstrip() + "…"
+    return text
+
+
+class ArchitectureIndexer:
+    def __init__(self, project_root=".", docs_dir="docs/architecture", cache_file=None):
+        self.project_root = Path(project_root).resolve()
+        self.docs_root = (self.project_root / docs_dir).resolve()
+        if cache_file is None:
+            cache_file = self.project_root / ".epic-workflows" / "cache" / "architecture-index.json"
+        self.cache_file = Path(cache_file)
+        self.cache = self.load_cache()
+        self.headers_parsed = 0
+
+    def load_cache(self):
+        """Load the header and folder digest cache, discarding incompatible versions."""
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+                if cache.get("version") == CACHE_VERSION:
+                    return cache
+            except (OSError, ValueError):
+                pass
+        return {"version": CACHE_VERSION, "docs": {}, "folders": {}}
+
+    def save_cache(self):
+        """Write the cache atomically so an interrupted run never corrupts it."""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.cache, f, separators=(",", ":"))
+        os.replace(tmp_file, self.cache_file)
+
+    def relative_key(self, path):
+        return Path(path).relative_to(self.docs_root).as_posix() or "."
+
+    def doc_header(self, entry, stat):
+        """Return the cached header for a document, re-parsing only when it changed."""
+        key = self.relative_key(entry.path)
+        signature = [stat.st_mtime_ns, stat.st_size]
+        cached = self.cache["docs"].get(key)
+        if cached and cached["sig"] == signature:
+            return cached["header"]
+
+        header = parse_doc_header(entry.path)
+        self.headers_parsed += 1
+        self.cache["docs"][key] = {"sig": signature, "header": header}
+        return header
+
+    def scan_folder(self, folder):
+        """Collect the sorted document and sub-folder entries of one folder."""
+        docs = []
+        subfolders = []
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subfolders.append(entry)
+                elif entry.name.endswith(".md") and entry.name != "index.md" and entry.is_file():
+                    docs.append(entry)
+        docs.sort(key=lambda e: e.name)
+        subfolders.sort(key=lambda e: e.name)
+        return docs, subfolders
+
+    def index_folder(self, folder, seen, changed, check_only, force):
+        """Index a folder bottom-up and return its summary for the parent row."""
+        docs, subfolders = self.scan_folder(folder)
+        rows = []
+
+        for doc in docs:
+            header = self.doc_header(doc, doc.stat())
+            seen.add(self.relative_key(doc.path))
+            domain = table_cell(header["title"] or humanize(doc.name), 80)
+            description = table_cell(header["purpose"]) or "—"
+            rows.append(f"| {domain} | {description} | [{doc.name}](./{doc.name}) |")
+
+        for sub in subfolders:
+            summary = self.index_folder(Path(sub.path), seen, changed, check_only, force)
+            rows.append(
+                f"| {table_cell(summary['title'], 80)} | {summary['description']} | "
+                f"[{sub.name}/](./{sub.name}/index.md) |"
+            )
+
+        folder_key = self.relative_key(folder)
+        title = humanize(folder.name) if folder != self.docs_root else "Architecture"
+        digest = hashlib.sha1("\n".join([title] + rows).encode("utf-8")).hexdigest()
+        index_file = folder / "index.md"
+
+        cached = self.cache["folders"].get(folder_key)
+        # --check compares the rendered table with the file itself, so hand edits inside the markers are caught;
+        # a normal run re-renders whenever the rows or the index.md written last time changed
+        if force or check_only or cached != {"digest": digest, "sig": self.index_signature(index_file)}:
+            if self.write_index(index_file, title, rows, check_only):
+                changed.append(index_file)
+            if not check_only:
+                self.cache["folders"][folder_key] = {"digest": digest, "sig": self.index_signature(index_file)}
+
+        doc_count = len(docs)
+        parts = [f"{doc_count} document{'s' if doc_count != 1 else ''}"]
+        if subfolders:
+            parts.append(f"{len(subfolders)} sub-folder{'s' if len(subfolders) != 1 else ''}")
+        return {"title": title, "description": ", ".join(parts)}
+
+    def index_signature(self, index_file):
+        """(mtime, size) of an index.md, or None when it does not exist."""
+        try:
+            stat = index_file.stat()
+        except FileNotFoundError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def render_block(self, rows):
+        return "\n".join([INDEX_START, TABLE_HEADER, TABLE_DIVIDER] + rows + [INDEX_END])
+
+    def merge_index(self, existing, title, rows):
+        """Splice the generated table into an existing index.md, keeping surrounding text."""
+        block = self.render_block(rows)
+        if existing is None:
+            heading = "Architecture Index" if title == "Architecture" else f"{title} Architecture Index"
+            return f"# {heading}\n\n{block}\n"
+
+        start = existing.find(INDEX_START)
+        end = existing.find(INDEX_END)
+        if start != -1 and end > start:
+            return existing[:start] + block + existing[end + len(INDEX_END):]
+
+        # First adoption of a hand-written index: replace its Domain table if it has one
+        lines = existing.split("\n")
+        for i, line in enumerate(lines):
+            if line.strip().replace(" ", "") == TABLE_HEADER.replace(" ", ""):
+                j = i + 1
+                while j < len(lines) and lines[j].strip().startswith("|"):
+                    j += 1
+                return "\n".join(lines[:i] + [block] + lines[j:])
+
+        return existing.rstrip("\n") + "\n\n" + block + "\n"
+
+    def write_index(self, index_file, title, rows, check_only):
+        """Write index.md if its content would change. Returns True when it is (or would be) modified."""
+        existing = None
+        if index_file.exists():
+            with open(index_file, "r", encoding="utf-8") as f:
+                existing = f.read()
+
+        content = self.merge_index(existing, title, rows)
+        if content == existing:
+            return False
+        if not check_only:
+            with open(index_file, "w", encoding="utf-8") as f:
+                f.write(content)
+        return True
+
+    def run(self, check_only=False, force=False):
+        """Bring every index.md under the architecture root up to date."""
+        if not self.docs_root.is_dir():
+            raise FileNotFoundError(f"Architecture directory not found: {self.docs_root}")
+
+        seen = set()
+        changed = []
+        self.index_folder(self.docs_root, seen, changed, check_only, force)
+
+        # Forget deleted documents so the cache does not grow without bound
+        self.cache["docs"] = {k: v for k, v in self.cache["docs"].items() if k in seen}
+        if not check_only:
+            self.save_cache()
+        return changed
+
+
+def main():
+    """Main function to run the architecture index generator."""
+    parser = argparse.ArgumentParser(description="Regenerate docs/architecture index.md tables incrementally.")
+    parser.add_argument('--root', default=".", help="Project root (default: current directory)")
+    parser.add_argument('--docs', default="docs/architecture", help="Architecture docs directory relative to root")
+    parser.add_argument('--check', action='store_true', help="Report stale index files without writing (exit 1 if any)")
+    parser.add_argument('--force', action='store_true', help="Ignore cached digests and rebuild every index")
+    args = parser.parse_args()
+
+    indexer = ArchitectureIndexer(args.root, args.docs)
+    try:
+        changed = indexer.run(check_only=args.check, force=args.force)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return 1
+
+    for index_file in changed:
+        verb = "Stale" if args.check else "Updated"
+        print(f"{'⚠️ ' if args.check else '✅'} {verb}: {index_file.relative_to(indexer.project_root)}")
+    print(f"📊 {len(changed)} index file(s) {'stale' if args.check else 'updated'}, "
+          f"{indexer.headers_parsed} header(s) parsed")
+    return 1 if args.check and changed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
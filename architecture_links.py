@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Architecture Link Checker
+
+Builds one link graph across `.epic-workflows/tasks/` and `docs/architecture/`:
+task "Architecture References", `docs/architecture/...` mentions, relative
+Markdown links (including `**Related Docs**`) and `#anchor` fragments. It reports
+
+- dangling links   – targets (or anchors) that do not exist
+- orphaned docs    – architecture docs that nothing links to
+- reverse refs     – which tasks and docs cite a given architecture doc
+
+Both trees are listed once into an in-memory path-existence set, so resolving a
+link never touches the filesystem; only links leaving the two trees fall back to
+a (memoized) stat. Extracted links and anchors are cached per file by
+(mtime, size) in `.epic-workflows/cache/architecture-links.json`, so reruns only
+re-read changed files.
+
+Usage:
+    python3 architecture_links.py
+    python3 architecture_links.py --cited-by docs/architecture/auth/index.md
+    python3 architecture_links.py --fail-on-broken   # CI mode
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from architecture_splitter import LINK_RE, heading_anchor, is_relative_link
+from task_hierarchy import ARCH_REF_RE, TASKS_DIR
+
+DOCS_DIR = "docs/architecture"
+CACHE_VERSION = 1
+
+
+def extract_links(path):
+    """Return (links, anchors) of a Markdown file; links are (line, target, is_project_path)."""
+    links = []
+    anchors = []
+    in_fence = False
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line_no, line in enumerate(f, 1):
+            if line.strip().startswith("```"):
+                in_fence = not in_fence
+                continue
+            if in_fence:
+                continue
+            if line.startswith("#"):
+                anchors.append(heading_anchor(line.lstrip("#")))
+            spans = []
+            for match in LINK_RE.finditer(line):
+                spans.append(match.span(2))
+                target = match.group(2).strip("<>")
+                if is_relative_link(target) and "[" not in target and "*" not in target:
+                    # Agents write `docs/architecture/...` links relative to the project root
+                    links.append((line_no, target, bool(ARCH_REF_RE.match(target))))
+            for match in ARCH_REF_RE.finditer(line):
+                ref = match.group(1).rstrip(".:")
+                inside_link = any(start <= match.start() < end for start, end in spans)
+                if "[" not in ref and "*" not in ref and not inside_link:
+                    links.append((line_no, ref, True))
+    return links, anchors
+
+
+class ArchitectureLinkChecker:
+    def __init__(self, project_root=".", docs_dir=DOCS_DIR, tasks_dir=TASKS_DIR, cache_file=None):
+        self.project_root = Path(project_root).resolve()
+        self.roots = [docs_dir.strip("/"), tasks_dir.strip("/")]
+        self.docs_dir = self.roots[0]
+        if cache_file is None:
+            cache_file = self.project_root / ".epic-workflows" / "cache" / "architecture-links.json"
+        self.cache_file = Path(cache_file)
+        self.cache = self.load_cache()
+        self.existing = set()
+        self.outside = {}
+        self.files_read = 0
+
+    def load_cache(self):
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+                if cache.get("version") == CACHE_VERSION:
+                    return cache
+            except (OSError, ValueError):
+                pass
+        return {"version": CACHE_VERSION, "files": {}}
+
+    def save_cache(self):
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.cache, f, separators=(",", ":"))
+        os.replace(tmp_file, self.cache_file)
+
+    def scan(self):
+        """List both trees once; returns {relative Markdown path: stat} and fills the existence set."""
+        markdown = {}
+        for root in self.roots:
+            if (self.project_root / root).is_dir():
+                self.existing.add(root)
+            stack = [self.project_root / root]
+            while stack:
+                folder = stack.pop()
+                try:
+                    entries = list(os.scandir(folder))
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
+                for entry in entries:
+                    relative = Path(entry.path).relative_to(self.project_root).as_posix()
+                    self.existing.add(relative)
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith("."):
+                            stack.append(Path(entry.path))
+                    elif entry.name.endswith(".md"):
+                        markdown[relative] = entry.stat()
+        return markdown
+
+    def exists(self, relative):
+        if any(relative == root or relative.startswith(root + "/") for root in self.roots):
+            return relative in self.existing
+        if relative not in self.outside:
+            self.outside[relative] = (self.project_root / relative).exists()
+        return self.outside[relative]
+
+    def file_links(self, relative, stat):
+        signature = [stat.st_mtime_ns, stat.st_size]
+        cached = self.cache["files"].get(relative)
+        if cached and cached["sig"] == signature:
+            return cached
+        links, anchors = extract_links(self.project_root / relative)
+        self.files_read += 1
+        entry = {"sig": signature, "links": links, "anchors": anchors}
+        self.cache["files"][relative] = entry
+        return entry
+
+    def resolve(self, source, target, is_project_path):
+        """Normalize a link target to (project-relative path, fragment)."""
+        path, _, fragment = target.partition("#")
+        if is_project_path:
+            resolved = posixpath.normpath(path.lstrip("/"))
+        elif not path:
+            resolved = source
+        else:
+            resolved = posixpath.normpath(posixpath.join(posixpath.dirname(source), path))
+        return resolved, fragment
+
+    def cited_doc(self, resolved):
+        """The document a resolved link points at (folders resolve to their index.md)."""
+        if resolved.endswith(".md"):
+            return resolved
+        index = f"{resolved}/index.md"
+        return index if index in self.existing else resolved
+
+    def run(self):
+        """Return {"dangling", "orphans", "cited_by"} for both trees."""
+        markdown = self.scan()
+        entries = {relative: self.file_links(relative, stat) for relative, stat in sorted(markdown.items())}
+        self.cache["files"] = {k: v for k, v in self.cache["files"].items() if k in markdown}
+        self.save_cache()
+
+        dangling = []
+        cited_by = defaultdict(set)
+        for source, entry in entries.items():
+            for line_no, target, is_project_path in entry["links"]:
+                resolved, fragment = self.resolve(source, target, is_project_path)
+                if resolved.startswith("../") or not self.exists(resolved):
+                    dangling.append({"source": source, "line": line_no, "target": target, "reason": "missing"})
+                    continue
+                doc = self.cited_doc(resolved)
+                if fragment and doc in entries and fragment.lower() not in entries[doc]["anchors"]:
+                    dangling.append({"source": source, "line": line_no, "target": target, "reason": "anchor"})
+                if doc != source:
+                    cited_by[doc].add(source)
+
+        root_index = f"{self.docs_dir}/index.md"
+        orphans = [relative for relative in entries
+                   if relative.startswith(self.docs_dir + "/") and relative != root_index
+                   and not cited_by.get(relative)]
+        return {
+            "dangling": dangling,
+            "orphans": orphans,
+            "cited_by": {doc: sorted(sources) for doc, sources in sorted(cited_by.items())},
+        }
+
+
+def main():
+    """Main function to run the architecture link checker."""
+    parser = argparse.ArgumentParser(description="Check architecture references across tasks and docs.")
+    parser.add_argument('--root', default=".", help="Project root (default: current directory)")
+    parser.add_argument('--docs', default=DOCS_DIR, help=f"Architecture docs folder (default: {DOCS_DIR})")
+    parser.add_argument('--cited-by', default=None, metavar="DOC", help="List the tasks and docs citing DOC")
+    parser.add_argument('--json', action='store_true', help="Print the full report as JSON")
+    parser.add_argument('--fail-on-broken', action='store_true', help="Exit 1 when dangling links are found")
+    args = parser.parse_args()
+
+    checker = ArchitectureLinkChecker(args.root, args.docs)
+    report = checker.run()
+
+    if args.cited_by:
+        doc = checker.cited_doc(posixpath.normpath(args.cited_by.strip("/")))
+        for source in report["cited_by"].get(doc, []):
+            print(source)
+        return 0
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for link in report["dangling"]:
+            what = "missing anchor" if link["reason"] == "anchor" else "broken link"
+            print(f"❌ {link['source']}:{link['line']}: {what} → {link['target']}")
+        for doc in report["orphans"]:
+            print(f"⚠️  orphaned: {doc}")
+        print(f"📊 {len(report['dangling'])} dangling link(s), {len(report['orphans'])} orphaned doc(s), "
+              f"{len(report['cited_by'])} cited doc(s), {checker.files_read} file(s) read")
+    return 1 if args.fail_on_broken and report["dangling"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Section Search Index
+
+This script replaces file-name discovery (`find docs/architecture/ -name "*.md" | grep -i oauth`)
+with a local full-text index at heading/section granularity. Every Markdown file under
+`docs/architecture/` and `.epic-workflows/tasks/` is cut into sections at its headings,
+and each section is indexed with its file and line range, so an agent can load the one
+relevant section instead of a whole document.
+
+The inverted index lives in a SQLite database under `.epic-workflows/cache/` and is
+updated incrementally: files are re-indexed only when their (mtime, size) changes.
+Queries are ranked with BM25.
+
+Usage:
+    python3 architecture_search.py query "oauth token refresh" -k 5
+    python3 architecture_search.py query "oauth" --show
+    python3 architecture_search.py index
+"""
+
+import argparse
+import math
+import os
+import re
+import sqlite3
+import sys
+from collections import Counter
+from pathlib import Path
+
+DEFAULT_SOURCES = ["docs/architecture", ".epic-workflows/tasks"]
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+HEADING_WEIGHT = 3
+BM25_K1 = 1.2
+BM25_B = 0.75
+SCHEMA_VERSION = 1
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have how in is it its of on or that the this to
+was were what when where which who will with into than then there these those not
+""".split())
+
+
+def tokenize(text):
+    """Lowercase word tokens without stopwords."""
+    return [t for t in TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def iter_sections(path):
+    """Stream a Markdown file and yield (heading path, start line, end line, term counts)."""
+    trail = []
+    heading = None
+    start = 1
+    terms = Counter()
+    in_fence = False
+    line_no = 0
+
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line_no, line in enumerate(f, 1):
+            stripped = line.strip()
+            if stripped.startswith("```"):
+                in_fence = not in_fence
+            match = None if in_fence else HEADING_RE.match(stripped)
+            if match:
+                if terms or heading is not None:
+                    yield " > ".join(trail) or Path(path).name, start, line_no - 1, terms
+                level = len(match.group(1))
+                heading = match.group(2)
+                trail = trail[:level - 1] + [heading]
+                start = line_no
+                terms = Counter()
+                for _ in range(HEADING_WEIGHT):
+                    terms.update(tokenize(heading))
+                continue
+            terms.update(tokenize(line))
+
+    if terms or heading is not None:
+        yield " > ".join(trail) or Path(path).name, start, max(line_no, start), terms
+
+
+class SectionSearchIndex:
+    def __init__(self, project_root=".", sources=None, db_file=None):
+        self.project_root = Path(project_root).resolve()
+        self.sources = sources or DEFAULT_SOURCES
+        if db_file is None:
+            db_file = self.project_root / ".epic-workflows" / "cache" / "search-index.sqlite"
+        Path(db_file).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(db_file))
+        self.create_schema()
+
+    def create_schema(self):
+        """Create the index tables, dropping them if the schema version changed."""
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self.db.executescript("""
+                DROP TABLE IF EXISTS files;
+                DROP TABLE IF EXISTS sections;
+                DROP TABLE IF EXISTS postings;
+            """)
+        self.db.executescript(f"""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS sections (
+                id INTEGER PRIMARY KEY, path TEXT, heading TEXT,
+                start_line INTEGER, end_line INTEGER, length INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT, section_id INTEGER, tf INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS postings_term ON postings(term);
+            CREATE INDEX IF NOT EXISTS postings_section ON postings(section_id);
+            CREATE INDEX IF NOT EXISTS sections_path ON sections(path);
+            PRAGMA user_version = {SCHEMA_VERSION};
+        """)
+
+    def walk_sources(self):
+        """Yield (relative path, stat) for every Markdown file in the indexed trees."""
+        for source in self.sources:
+            source_dir = self.project_root / source
+            if not source_dir.is_dir():
+                continue
+            for dirpath, dirnames, filenames in os.walk(source_dir):
+                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+                for name in filenames:
+                    if name.endswith(".md"):
+                        full = os.path.join(dirpath, name)
+                        rel = os.path.relpath(full, self.project_root).replace(os.sep, "/")
+                        yield rel, os.stat(full)
+
+    def remove_file(self, rel):
+        self.db.execute(
+            "DELETE FROM postings WHERE section_id IN (SELECT id FROM sections WHERE path = ?)", (rel,)
+        )
+        self.db.execute("DELETE FROM sections WHERE path = ?", (rel,))
+        self.db.execute("DELETE FROM files WHERE path = ?", (rel,))
+
+    def add_file(self, rel, stat):
+        for heading, start, end, terms in iter_sections(self.project_root / rel):
+            cursor = self.db.execute(
+                "INSERT INTO sections (path, heading, start_line, end_line, length) VALUES (?, ?, ?, ?, ?)",
+                (rel, heading, start, end, sum(terms.values())),
+            )
+            self.db.executemany(
+                "INSERT INTO postings (term, section_id, tf) VALUES (?, ?, ?)",
+                [(term, cursor.lastrowid, tf) for term, tf in terms.items()],
+            )
+        self.db.execute(
+            "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+            (rel, stat.st_mtime_ns, stat.st_size),
+        )
+
+    def update(self):
+        """Re-index added or modified files and drop deleted ones. Returns (indexed, removed)."""
+        known = {row[0]: (row[1], row[2]) for row in self.db.execute("SELECT path, mtime_ns, size FROM files")}
+        indexed = 0
+        with self.db:
+            for rel, stat in self.walk_sources():
+                signature = known.pop(rel, None)
+                if signature == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                if signature is not None:
+                    self.remove_file(rel)
+                self.add_file(rel, stat)
+                indexed += 1
+            for rel in known:
+                self.remove_file(rel)
+        return indexed, len(known)
+
+    def query(self, text, top_k=5):
+        """Return the top-k sections for a query, ranked by BM25."""
+        terms = list(dict.fromkeys(tokenize(text)))
+        if not terms:
+            return []
+
+        total, avg_length = self.db.execute("SELECT COUNT(*), AVG(length) FROM sections").fetchone()
+        if not total:
+            return []
+        avg_length = avg_length or 1
+
+        scores = Counter()
+        for term in terms:
+            rows = self.db.execute(
+                "SELECT p.section_id, p.tf, s.length FROM postings p JOIN sections s ON s.id = p.section_id "
+                "WHERE p.term = ?", (term,)
+            ).fetchall()
+            if not rows:
+                continue
+            idf = math.log(1 + (total - len(rows) + 0.5) / (len(rows) + 0.5))
+            for section_id, tf, length in rows:
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                scores[section_id] += idf * tf * (BM25_K1 + 1) / norm
+
+        results = []
+        for section_id, score in scores.most_common(top_k):
+            path, heading, start, end = self.db.execute(
+                "SELECT path, heading, start_line, end_line FROM sections WHERE id = ?", (section_id,)
+            ).fetchone()
+            results.append({"path": path, "heading": heading, "start": start, "end": end, "score": score})
+        return results
+
+    def read_section(self, result):
+        """Read only the lines of one section from disk."""
+        lines = []
+        with open(self.project_root / result["path"], "r", encoding="utf-8", errors="replace") as f:
+            for line_no, line in enumerate(f, 1):
+                if line_no > result["end"]:
+                    break
+                if line_no >= result["start"]:
+                    lines.append(line)
+        return "".join(lines)
+
+
+def main():
+    """Main function to run the section search index."""
+    parser = argparse.ArgumentParser(description="Section-level search over architecture docs and task trees.")
+    parser.add_argument('--root', default=".", help="Project root (default: current directory)")
+    parser.add_argument('--source', action='append', dest='sources',
+                        help="Directory to index relative to root (repeatable, default: docs/architecture and .epic-workflows/tasks)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('index', help="Update the index incrementally")
+
+    query_parser = subparsers.add_parser('query', help="Search the index")
+    query_parser.add_argument('text', help="Search terms")
+    query_parser.add_argument('-k', '--top', type=int, default=5, help="Number of sections to return (default: 5)")
+    query_parser.add_argument('--show', action='store_true', help="Print the text of each matching section")
+    query_parser.add_argument('--no-update', action='store_true', help="Query the index as-is without refreshing it")
+    args = parser.parse_args()
+
+    index = SectionSearchIndex(args.root, args.sources)
+
+    if args.command == 'index' or not args.no_update:
+        indexed, removed = index.update()
+        if args.command == 'index':
+            print(f"✅ Indexed {indexed} file(s), removed {removed}")
+            return 0
+
+    results = index.query(args.text, args.top)
+    if not results:
+        print(f"❌ No sections match: {args.text}")
+        return 1
+
+    for result in results:
+        print(f"{result['path']}:{result['start']}-{result['end']}  {result['heading']}  ({result['score']:.2f})")
+        if args.show:
+            print(index.read_section(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
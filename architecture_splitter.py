@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Architecture Document Splitter
+
+This script enforces the 700-line hard limit from architecture-lifecycle.md §4.
+An oversize document is split along its canonical `##` sections into a sub-folder
+of focused sub-docs:
+
+    docs/architecture/auth/oauth.md  →  docs/architecture/auth/oauth/
+                                        ├── index.md            (title, header fields, table)
+                                        ├── 01-purpose.md
+                                        ├── 02-key-principles.md
+                                        └── ...
+
+The source is streamed once and each section is written as soon as it is read, so
+very large documents never have to fit in memory. Relative links inside the moved
+content are rewritten for the extra folder level, in-document `#anchor` links are
+pointed at the sub-doc that now owns the heading, and links from other architecture
+docs to the old file are redirected. The parent index.md is refreshed with the
+architecture index generator.
+"""
+
+import argparse
+import os
+import posixpath
+import re
+import shutil
+import sys
+from pathlib import Path
+
+from architecture_indexer import ArchitectureIndexer, HEADER_FIELD_RE, INDEX_END, INDEX_START
+
+LINE_LIMIT = 700
+LINK_RE = re.compile(r"(\]\()([^)\s]+)((?:\s+\"[^\"]*\")?\))")
+SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
+
+
+def count_lines(path):
+    """Count lines with a raw buffered scan (no decoding)."""
+    lines = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            lines += chunk.count(b"\n")
+    return lines
+
+
+def slugify(text):
+    """Kebab-case file slug for a section heading."""
+    slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    return slug or "section"
+
+
+def heading_anchor(text):
+    """GitHub-style anchor for a heading."""
+    anchor = re.sub(r"[^\w\- ]", "", text.strip().lower())
+    return anchor.replace(" ", "-")
+
+
+def is_relative_link(target):
+    return not (target.startswith(("#", "/")) or SCHEME_RE.match(target))
+
+
+def push_down(target):
+    """Rewrite a relative link target for a file moved one folder deeper."""
+    path, sep, fragment = target.partition("#")
+    moved = posixpath.normpath(posixpath.join("..", path))
+    return moved + sep + fragment
+
+
+class ArchitectureSplitter:
+    def __init__(self, project_root=".", docs_dir="docs/architecture", limit=LINE_LIMIT):
+        self.project_root = Path(project_root).resolve()
+        self.docs_dir = docs_dir
+        self.docs_root = (self.project_root / docs_dir).resolve()
+        self.limit = limit
+
+    def find_oversize(self):
+        """Yield every architecture document above the line limit."""
+        for dirpath, dirnames, filenames in os.walk(self.docs_root):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+            for name in sorted(filenames):
+                if name.endswith(".md") and name != "index.md":
+                    path = Path(dirpath) / name
+                    if count_lines(path) > self.limit:
+                        yield path
+
+    def rewrite_line(self, line, pending):
+        """Rewrite the links of one moved line; in-document anchors are resolved later."""
+        def replace(match):
+            target = match.group(2)
+            if target.startswith("#"):
+                pending.add(target[1:])
+                return match.group(0)
+            if is_relative_link(target):
+                return match.group(1) + push_down(target) + match.group(3)
+            return match.group(0)
+
+        return LINK_RE.sub(replace, line)
+
+    def split(self, source, dry_run=False):
+        """Split one document and return the list of sub-docs written."""
+        source = Path(source).resolve()
+        target_dir = source.with_suffix("")
+        if target_dir.exists():
+            raise FileExistsError(f"Cannot split {source.name}: {target_dir} already exists")
+
+        staging_dir = target_dir.with_name(f".{target_dir.name}.splitting")
+        if staging_dir.exists():
+            shutil.rmtree(staging_dir)
+        staging_dir.mkdir(parents=True)
+
+        title = source.stem
+        preamble = []
+        header_fields = []
+        sections = []  # (file name, heading text, pending anchors)
+        anchors = {}   # anchor → sub-doc file name
+        used_slugs = set()
+        current = None
+        pending = set()
+        in_fence = False
+
+        try:
+            with open(source, "r", encoding="utf-8") as f:
+                for line in f:
+                    stripped = line.strip()
+                    if stripped.startswith("```"):
+                        in_fence = not in_fence
+
+                    if not in_fence and stripped.startswith("## "):
+                        heading = stripped[3:].strip()
+                        if current:
+                            current.close()
+                            sections[-1] = sections[-1][:2] + (pending,)
+                        slug = slugify(heading)
+                        base, n = slug, 2
+                        while slug in used_slugs:
+                            slug, n = f"{base}-{n}", n + 1
+                        used_slugs.add(slug)
+                        file_name = f"{len(sections) + 1:02d}-{slug}.md"
+                        sections.append((file_name, heading, set()))
+                        pending = set()
+                        current = open(staging_dir / file_name, "w", encoding="utf-8")
+                        current.write(self.render_sub_header(title, heading, header_fields))
+                    elif not in_fence and current is None and stripped.startswith("# "):
+                        title = stripped[2:].strip()
+                        preamble.append(line)
+                        continue
+
+                    if current is None:
+                        if HEADER_FIELD_RE.match(stripped):
+                            header_fields.append(self.rewrite_line(line, set()).rstrip("\n"))
+                        preamble.append(self.rewrite_line(line, set()))
+                        continue
+
+                    if not in_fence and stripped.startswith("#"):
+                        anchors.setdefault(heading_anchor(stripped.lstrip("#")), sections[-1][0])
+                    current.write(self.rewrite_line(line, pending))
+
+            if current:
+                current.close()
+                sections[-1] = sections[-1][:2] + (pending,)
+        except BaseException:
+            if current and not current.closed:
+                current.close()
+            shutil.rmtree(staging_dir)
+            raise
+
+        if not sections:
+            shutil.rmtree(staging_dir)
+            raise ValueError(f"Cannot split {source.name}: no `##` sections found")
+
+        # Second touch only for sub-docs that link to anchors owned by other sub-docs
+        for file_name, _, pending_anchors in sections:
+            self.resolve_anchors(staging_dir / file_name, file_name, pending_anchors, anchors)
+
+        with open(staging_dir / "index.md", "w", encoding="utf-8") as f:
+            f.write("".join(preamble).rstrip("\n") + "\n\n")
+            f.write(f"{INDEX_START}\n{INDEX_END}\n")
+
+        if dry_run:
+            shutil.rmtree(staging_dir)
+            return [target_dir / name for name, _, _ in sections]
+
+        os.replace(staging_dir, target_dir)
+        source.unlink()
+        self.redirect_references(source, target_dir, anchors)
+        return [target_dir / name for name, _, _ in sections]
+
+    def render_sub_header(self, title, heading, header_fields):
+        """Canonical header for a sub-doc, inherited from the original document."""
+        lines = [f"# {title} – {heading}", ""]
+        related = "**Related Docs**: [Overview](./index.md)"
+        for field in header_fields:
+            if field.startswith("**Related Docs**"):
+                value = field.split(":", 1)[1].strip()
+                if value:
+                    related += f", {value}"
+            else:
+                lines.append(field)
+        lines.append(related)
+        lines.append("")
+        if heading.lower() != "purpose":
+            lines += ["## Purpose", f"{heading} of {title}, split from the original document.", ""]
+        return "\n".join(lines) + "\n"
+
+    def resolve_anchors(self, path, file_name, pending_anchors, anchors):
+        """Point `#anchor` links at the sub-doc that now contains the heading."""
+        foreign = {a for a in pending_anchors if anchors.get(a) not in (None, file_name)}
+        if not foreign:
+            return
+
+        def replace(match):
+            target = match.group(2)
+            if target.startswith("#") and target[1:] in foreign:
+                return match.group(1) + f"./{anchors[target[1:]]}{target}" + match.group(3)
+            return match.group(0)
+
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(LINK_RE.sub(replace, content))
+
+    def redirect_references(self, source, target_dir, anchors):
+        """Redirect links from other architecture docs to the split document."""
+        old_name = source.name
+        for dirpath, dirnames, filenames in os.walk(self.docs_root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            if Path(dirpath) == target_dir:
+                continue
+            for name in filenames:
+                if not name.endswith(".md"):
+                    continue
+                path = Path(dirpath) / name
+                with open(path, "r", encoding="utf-8", errors="replace") as f:
+                    content = f.read()
+                if old_name not in content:
+                    continue
+
+                def replace(match):
+                    target = match.group(2)
+                    if not is_relative_link(target):
+                        return match.group(0)
+                    link_path, _, fragment = target.partition("#")
+                    resolved = (path.parent / link_path).resolve()
+                    if resolved != source:
+                        return match.group(0)
+                    sub_doc = anchors.get(fragment, "index.md") if fragment else "index.md"
+                    new_target = os.path.relpath(target_dir / sub_doc, path.parent).replace(os.sep, "/")
+                    if not new_target.startswith("../"):
+                        new_target = "./" + new_target
+                    if fragment:
+                        new_target += f"#{fragment}"
+                    return match.group(1) + new_target + match.group(3)
+
+                updated = LINK_RE.sub(replace, content)
+                if updated != content:
+                    with open(path, "w", encoding="utf-8") as f:
+                        f.write(updated)
+
+    def run(self, paths=None, dry_run=False):
+        """Split the given documents, or every oversize document when none are given."""
+        targets = [Path(p).resolve() for p in paths] if paths else list(self.find_oversize())
+        results = {}
+        for target in targets:
+            results[target] = self.split(target, dry_run=dry_run)
+        if results and not dry_run:
+            ArchitectureIndexer(self.project_root, self.docs_dir).run()
+        return results
+
+
+def main():
+    """Main function to run the architecture document splitter."""
+    parser = argparse.ArgumentParser(description="Split architecture docs that exceed the line limit.")
+    parser.add_argument('paths', nargs='*', help="Documents to split (default: every doc over the limit)")
+    parser.add_argument('--root', default=".", help="Project root (default: current directory)")
+    parser.add_argument('--docs', default="docs/architecture", help="Architecture docs directory relative to root")
+    parser.add_argument('--limit', type=int, default=LINE_LIMIT, help=f"Line limit (default: {LINE_LIMIT})")
+    parser.add_argument('--dry-run', action='store_true', help="Show the sub-docs that would be created")
+    args = parser.parse_args()
+
+    splitter = ArchitectureSplitter(args.root, args.docs, args.limit)
+    try:
+        results = splitter.run(args.paths, dry_run=args.dry_run)
+    except (FileExistsError, FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    if not results:
+        print(f"✅ No architecture docs over {args.limit} lines")
+    for source, sub_docs in results.items():
+        print(f"✂️  {source.relative_to(splitter.project_root)} → {len(sub_docs)} sub-docs")
+        for sub_doc in sub_docs:
+            oversize = count_lines(sub_doc) > args.limit if not args.dry_run else False
+            print(f"   - {sub_doc.relative_to(splitter.project_root)}{' ⚠️ still over limit' if oversize else ''}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
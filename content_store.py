@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Shared Content Store
+
+Content-addressed object store for generated IDE outputs. Many targets receive
+byte-identical files (Trae, Void, Zencoder and Gemini CLI all get copies of the
+generic framework docs), so each distinct output is stored once under
+`framework/.store/objects/<sha256[:2]>/<sha256[2:]>` and the IDE paths are
+materialized from it:
+
+- hardlink – the output is another name for the stored object (no extra bytes)
+- reflink  – copy-on-write clone where the filesystem supports it (Linux FICLONE)
+- copy     – plain copy, for targets that allow neither
+
+`auto` tries them in that order. Stored objects are read-only, so a hardlinked
+output cannot be edited in place by accident; an output that already points at
+the right object is left untouched, which makes regeneration nearly free.
+
+Usage:
+    python3 content_store.py stats
+    python3 content_store.py prune
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import stat
+import sys
+import threading
+from pathlib import Path
+
+STORE_DIR = "framework/.store"
+LINK_MODES = ("auto", "hardlink", "reflink", "copy")
+FICLONE = 0x40049409  # Linux ioctl: clone a whole file (Btrfs, XFS, ...)
+
+
+def reflink(source, target):
+    """Create `target` as a copy-on-write clone of `source`; raises OSError if unsupported."""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError("reflinks are not supported on this platform")
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            os.unlink(target)
+            raise
+
+
+class ContentStore:
+    def __init__(self, root=STORE_DIR, mode="auto"):
+        if mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode '{mode}'. Expected one of: {', '.join(LINK_MODES)}")
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.mode = mode
+        self.stats = {"hardlink": 0, "reflink": 0, "copy": 0, "unchanged": 0, "logical_bytes": 0}
+        self.lock = threading.Lock()  # materialize() is called from worker threads by batch rendering
+
+    def count(self, key, amount=1):
+        with self.lock:
+            self.stats[key] += amount
+
+    def object_path(self, digest):
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def put(self, data):
+        """Store bytes once and return the object path."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+            os.chmod(tmp_file, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(tmp_file, path)
+        return path
+
+    def materialize(self, data, target):
+        """Write `data` to `target` through the store. Returns the method used."""
+        target = Path(target)
+        source = self.put(data)
+        self.count("logical_bytes", len(data))
+        try:
+            if os.path.samefile(source, target):
+                self.count("unchanged")
+                return "unchanged"
+        except FileNotFoundError:
+            pass
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists() or target.is_symlink():
+            target.unlink()
+        methods = {"auto": ("hardlink", "reflink", "copy")}.get(self.mode, (self.mode,))
+        for method in methods:
+            try:
+                if method == "hardlink":
+                    os.link(source, target)
+                elif method == "reflink":
+                    reflink(source, target)
+                else:
+                    shutil.copyfile(source, target)
+            except OSError:
+                if method == methods[-1]:
+                    raise
+                continue
+            self.count(method)
+            return method
+
+    def objects(self):
+        if not self.objects_dir.is_dir():
+            return []
+        return [path for path in self.objects_dir.glob("*/*") if not path.name.endswith(".tmp")]
+
+    def usage(self):
+        """Return (object count, stored bytes)."""
+        objects = self.objects()
+        return len(objects), sum(path.stat().st_size for path in objects)
+
+    def prune(self):
+        """Delete objects no output hardlinks to any more. Returns the number removed.
+
+        Only hardlink references are visible to the store, so prune after generating
+        with the `hardlink` (or `auto` on a filesystem that supports links) mode.
+        """
+        removed = 0
+        for path in self.objects():
+            if path.stat().st_nlink <= 1:
+                path.unlink()
+                removed += 1
+        return removed
+
+
+def main():
+    """Main function to inspect or prune the shared content store."""
+    parser = argparse.ArgumentParser(description="Inspect or prune the shared content store.")
+    parser.add_argument('--store', default=STORE_DIR, help=f"Store folder (default: {STORE_DIR})")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('stats', help="Show the number and size of stored objects")
+    subparsers.add_parser('prune', help="Delete objects no longer hardlinked from any output")
+    args = parser.parse_args()
+
+    store = ContentStore(args.store)
+    if args.command == 'prune':
+        print(f"🗑️  Removed {store.prune()} unreferenced object(s)")
+    count, size = store.usage()
+    print(f"📦 {count} object(s), {size:,} bytes in {store.root}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Context Pack Builder
+
+When an agent starts a task, the framework asks it to load the parent INDEX.md
+goals, the task's REQUIREMENTS.md scope, the related `docs/architecture/*/index.md`
+files and the right framework document from the decision matrix in
+user-rules-template.md. This script resolves all of those inputs for one task and
+assembles them into a single, deduplicated, token-budgeted Markdown bundle.
+
+Sections are packed in priority order (task → parent goals → requirements →
+ancestor goals → architecture indexes → framework docs). Sections that do not fit
+the budget are listed at the end with their file and line range so they can be
+loaded on demand.
+
+Bundles are cached per task under `.epic-workflows/cache/context-packs/` and
+rebuilt only when one of their input files changes.
+
+Usage:
+    python3 context_pack.py .epic-workflows/tasks/Initiative_1_auth/Epic_1_oauth/Phase_1_setup/Step_1_install
+    python3 context_pack.py <task path> --budget 4000 --path-only
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from decision_router import DecisionRouter
+from task_hierarchy import (
+    BUSINESS_GOAL,
+    TECHNICAL_GOAL,
+    architecture_refs,
+    find_tasks_root,
+    parse_task_dir_name,
+    read_text,
+    task_ancestors,
+)
+
+DEFAULT_BUDGET = 6000
+CHARS_PER_TOKEN = 4
+PACK_VERSION = 1
+PARENT_SECTIONS = (BUSINESS_GOAL, TECHNICAL_GOAL, "Context")
+MAX_FRAMEWORK_DOCS = 2
+
+
+def estimate_tokens(text):
+    """Rough token estimate used for budgeting (about four characters per token)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def section_blocks(path):
+    """Split a Markdown file at `##` headings into (heading, start line, end line, text) blocks."""
+    blocks = []
+    heading, start, lines = "", 1, []
+    in_fence = False
+    line_no = 0
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line_no, line in enumerate(f, 1):
+            if line.strip().startswith("```"):
+                in_fence = not in_fence
+            if not in_fence and line.startswith("## "):
+                if "".join(lines).strip():
+                    blocks.append((heading, start, line_no - 1, "".join(lines).strip()))
+                heading, start, lines = line[3:].strip(), line_no, []
+            lines.append(line)
+    if "".join(lines).strip():
+        blocks.append((heading, start, line_no, "".join(lines).strip()))
+    return blocks
+
+
+class ContextPackBuilder:
+    def __init__(self, project_root=".", framework_dir=None, budget=DEFAULT_BUDGET, cache_dir=None):
+        self.project_root = Path(project_root).resolve()
+        if framework_dir is None:
+            framework_dir = self.project_root / "framework" / "generic"
+            if not framework_dir.is_dir():
+                framework_dir = Path(__file__).resolve().parent / "framework" / "generic"
+        self.framework_dir = Path(framework_dir).resolve()
+        self.budget = budget
+        if cache_dir is None:
+            cache_dir = self.project_root / ".epic-workflows" / "cache" / "context-packs"
+        self.cache_dir = Path(cache_dir)
+
+    def relative(self, path):
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def route_framework_docs(self, text):
+        """Pick the framework docs for a task with the decision matrix router."""
+        rules_file = self.framework_dir / "user-rules-template.md"
+        if not rules_file.exists():
+            return []
+        router = DecisionRouter.from_rules_file(rules_file)
+        return [self.framework_dir / route["doc"] for route in router.route(text, MAX_FRAMEWORK_DOCS)]
+
+    def resolve_inputs(self, task_dir):
+        """Return the prioritized list of (label, path, heading filter) inputs for a task."""
+        ancestors = task_ancestors(task_dir)
+        inputs = [("Task", task_dir / "INDEX.md", None)]
+        if ancestors:
+            inputs.append(("Parent goals", ancestors[0] / "INDEX.md", PARENT_SECTIONS))
+        inputs.append(("Requirements", task_dir / "REQUIREMENTS.md", None))
+        for ancestor in ancestors[1:]:
+            inputs.append((f"{parse_task_dir_name(ancestor.name)[0]} goals", ancestor / "INDEX.md",
+                           (BUSINESS_GOAL, TECHNICAL_GOAL)))
+
+        # The task path itself is a decision-matrix indicator (`/.epic-workflows/tasks/`)
+        task_text = self.relative(task_dir) + "\n"
+        for name in ("INDEX.md", "REQUIREMENTS.md"):
+            if (task_dir / name).exists():
+                task_text += read_text(task_dir / name) + "\n"
+
+        for ref in architecture_refs(task_text.split("\n", 1)[1]):
+            ref_path = self.project_root / ref
+            folder = ref_path if ref_path.suffix != ".md" else ref_path.parent
+            inputs.append(("Architecture index", folder / "index.md", None))
+
+        for doc in self.route_framework_docs(task_text):
+            inputs.append(("Framework", doc, None))
+        return inputs
+
+    def cache_paths(self, task_dir):
+        key = hashlib.sha1(f"{self.relative(task_dir)}:{self.budget}".encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{key}.md", self.cache_dir / f"{key}.json"
+
+    def input_signatures(self, paths):
+        signatures = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                signatures[self.relative(path)] = [stat.st_mtime_ns, stat.st_size]
+            except FileNotFoundError:
+                signatures[self.relative(path)] = None
+        return signatures
+
+    def is_fresh(self, manifest_file):
+        """True when every input recorded in the manifest is unchanged (including still-missing ones)."""
+        if not manifest_file.exists():
+            return False
+        try:
+            with open(manifest_file, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if manifest.get("version") != PACK_VERSION:
+            return False
+        paths = [self.project_root / p if not os.path.isabs(p) else Path(p) for p in manifest["inputs"]]
+        return self.input_signatures(paths) == manifest["inputs"]
+
+    def build(self, task_dir):
+        """Assemble the bundle text and the list of input paths it depends on."""
+        task_dir = Path(task_dir).resolve()
+        inputs = self.resolve_inputs(task_dir)
+        seen_files = set()
+        seen_blocks = set()
+        included = []
+        omitted = []
+        used = 0
+
+        for label, path, wanted in inputs:
+            key = (path, wanted)
+            if key in seen_files or not path.exists():
+                continue
+            seen_files.add(key)
+            for heading, start, end, text in section_blocks(path):
+                if wanted is not None and heading not in wanted:
+                    continue
+                digest = hashlib.sha1(" ".join(text.split()).encode("utf-8")).digest()
+                if digest in seen_blocks:
+                    continue
+                seen_blocks.add(digest)
+                location = f"{self.relative(path)}:{start}-{end}"
+                cost = estimate_tokens(text)
+                if used + cost > self.budget:
+                    omitted.append((label, location, heading or "(header)", cost))
+                    continue
+                used += cost
+                included.append((label, location, text))
+
+        task_name = task_dir.name
+        lines = [
+            f"# Context Pack: {task_name}",
+            f"<!-- context-pack v{PACK_VERSION}: ~{used} of {self.budget} tokens, "
+            f"{len(included)} sections, {len(omitted)} omitted -->",
+            "",
+        ]
+        for label, location, text in included:
+            lines += [f"<!-- {label}: {location} -->", text, ""]
+        if omitted:
+            lines += ["## Omitted Sections (load on demand)", ""]
+            for label, location, heading, cost in omitted:
+                lines.append(f"- {label}: `{location}` {heading} (~{cost} tokens)")
+            lines.append("")
+
+        # The routing rules decide which framework docs are inputs, so they invalidate the pack too
+        input_paths = [path for _, path, _ in inputs] + [self.framework_dir / "user-rules-template.md"]
+        return "\n".join(lines), input_paths
+
+    def get(self, task_dir, refresh=False):
+        """Return (bundle path, rebuilt flag), rebuilding the cached bundle only when inputs changed."""
+        task_dir = Path(task_dir).resolve()
+        if not (task_dir / "INDEX.md").exists():
+            raise FileNotFoundError(f"No INDEX.md in task folder: {task_dir}")
+
+        bundle_file, manifest_file = self.cache_paths(task_dir)
+        if not refresh and bundle_file.exists() and self.is_fresh(manifest_file):
+            return bundle_file, False
+
+        text, input_paths = self.build(task_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(bundle_file, "w", encoding="utf-8") as f:
+            f.write(text)
+        manifest = {
+            "version": PACK_VERSION,
+            "task": self.relative(task_dir),
+            "budget": self.budget,
+            "inputs": self.input_signatures(input_paths),
+        }
+        with open(manifest_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        return bundle_file, True
+
+
+def main():
+    """Main function to run the context pack builder."""
+    parser = argparse.ArgumentParser(description="Build a token-budgeted context bundle for one task.")
+    parser.add_argument('task', help="Task folder (e.g. .epic-workflows/tasks/Initiative_1_x/Epic_1_y)")
+    parser.add_argument('--root', default=None, help="Project root (default: detected from the task path)")
+    parser.add_argument('--framework-dir', default=None, help="Folder with the generic framework docs")
+    parser.add_argument('--budget', type=int, default=DEFAULT_BUDGET, help=f"Token budget (default: {DEFAULT_BUDGET})")
+    parser.add_argument('--refresh', action='store_true', help="Rebuild even if the cached bundle is fresh")
+    parser.add_argument('--path-only', action='store_true', help="Print the bundle path instead of its content")
+    args = parser.parse_args()
+
+    root = args.root
+    if root is None:
+        tasks_root = find_tasks_root(args.task)
+        root = tasks_root.parent.parent if tasks_root else "."
+
+    builder = ContextPackBuilder(root, args.framework_dir, args.budget)
+    try:
+        bundle_file, rebuilt = builder.get(args.task, refresh=args.refresh)
+    except FileNotFoundError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    print(f"{'✅ Built' if rebuilt else '♻️  Cached'} context pack: {builder.relative(bundle_file)}", file=sys.stderr)
+    if args.path_only:
+        print(bundle_file)
+    else:
+        print(read_text(bundle_file))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,13 +18,34 @@ Supported IDEs:
 - Void IDE (JSON configuration)
 - Zencoder (multiple formats)
 - Gemini CLI (GEMINI.md system prompt)
+
+Rendering is side-effect free: `IDEAdaptationGenerator().generate("cursor-specific")`
+returns the adaptation as {path inside the IDE folder: bytes} without touching the
+filesystem. The CLI, the shared content store and the bundle command are writers
+on top of that API.
+
+The fixed text of each adaptation lives in `framework/templates/`, compiled once
+into prebuilt byte segments (see adaptation_templates.py).
 """
 
 import os
 import shutil
+import sys
 import re
 from pathlib import Path
 import argparse
+import json
+
+from adaptation_audit import AUDIT_REPORT, AdaptationAuditor
+from adaptation_bundle import BUNDLE_FORMATS, DEFAULT_FORMAT, write_bundles
+from adaptation_server import DEFAULT_HOST, DEFAULT_PORT, make_server
+from adaptation_templates import TemplateLibrary
+from adaptation_variants import load_variants, render_variants
+from content_store import LINK_MODES, ContentStore
+from decision_router import parse_decision_matrix
+from framework_overlays import OverlayError, OverlayStack
+from ignore_files import RepoSurvey, render_ignore_file
+from prompt_layout import DEFAULT_LAYOUT, LAYOUTS, format_report, prefix_report, shared_core
 
 class IDEAdaptationGenerator:
     def __init__(self):
@@ -32,21 +53,46 @@ class IDEAdaptationGenerator:
         self.generic_dir = self.base_dir / "framework" / "generic"
         self.framework_dir = self.base_dir / "framework"
         
-        # IDE-specific directories and file extensions (updated based on latest documentation)
+        # Fixed text of the adaptations, compiled once from framework/templates/
+        self.templates = TemplateLibrary(self.framework_dir / "templates",
+                                         self.framework_dir / ".cache" / "templates.json")
+        
+        # Optional ContentStore: identical outputs are stored once and linked into place
+        self.content_store = None
+        
+        # Ignore rules from a scan of the target repository (see ignore_files.py); None keeps the
+        # default .rooignore template
+        self.ignore_rules = None
+        
+        # "standard", or "cache" to open every prompt file with the shared core (see prompt_layout.py)
+        self.layout = DEFAULT_LAYOUT
+        
+        # Rendering state of the current generate() call
+        self.outputs = {}
+        self.messages = []
+        self.prompt_files = []
+        self.output_dir = self.framework_dir
+        
+        # IDE-specific directories and file extensions (updated based on latest documentation);
+        # "entry" is the rules file the IDE always loads, where batch variants add their project context;
+        # "router_docs" maps generic docs to the file that carries them when the IDE does not ship them as-is
         self.ide_configs = {
             "cursor-specific": {
                 "ext": ".mdc",
+                "entry": "user-rules-template.mdc",
                 "files": [
                     "user-rules-template.mdc",
                     "epic-workflow-instructions.mdc",
                     "problem-solving-framework.mdc",
                     "architecture-design-process.mdc",
                     "architecture-lifecycle.mdc",
-                    "general-execution-standards.mdc"
+                    "general-execution-standards.mdc",
+                    "decision-router.json"
                 ]
             },
             "windsurf-specific": {
                 "ext": ".windsurfrules",
+                "entry": ".windsurfrules",
                 "files": [
                     "user-rules-template.windsurfrules",
                     "epic-workflow-instructions.windsurfrules",
@@ -58,12 +104,14 @@ class IDEAdaptationGenerator:
             },
             "github-copilot-specific": {
                 "ext": ".md",
+                "entry": "copilot-instructions.md",
                 "files": [
                     "copilot-instructions.md"
                 ]
             },
             "roo-code-specific": {
                 "ext": ".md",
+                "entry": ".roo/rules/ai-epic-framework.md",
                 "files": [
                     ".roo/rules/ai-epic-framework.md",
                     ".roo/rules-code/ai-epic-framework.md",
@@ -72,17 +120,27 @@ class IDEAdaptationGenerator:
             },
             "cline-specific": {
                 "ext": ".md",
+                "entry": ".clinerules/01-framework-overview.md",
                 "files": [
                     ".clinerules/ai-epic-framework.md",
                     ".clinerules/01-framework-overview.md",
                     ".clinerules/02-epic-workflow.md",
                     ".clinerules/03-problem-solving.md",
                     ".clinerules/04-architecture-design.md",
-                    ".clinerules/05-execution-standards.md"
-                ]
+                    ".clinerules/05-execution-standards.md",
+                    "decision-router.json"
+                ],
+                "router_docs": {
+                    "epic-workflow-instructions.md": ".clinerules/02-epic-workflow.md",
+                    "problem-solving-framework.md": ".clinerules/03-problem-solving.md",
+                    "architecture-design-process.md": ".clinerules/04-architecture-design.md",
+                    "architecture-lifecycle.md": ".clinerules/04-architecture-design.md",
+                    "general-execution-standards.md": ".clinerules/05-execution-standards.md"
+                }
             },
             "claude-code-specific": {
                 "ext": ".md",
+                "entry": "framework-prompt.md",
                 "files": [
                     "framework-prompt.md",
                     "claude-config.json"
@@ -90,55 +148,91 @@ class IDEAdaptationGenerator:
             },
             "trae-specific": {
                 "ext": ".yaml",
+                "entry": "framework-context.md",
                 "files": [
                     "trae-config.yaml",
-                    "framework-context.md"
+                    "framework-context.md",
+                    "decision-router.json"
                 ]
             },
             "kilo-code-specific": {
                 "ext": ".md",
+                "entry": ".kilocode/rules/01-framework-overview.md",
                 "files": [
                     ".kilocode/rules/ai-epic-framework.md",
                     ".kilocode/rules/01-framework-overview.md",
                     ".kilocode/rules/02-epic-workflow.md",
                     ".kilocode/rules/03-problem-solving.md",
                     ".kilocode/rules/04-architecture-design.md",
-                    ".kilocode/rules/05-execution-standards.md"
-                ]
+                    ".kilocode/rules/05-execution-standards.md",
+                    "decision-router.json"
+                ],
+                "router_docs": {
+                    "epic-workflow-instructions.md": ".kilocode/rules/02-epic-workflow.md",
+                    "problem-solving-framework.md": ".kilocode/rules/03-problem-solving.md",
+                    "architecture-design-process.md": ".kilocode/rules/04-architecture-design.md",
+                    "architecture-lifecycle.md": ".kilocode/rules/04-architecture-design.md",
+                    "general-execution-standards.md": ".kilocode/rules/05-execution-standards.md"
+                }
             },
             "void-specific": {
                 "ext": ".json",
+                "entry": "framework-system-prompt.md",
                 "files": [
                     "void-config.json",
                     "framework-system-prompt.md",
-                    "privacy-rules.json"
+                    "privacy-rules.json",
+                    "decision-router.json"
                 ]
             },
             "zencoder-specific": {
                 "ext": ".rules",
+                "entry": "framework-rules.rules",
                 "files": [
                     "framework-rules.rules",
                     "enterprise-config.json",
                     "cursor-compatibility.cursorrules",
                     "cline-compatibility.clinerules",
                     "windsurf-compatibility.windsurfrules",
-                    "copilot-compatibility.md"
+                    "copilot-compatibility.md",
+                    "decision-router.json"
                 ]
             },
             "gemini-cli-specific": {
                 "ext": ".md",
+                "entry": "GEMINI.md",
                 "files": [
                     "GEMINI.md",
                     "gemini-config.json",
-                    "google-cloud-integration.json"
+                    "google-cloud-integration.json",
+                    "decision-router.json"
                 ]
             }
         }
+        
+        # Cursor rule type per generic file: "always", "auto" (attached by globs),
+        # "agent" (loaded on request from the description) or "manual" (@-mention only)
+        self.cursor_rule_meta = {
+            "user-rules-template.md": {"type": "always"},
+            "epic-workflow-instructions.md": {"type": "auto", "globs": [".epic-workflows/**"]},
+            "problem-solving-framework.md": {"type": "auto", "globs": [".epic-workflows/rules/tmp/**"]},
+            "architecture-design-process.md": {"type": "agent"},
+            "architecture-lifecycle.md": {"type": "auto", "globs": ["docs/architecture/**"]},
+            "general-execution-standards.md": {"type": "agent"}
+        }
 
     def create_ide_directories(self):
-        """Create IDE-specific directories if they don't exist and clear them before use."""
+        """Create IDE-specific directories if they don't exist and clear them before use.
+
+        With the shared content store the directories are kept: outputs that already link to
+        the right object stay untouched and write_outputs() removes only stale files.
+        """
         for ide_dir in self.ide_configs.keys():
             ide_path = self.framework_dir / ide_dir
+            if self.content_store is not None:
+                ide_path.mkdir(exist_ok=True)
+                print(f"✅ Verified directory: {ide_dir}")
+                continue
             if ide_path.exists():
                 # Remove all files in the directory
                 for item in ide_path.iterdir():
@@ -152,6 +246,16 @@ class IDEAdaptationGenerator:
 
     def copy_generic_files(self):
         """Copy generic framework files to IDE-specific directories with appropriate extensions."""
+        for ide_name in self.ide_configs:
+            outputs = self.generate(ide_name)
+            self.write_outputs(ide_name, outputs)
+            for message in self.messages:
+                print(message)
+        # Only the writing CLI run persists compiled templates; generate() stays side-effect free
+        self.templates.save_cache()
+
+    def create_ide_files(self, ide_name):
+        """Create the files of one IDE adaptation."""
         generic_files = [
             "user-rules-template.md",
             "epic-workflow-instructions.md",
@@ -161,50 +265,93 @@ class IDEAdaptationGenerator:
             "general-execution-standards.md"
         ]
 
-        for ide_name, config in self.ide_configs.items():
-            ide_dir = self.framework_dir / ide_name
-            
-            # Handle special cases first
-            if ide_name == "github-copilot-specific":
-                self.create_copilot_instructions(ide_dir)
-                continue
-            elif ide_name == "roo-code-specific":
-                self.create_roo_code_files(ide_dir)
-                continue
-            elif ide_name == "cline-specific":
-                self.create_cline_files(ide_dir)
-                continue
-            elif ide_name == "windsurf-specific":
-                self.create_windsurf_files(ide_dir)
-                continue
-            elif ide_name == "claude-code-specific":
-                self.create_claude_code_files(ide_dir)
-                continue
-            elif ide_name == "trae-specific":
-                self.create_trae_files(ide_dir)
-                continue
-            elif ide_name == "kilo-code-specific":
-                self.create_kilo_code_files(ide_dir)
-                continue
-            elif ide_name == "void-specific":
-                self.create_void_files(ide_dir)
-                continue
-            elif ide_name == "zencoder-specific":
-                self.create_zencoder_files(ide_dir)
-                continue
-            elif ide_name == "gemini-cli-specific":
-                self.create_gemini_files(ide_dir)
-                continue
+        ide_dir = self.framework_dir / ide_name
+        
+        # Handle special cases first
+        if ide_name == "github-copilot-specific":
+            self.create_copilot_instructions(ide_dir)
+            return
+        elif ide_name == "roo-code-specific":
+            self.create_roo_code_files(ide_dir)
+            return
+        elif ide_name == "cline-specific":
+            self.create_cline_files(ide_dir)
+            return
+        elif ide_name == "windsurf-specific":
+            self.create_windsurf_files(ide_dir)
+            return
+        elif ide_name == "claude-code-specific":
+            self.create_claude_code_files(ide_dir)
+            return
+        elif ide_name == "trae-specific":
+            self.create_trae_files(ide_dir)
+            return
+        elif ide_name == "kilo-code-specific":
+            self.create_kilo_code_files(ide_dir)
+            return
+        elif ide_name == "void-specific":
+            self.create_void_files(ide_dir)
+            return
+        elif ide_name == "zencoder-specific":
+            self.create_zencoder_files(ide_dir)
+            return
+        elif ide_name == "gemini-cli-specific":
+            self.create_gemini_files(ide_dir)
+            return
 
-            # Standard file copying for Cursor AI
-            if ide_name == "cursor-specific":
-                for generic_file in generic_files:
-                    source_file = self.generic_dir / generic_file
-                    target_file = ide_dir / generic_file.replace(".md", ".mdc")
-                    
-                    if source_file.exists():
-                        self.create_cursor_file_with_meta(source_file, target_file, generic_file)
-                        print(f"✅ Copied {generic_file} → {target_file.name}")
+        # Standard file copying for Cursor AI
+        if ide_name == "cursor-specific":
+            for generic_file in generic_files:
+                source_file = self.generic_dir / generic_file
+                target_file = ide_dir / generic_file.replace(".md", ".mdc")
+                
+                if source_file.exists():
+                    self.create_cursor_file_with_meta(source_file, target_file, generic_file)
+                    self.log(f"✅ Copied {generic_file} → {target_file.name}")
+
+    def generate(self, ide_name):
+        """Render one IDE adaptation into memory: {path inside the IDE folder: bytes}.
+
+        Only the generic framework files are read; nothing is written to disk.
+        Progress messages of the last call are kept in `self.messages`.
+        """
+        if ide_name not in self.ide_configs:
+            raise ValueError(f"Unknown IDE adaptation: {ide_name}")
+        self.outputs, self.messages, self.prompt_files = {}, [], []
+        self.output_dir = self.framework_dir / ide_name
+        self.create_ide_files(ide_name)
+        # IDEs that ship the routed docs also get the decision matrix as a precompiled router table
+        if "decision-router.json" in self.ide_configs[ide_name]["files"]:
+            self.create_router_table(self.output_dir, ide_name)
+        return self.outputs
+
+    def generate_all(self):
+        """Render every configured IDE adaptation: {IDE name: {path: bytes}}."""
+        return {ide_name: self.generate(ide_name) for ide_name in self.ide_configs}
+
+    def write_outputs(self, ide_name, outputs):
+        """Write rendered outputs into framework/<ide>/, through the shared content store when enabled."""
+        ide_dir = self.framework_dir / ide_name
+        if ide_dir.is_dir():
+            # Remove files a previous run left behind (the directory is not cleared with the content store)
+            for root, dirs, files in os.walk(ide_dir, topdown=False):
+                for name in files:
+                    path = Path(root) / name
+                    if path.relative_to(ide_dir).as_posix() not in outputs:
+                        path.unlink()
+                if Path(root) != ide_dir and not os.listdir(root):
+                    os.rmdir(root)
+        for relative_path, data in sorted(outputs.items()):
+            path = ide_dir / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if self.content_store is not None:
+                self.content_store.materialize(data, path)
+                continue
+            # A --shared-store run may have left a hardlink into the store here: replace it, never write through it
+            if path.exists() or path.is_symlink():
+                path.unlink()
+            with open(path, "wb") as f:
+                f.write(data)
 
     def create_cursor_file_with_meta(self, source_file, target_file, generic_file):
         """Create Cursor AI file with meta headers at the top."""
@@ -225,21 +372,32 @@ class IDEAdaptationGenerator:
         # Fix relative paths for Cursor AI context
         content = self.fix_relative_paths_for_ide(content, "cursor-specific")
         
-        # Create the meta header
+        # Create the meta header from the rule type (manual rules carry no description or globs)
         description = when_to_use_descriptions.get(generic_file, "AI Epic Framework component")
+        rule_meta = self.cursor_rule_meta.get(generic_file, {"type": "agent"})
+        rule_type = rule_meta["type"]
+        if rule_type not in ("always", "auto", "agent", "manual"):
+            raise ValueError(f"Unknown Cursor rule type '{rule_type}' for {generic_file}")
+        globs = ",".join(rule_meta.get("globs", [])) if rule_type == "auto" else ""
         meta_header = f"""---
-description: {description}
-alwaysApply: false
+description: {description if rule_type != "manual" else ""}
+globs: {globs}
+alwaysApply: {"true" if rule_type == "always" else "false"}
 ---
 
 """
         
         # Combine meta header with content
         new_content = meta_header + content
+        if generic_file == "user-rules-template.md":
+            if self.layout == "cache":
+                # The core keeps the generic .md links; the notes after it map them to .mdc rules
+                new_content = (meta_header.encode("utf-8") + self.prompt_core() + b"\n"
+                               + self.render_template("cursor-specific/shared-core-notes.mdc"))
+            self.prompt_files.append(Path(target_file).relative_to(self.output_dir).as_posix())
         
         # Write to target file
-        with open(target_file, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        self.add_output(target_file, new_content)
 
     def fix_relative_paths_for_ide(self, content, ide_name):
         """Fix relative paths in framework content for specific IDE context."""
@@ -260,16 +418,73 @@ alwaysApply: false
         
         return content
 
+    def add_output(self, path, content):
+        """Record one rendered file (text or bytes) of the IDE adaptation being generated."""
+        data = content if isinstance(content, bytes) else content.encode("utf-8")
+        self.outputs[Path(path).relative_to(self.output_dir).as_posix()] = data
+
+    def render_template(self, name, **values):
+        """Render framework/templates/<name> with the given placeholder values."""
+        return self.templates.render(name, **values)
+
+    def prompt_core(self):
+        """The versioned shared core that opens every prompt file in the cache layout."""
+        with open(self.generic_dir / "user-rules-template.md", 'r', encoding='utf-8') as f:
+            return shared_core(f.read())
+
+    def add_prompt_output(self, path, template_name, **values):
+        """Record an IDE prompt file; the cache layout puts the shared core before the IDE-specific text."""
+        if self.layout == "cache":
+            content = self.prompt_core() + b"\n" + self.templates.render(template_name, omit=("user_rules",), **values)
+        else:
+            content = self.render_template(template_name, **values)
+        self.add_output(path, content)
+        self.prompt_files.append(Path(path).relative_to(self.output_dir).as_posix())
+
+    def log(self, message):
+        """Record a progress message; the CLI prints them after writing the outputs."""
+        self.messages.append(message)
+
+    def create_router_table(self, ide_dir, ide_name):
+        """Emit the user-rules decision matrix as a router table for decision_router.py.
+
+        Every routed doc is mapped to the file this IDE ships; a route to a file missing from
+        the outputs is a generator bug and raises ValueError.
+        """
+        user_rules_file = self.generic_dir / "user-rules-template.md"
+        with open(user_rules_file, 'r', encoding='utf-8') as f:
+            table = parse_decision_matrix(f.read())
+        
+        # Point the table at this IDE's file names (e.g. .mdc for Cursor AI, .clinerules/0N-*.md for Cline)
+        router_docs = self.ide_configs[ide_name].get("router_docs", {})
+        def ide_doc_name(doc):
+            return router_docs.get(doc) or self.fix_relative_paths_for_ide(f"./{doc}", ide_name)[2:]
+        
+        table["default"] = ide_doc_name(table["default"])
+        for route in table["routes"]:
+            route["doc"] = ide_doc_name(route["doc"])
+            related = []
+            for doc in map(ide_doc_name, route["related"]):
+                if doc != route["doc"] and doc not in related:
+                    related.append(doc)
+            route["related"] = related
+        
+        routed = {table["default"]}
+        for route in table["routes"]:
+            routed.update([route["doc"]] + route["related"])
+        missing = sorted(routed - set(self.outputs))
+        if missing:
+            raise ValueError(f"{ide_name}: decision-router.json routes to files that are not generated: {', '.join(missing)}")
+        
+        self.add_output(ide_dir / "decision-router.json", json.dumps(table, indent=2))
+
     def create_roo_code_files(self, ide_dir):
         """Create Roo Code specific files using latest directory-based approach."""
-        # Create .roo directory structure
+        # .roo directory structure
         roo_dir = ide_dir / ".roo"
         roo_rules_dir = roo_dir / "rules"
         roo_rules_code_dir = roo_dir / "rules-code"
         
-        roo_rules_dir.mkdir(parents=True, exist_ok=True)
-        roo_rules_code_dir.mkdir(parents=True, exist_ok=True)
-        
         # Read the full user-rules-template content for the custom instructions
         user_rules_file = self.generic_dir / "user-rules-template.md"
         with open(user_rules_file, 'r', encoding='utf-8') as f:
@@ -278,146 +493,24 @@ alwaysApply: false
         # Fix relative paths for Roo Code context
         user_rules_content = self.fix_relative_paths_for_ide(user_rules_content, "roo-code-specific")
         
-        # Create main framework rules file (applies to all modes)
-        framework_rules = f"""# AI Epic Framework - Roo Code Rules
-
-## Framework Overview
-This project uses the AI Epic Framework for systematic complex application development.
-
-{user_rules_content}
-
-## Roo Code Integration
-- **Directory-Based Rules**: Framework rules stored in `.roo/rules/` directory
-- **Mode-Specific Rules**: Code-specific rules in `.roo/rules-code/` directory
-- **File Filtering**: Use `.rooignore` to control AI context inclusion
-- **Intelligent Context**: Framework optimizes file inclusion for better AI assistance
-
-## Framework Components
-- **Epic Workflow**: Hierarchical task breakdown (Initiative → Epic → Phase → Step)
-- **Problem Solving**: Systematic troubleshooting methodology
-- **Architecture Design**: Guided architectural decision-making
-- **Execution Standards**: Quality assurance and best practices
-
-## Usage Guidelines
-1. Use epic workflow for project breakdown and task organization
-2. Apply problem-solving framework for complex technical issues
-3. Use architecture design process for system planning and decisions
-4. Follow execution standards for research and validation
-
-## File Organization
-- Framework files: `framework/` directory
-- Documentation: `docs/` directory with comprehensive guides
-- Task structure: `/.epic-workflows/tasks/` for hierarchical task management
-- Architecture docs: `docs/architecture/` for system design documentation
-"""
-        
-        # Create code-specific rules file
-        code_rules = """# AI Epic Framework - Code Mode Rules
-
-## Code Development Guidelines
-When working in Code mode, follow these framework-specific guidelines:
-
-## Epic Workflow Integration
-- Create task hierarchies in `/.epic-workflows/tasks/`
-- Use INDEX.md and REQUIREMENTS.md for each task
-- Follow Plan → Document → Execute → Track → Validate sequence
-
-## Problem Solving Framework
-- Apply after 3+ failed solution attempts
-- Use systematic research-driven approach
-- Create temporary files for investigation
-- Follow Research → Decompose → Execute → Validate → Cleanup
-
-## Architecture Design Process
-- Start with requirements and constraints
-- Research patterns and technologies
-- Design components with clear boundaries
-- Plan for scalability, performance, security
-- Document decisions and trade-offs
-
-## Execution Standards
-- Research-first approach
-- Multi-source validation
-- Quality over speed
-- Comprehensive documentation
-- Architecture compliance
-
-## Code Quality Attributes
-- Scalability: Stateless services, autoscaling
-- Performance: Caching, async I/O
-- Security: Zero-trust, encryption
-- Reliability: Circuit breakers, health probes
-- Observability: Structured logs, metrics
-"""
-        
-        # .rooignore for file filtering
-        rooignore_content = """# Roo Code File Filtering Configuration
-# This file controls which files Roo Code includes in AI context
-
-# Include framework documentation
-docs/
-framework/
-*.md
-*.mdx
-
-# Include source code
-src/
-lib/
-app/
-components/
-pages/
-utils/
-hooks/
-services/
-
-# Include configuration files
-package.json
-tsconfig.json
-next.config.js
-tailwind.config.js
-.eslintrc.js
-.prettierrc
-
-# Include test files
-__tests__/
-*.test.js
-*.test.ts
-*.spec.js
-*.spec.ts
-
-# Exclude build artifacts
-node_modules/
-.next/
-dist/
-build/
-coverage/
-.env.local
-.env.production
-
-# Exclude temporary files
-*.log
-*.tmp
-.DS_Store
-Thumbs.db
-"""
-        
         # Write files to appropriate directories
-        with open(roo_rules_dir / "ai-epic-framework.md", "w") as f:
-            f.write(framework_rules)
+        self.add_prompt_output(roo_rules_dir / "ai-epic-framework.md", "roo-code-specific/.roo/rules/ai-epic-framework.md",
+                               user_rules=user_rules_content)
         
-        with open(roo_rules_code_dir / "ai-epic-framework.md", "w") as f:
-            f.write(code_rules)
+        self.add_output(roo_rules_code_dir / "ai-epic-framework.md",
+                        self.render_template("roo-code-specific/.roo/rules-code/ai-epic-framework.md"))
         
-        with open(ide_dir / ".rooignore", "w") as f:
-            f.write(rooignore_content)
+        if self.ignore_rules is not None:
+            self.add_output(ide_dir / ".rooignore", render_ignore_file(self.ignore_rules, "roo-code"))
+        else:
+            self.add_output(ide_dir / ".rooignore", self.render_template("roo-code-specific/.rooignore"))
         
-        print(f"✅ Created Roo Code configuration files with directory-based structure")
+        self.log(f"✅ Created Roo Code configuration files with directory-based structure")
 
     def create_cline_files(self, ide_dir):
         """Create Cline specific files using latest folder-based approach."""
-        # Create .clinerules directory structure
+        # .clinerules directory structure
         clinerules_dir = ide_dir / ".clinerules"
-        clinerules_dir.mkdir(parents=True, exist_ok=True)
         
         # Read the full user-rules-template content for the custom instructions
         user_rules_file = self.generic_dir / "user-rules-template.md"
@@ -427,162 +520,21 @@ Thumbs.db
         # Fix relative paths for Cline context
         user_rules_content = self.fix_relative_paths_for_ide(user_rules_content, "cline-specific")
         
-        # Create main framework overview file
-        framework_overview = f"""# AI Epic Framework - Cline Rules
-
-## Framework Overview
-This project uses the AI Epic Framework for systematic complex application development.
-
-{user_rules_content}
-
-## Cline Integration
-- **Folder-Based Rules**: Framework rules stored in `.clinerules/` directory
-- **MCP Integration**: Leverage Cline's MCP capabilities for enhanced AI assistance
-- **VS Code Compatibility**: Seamless integration with VS Code ecosystem
-- **Team Collaboration**: Maintain framework documentation for team coordination
-
-## Framework Components
-- **Epic Workflow**: Hierarchical task breakdown (Initiative → Epic → Phase → Step)
-- **Problem Solving**: Systematic troubleshooting methodology
-- **Architecture Design**: Guided architectural decision-making
-- **Execution Standards**: Quality assurance and best practices
-
-## Usage Guidelines
-1. Use epic workflow for project breakdown and task organization
-2. Apply problem-solving framework for complex technical issues
-3. Use architecture design process for system planning and decisions
-4. Follow execution standards for research and validation
-
-## File Organization
-- Framework files: `framework/` directory
-- Documentation: `docs/` directory with comprehensive guides
-- Task structure: `/.epic-workflows/tasks/` for hierarchical task management
-- Architecture docs: `docs/architecture/` for system design documentation
-"""
-        
-        # Create epic workflow rules
-        epic_workflow = """# Epic Workflow Rules
-
-## Task Breakdown
-- Use epic workflow for task breakdown (Initiative → Epic → Phase → Step)
-- Create task hierarchy in `/.epic-workflows/tasks/`
-- Use INDEX.md and REQUIREMENTS.md for each task
-- Follow Plan → Document → Execute → Track → Validate sequence
-
-## File Management
-- Maintain architecture docs in `docs/architecture/`
-- Use INDEX.md and REQUIREMENTS.md for each task
-- Create task hierarchies with clear naming conventions
-- Track progress and completion status
-
-## Workflow Integration
-- Integrate with existing project management tools
-- Maintain consistency across team members
-- Update task status regularly
-- Document decisions and trade-offs
-"""
-        
-        # Create problem solving rules
-        problem_solving = """# Problem Solving Framework Rules
-
-## When to Apply
-- Apply problem-solving framework after 3+ failed attempts
-- Use for multi-component system failures
-- Apply for complex technical issues
-- Use when explicitly requested
-
-## Research Protocol
-- Consult official documentation first
-- Use Context7 and Perplexity for research
-- Cross-check from multiple sources
-- Document decisions and trade-offs
-
-## Systematic Approach
-- Follow Research → Decompose → Execute → Validate → Cleanup
-- Create temporary files for investigation
-- Use systematic research-driven approach
-- Validate solutions thoroughly
-
-## Quality Standards
-- Plan thoroughly, implement incrementally
-- Validate after each milestone
-- Update architecture docs for significant changes
-- Maintain comprehensive documentation
-"""
-        
-        # Create architecture design rules
-        architecture_design = """# Architecture Design Process Rules
-
-## Design Methodology
-- Use architecture design process for system design
-- Start with requirements and constraints
-- Research patterns and technologies
-- Design components with clear boundaries
-
-## Quality Attributes
-- Plan for scalability, performance, security
-- Consider reliability and observability
-- Document decisions and trade-offs
-- Validate architectural decisions
-
-## Integration Patterns
-- Use REST + OpenAPI for API design
-- Consider event-driven patterns with Kafka/NATS
-- Implement microservices with gRPC
-- Plan for service mesh (Istio, Linkerd)
-
-## Documentation
-- Maintain architecture docs in `docs/architecture/`
-- Create architecture decision records (ADRs)
-- Document component boundaries and interfaces
-- Keep architecture docs up to date
-"""
-        
-        # Create execution standards rules
-        execution_standards = """# Execution Standards Rules
-
-## Quality Assurance
-- Follow execution standards for quality assurance
-- Research-first approach for all decisions
-- Multi-source validation for information
-- Quality over speed in all implementations
-
-## Development Process
-- Plan thoroughly before implementation
-- Implement incrementally with validation
-- Update documentation for all changes
-- Maintain comprehensive project documentation
-
-## Team Coordination
-- Ensure consistency across team members
-- Use framework standards for all projects
-- Maintain framework documentation
-- Coordinate framework updates across team
-
-## Best Practices
-- Follow established coding standards
-- Use version control effectively
-- Implement proper testing strategies
-- Maintain security best practices
-"""
-        
         # Write files to .clinerules directory
-        with open(clinerules_dir / "01-framework-overview.md", "w") as f:
-            f.write(framework_overview)
+        self.add_prompt_output(clinerules_dir / "01-framework-overview.md", "cline-specific/.clinerules/01-framework-overview.md",
+                               user_rules=user_rules_content)
         
-        with open(clinerules_dir / "02-epic-workflow.md", "w") as f:
-            f.write(epic_workflow)
+        self.add_output(clinerules_dir / "02-epic-workflow.md", self.render_template("shared/02-epic-workflow.md"))
         
-        with open(clinerules_dir / "03-problem-solving.md", "w") as f:
-            f.write(problem_solving)
+        self.add_output(clinerules_dir / "03-problem-solving.md", self.render_template("shared/03-problem-solving.md"))
         
-        with open(clinerules_dir / "04-architecture-design.md", "w") as f:
-            f.write(architecture_design)
+        self.add_output(clinerules_dir / "04-architecture-design.md",
+                        self.render_template("shared/04-architecture-design.md"))
         
-        with open(clinerules_dir / "05-execution-standards.md", "w") as f:
-            f.write(execution_standards)
+        self.add_output(clinerules_dir / "05-execution-standards.md",
+                        self.render_template("shared/05-execution-standards.md"))
         
-        print(f"✅ Created Cline configuration files with folder-based structure")
+        self.log(f"✅ Created Cline configuration files with folder-based structure")
 
     def create_windsurf_files(self, ide_dir):
         """Create Windsurf specific files - .windsurfrules with character limits."""
@@ -594,99 +546,15 @@ This project uses the AI Epic Framework for systematic complex application devel
         # Fix relative paths for Windsurf context
         user_rules_content = self.fix_relative_paths_for_ide(user_rules_content, "windsurf-specific")
         
-        # Windsurf has 6K character limit, so we need concise versions
-        windsurf_rules = """# AI Epic Framework - Windsurf Rules
-
-## Core Framework
-Use AI Epic Framework for systematic complex application development.
-
-## Epic Workflow
-- Break down projects: Initiative → Epic → Phase → Step
-- Create task hierarchy in /.epic-workflows/tasks/
-- Use INDEX.md and REQUIREMENTS.md for each task
-- Follow Plan → Document → Execute → Track → Validate sequence
-
-## Problem Solving
-- Apply after 3+ failed attempts
-- Use systematic research-driven approach
-- Create temporary files for investigation
-- Follow Research → Decompose → Execute → Validate → Cleanup
-
-## Architecture Design
-- Start with requirements and constraints
-- Research patterns and technologies
-- Design components with clear boundaries
-- Plan for scalability, performance, security
-- Document decisions and trade-offs
-
-## Execution Standards
-- Research-first approach
-- Multi-source validation
-- Quality over speed
-- Comprehensive documentation
-- Architecture compliance
-
-## File Organization
-- Framework files in framework/
-- Documentation in docs/
-- Architecture docs in docs/architecture/
-- Task files in /.epic-workflows/tasks/
-
-## Quality Attributes
-- Scalability: Stateless services, autoscaling
-- Performance: Caching, async I/O
-- Security: Zero-trust, encryption
-- Reliability: Circuit breakers, health probes
-- Observability: Structured logs, metrics
-
-## Integration Patterns
-- REST + OpenAPI
-- Event-driven with Kafka/NATS
-- Microservices with gRPC
-- Service mesh (Istio, Linkerd)
-
-## Success Metrics
-- Problem fully resolved and validated
-- Knowledge preserved in documentation
-- Process improvements captured
-- Architecture docs updated
-- Task completion tracked
-"""
-        
-        # Custom instructions for Windsurf with full framework content
-        custom_instructions = f"""# AI Epic Framework - Windsurf Instructions
-
-## Windsurf AI Integration
-Windsurf AI provides intelligent coding assistance with the AI Epic Framework.
-
-{user_rules_content}
-
-## Windsurf Specific Features
-- **Character Limit Optimization**: Framework rules optimized for 6K character limit
-- **Essential Patterns**: Focus on core framework patterns and workflows
-- **Reference Documentation**: Access detailed docs through relative paths
-- **Efficient Context**: Optimized for Windsurf's context window
-
-## Usage Guidelines
-1. Use epic workflow for project breakdown
-2. Apply problem-solving framework for debugging
-3. Use architecture design process for system planning
-4. Follow execution standards for quality
-
-## Configuration
-See `.windsurfrules` for framework rules configuration.
-"""
-        
         # Windsurf uses .windsurfrules for framework content (6K limit) and custom-instructions.md for details
         # No need to copy separate framework files - everything goes in the main files
         
-        with open(ide_dir / ".windsurfrules", "w") as f:
-            f.write(windsurf_rules)
+        self.add_output(ide_dir / ".windsurfrules", self.render_template("windsurf-specific/.windsurfrules"))
         
-        with open(ide_dir / "custom-instructions.md", "w") as f:
-            f.write(custom_instructions)
+        self.add_prompt_output(ide_dir / "custom-instructions.md", "windsurf-specific/custom-instructions.md",
+                               user_rules=user_rules_content)
         
-        print(f"✅ Created Windsurf configuration files")
+        self.log(f"✅ Created Windsurf configuration files")
 
     def create_copilot_instructions(self, ide_dir):
         """Create GitHub Copilot instructions file with complete framework content."""
@@ -705,6 +573,8 @@ See `.windsurfrules` for framework rules configuration.
         
         for generic_file in generic_files:
             source_file = self.generic_dir / generic_file
+            if generic_file == "user-rules-template.md" and self.layout == "cache":
+                continue  # already the shared core at the top of the file
             if source_file.exists():
                 with open(source_file, 'r', encoding='utf-8') as f:
                     content = f.read()
@@ -716,61 +586,9 @@ See `.windsurfrules` for framework rules configuration.
                 file_title = generic_file.replace('.md', '').replace('-', ' ').title()
                 combined_content += f"\n\n# {file_title}\n\n{content}\n"
         
-        # GitHub Copilot instructions with complete framework content
-        copilot_content = f"""# AI Epic Framework - GitHub Copilot Instructions
-
-## Repository Framework
-This project uses the AI Epic Framework for systematic complex application development.
-
-## Framework Overview
-The AI Epic Framework provides comprehensive guidance for systematic complex application development, including epic workflow management, problem-solving methodologies, architecture design processes, and execution standards.
-
-## Core Framework Components
-- **Epic Workflow**: Hierarchical task breakdown (Initiative → Epic → Phase → Step)
-- **Problem Solving**: Systematic troubleshooting methodology
-- **Architecture Design**: Guided architectural decision-making
-- **Execution Standards**: Quality assurance and best practices
-
-## Framework Usage
-1. **Task Management**: Use epic workflow for project breakdown and task organization
-2. **Debugging**: Apply problem-solving framework for complex technical issues
-3. **Design**: Use architecture design process for system planning and decisions
-4. **Quality**: Follow execution standards for research and validation
-
-## File Organization
-- Framework files: `framework/generic/` and `framework/github-copilot-specific/`
-- Documentation: `docs/` directory with comprehensive guides
-- Task structure: `/.epic-workflows/tasks/` for hierarchical task management
-- Architecture docs: `docs/architecture/` for system design documentation
-
-## Development Workflow
-1. **Planning**: Use epic workflow to break down complex features
-2. **Implementation**: Follow execution standards for quality development
-3. **Problem Solving**: Apply systematic approach for debugging
-4. **Architecture**: Use design process for technical decisions
-5. **Documentation**: Maintain comprehensive project documentation
-
-## Framework Integration
-- Copilot will reference these instructions for all development tasks
-- Use framework decision matrix to determine appropriate methodologies
-- Follow structured approaches for complex problem-solving
-- Maintain consistency with framework principles
-
-## Key Principles
-- **Research-First**: Always consult official documentation
-- **Multi-Source Validation**: Cross-check information from multiple sources
-- **Quality Over Speed**: Plan thoroughly, implement incrementally
-- **Comprehensive Documentation**: Document all decisions and trade-offs
-- **Architecture Compliance**: Reference and update architecture docs
-
-{combined_content}
-
-For detailed setup and usage instructions, see: `docs/ide-setup/github-copilot.md`
-"""
-        
-        with open(ide_dir / "copilot-instructions.md", "w") as f:
-            f.write(copilot_content)
-        print(f"✅ Created GitHub Copilot instructions with complete framework content")
+        self.add_prompt_output(ide_dir / "copilot-instructions.md", "github-copilot-specific/copilot-instructions.md",
+                               framework_docs=combined_content)
+        self.log(f"✅ Created GitHub Copilot instructions with complete framework content")
 
     def create_claude_code_files(self, ide_dir):
         """Create Claude Code specific files."""
@@ -782,32 +600,6 @@ For detailed setup and usage instructions, see: `docs/ide-setup/github-copilot.m
         # Fix relative paths for Claude Code context
         user_rules_content = self.fix_relative_paths_for_ide(user_rules_content, "claude-code-specific")
         
-        # Create comprehensive framework prompt for Claude Code
-        framework_prompt = f"""# AI Epic Framework - Claude Code System Prompt
-
-## Claude Code Configuration
-You are an AI assistant configured with the AI Epic Framework for systematic complex application development. This system prompt provides comprehensive guidance for terminal-based development with structured methodologies.
-
-{user_rules_content}
-
-## Claude Code Specific Instructions
-- Use terminal commands and file operations for development tasks
-- Leverage Claude Code's agentic capabilities for autonomous development
-- Apply framework methodologies through command-line interfaces
-- Maintain framework documentation and task structure through file operations
-- Use the decision matrix to determine which framework components to apply
-
-## Terminal Integration
-- Execute framework workflows through terminal commands
-- Create and manage task hierarchies using file system operations
-- Apply problem-solving framework through systematic investigation
-- Use architecture design process for technical decision-making
-- Follow execution standards for quality assurance
-
-## Configuration
-See `claude-config.json` for detailed configuration settings.
-"""
-        
         # Claude config
         claude_config = {
             "framework": {
@@ -857,14 +649,12 @@ See `claude-config.json` for detailed configuration settings.
         # Claude Code uses framework-prompt.md for system prompt and claude-config.json for configuration
         # No need to copy separate framework files - everything goes in the main files
         
-        with open(ide_dir / "framework-prompt.md", "w") as f:
-            f.write(framework_prompt)
+        self.add_prompt_output(ide_dir / "framework-prompt.md", "claude-code-specific/framework-prompt.md",
+                               user_rules=user_rules_content)
         
-        import json
-        with open(ide_dir / "claude-config.json", "w") as f:
-            json.dump(claude_config, f, indent=2)
+        self.add_output(ide_dir / "claude-config.json", json.dumps(claude_config, indent=2))
         
-        print(f"✅ Created Claude Code configuration files")
+        self.log(f"✅ Created Claude Code configuration files")
 
     def create_trae_files(self, ide_dir):
         """Create Trae specific files."""
@@ -904,30 +694,6 @@ See `claude-config.json` for detailed configuration settings.
             }
         }
         
-        # Framework context with full content
-        framework_context = f"""# AI Epic Framework - Trae Context
-
-## Cross-IDE Framework Integration
-Trae enables consistent AI assistance across different development environments while maintaining the AI Epic Framework's structured approach.
-
-{user_rules_content}
-
-## Trae-Specific Integration
-- **IDE Agnostic**: Framework works consistently across all supported IDEs
-- **Cross Platform**: Maintains framework behavior across different operating systems
-- **Multi Project**: Framework adapts to different project types and structures
-- **Team Coordination**: Consistent framework usage across team members
-
-## Usage Across IDEs
-1. **Framework Persistence**: Framework rules and methodologies remain consistent
-2. **Project Adaptation**: Framework adapts to different project structures and requirements
-3. **Team Coordination**: All team members use the same framework approach
-4. **IDE Switching**: Seamless framework experience when switching between IDEs
-
-## Configuration
-See `trae-config.yaml` for detailed configuration settings.
-"""
-        
         # Copy all framework files to Trae directory
         generic_files = [
             "epic-workflow-instructions.md",
@@ -947,27 +713,23 @@ See `trae-config.yaml` for detailed configuration settings.
                     content = f.read()
                 content = self.fix_relative_paths_for_ide(content, "trae-specific")
                 
-                with open(target_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                print(f"✅ Copied {generic_file} to Trae directory")
+                self.add_output(target_file, content)
+                self.log(f"✅ Copied {generic_file} to Trae directory")
         
         import yaml
-        with open(ide_dir / "trae-config.yaml", "w") as f:
-            yaml.dump(trae_config, f, default_flow_style=False)
+        self.add_output(ide_dir / "trae-config.yaml", yaml.dump(trae_config, default_flow_style=False))
         
-        with open(ide_dir / "framework-context.md", "w") as f:
-            f.write(framework_context)
+        self.add_prompt_output(ide_dir / "framework-context.md", "trae-specific/framework-context.md",
+                               user_rules=user_rules_content)
         
-        print(f"✅ Created Trae configuration files")
+        self.log(f"✅ Created Trae configuration files")
 
     def create_kilo_code_files(self, ide_dir):
         """Create Kilo Code specific files using latest directory-based approach."""
-        # Create .kilocode directory structure
+        # .kilocode directory structure
         kilocode_dir = ide_dir / ".kilocode"
         kilocode_rules_dir = kilocode_dir / "rules"
         
-        kilocode_rules_dir.mkdir(parents=True, exist_ok=True)
-        
         # Read the full user-rules-template content for the custom instructions
         user_rules_file = self.generic_dir / "user-rules-template.md"
         with open(user_rules_file, 'r', encoding='utf-8') as f:
@@ -976,168 +738,22 @@ See `trae-config.yaml` for detailed configuration settings.
         # Fix relative paths for Kilo Code context
         user_rules_content = self.fix_relative_paths_for_ide(user_rules_content, "kilo-code-specific")
         
-        # Create main framework overview file
-        framework_overview = f"""# AI Epic Framework - Kilo Code Rules
-
-## Framework Overview
-This project uses the AI Epic Framework for systematic complex application development.
-
-{user_rules_content}
-
-## Kilo Code Integration
-- **Directory-Based Rules**: Framework rules stored in `.kilocode/rules/` directory
-- **Privacy-Focused**: Framework operates with local AI models where possible
-- **Open Source**: Complete transparency in framework implementation
-- **VS Code Compatible**: Works seamlessly with VS Code extensions
-
-## Framework Components
-- **Epic Workflow**: Hierarchical task breakdown (Initiative → Epic → Phase → Step)
-- **Problem Solving**: Systematic troubleshooting methodology
-- **Architecture Design**: Guided architectural decision-making
-- **Execution Standards**: Quality assurance and best practices
-
-## Usage Guidelines
-1. Use epic workflow for project breakdown and task organization
-2. Apply problem-solving framework for complex technical issues
-3. Use architecture design process for system planning and decisions
-4. Follow execution standards for research and validation
-
-## File Organization
-- Framework files: `framework/` directory
-- Documentation: `docs/` directory with comprehensive guides
-- Task structure: `/.epic-workflows/tasks/` for hierarchical task management
-- Architecture docs: `docs/architecture/` for system design documentation
-
-## Privacy Features
-- **Local Processing**: Framework operates with local AI models where possible
-- **No Telemetry**: No data collection or tracking of framework usage
-- **Open Source**: Complete transparency in framework implementation
-- **Privacy First**: All framework operations prioritize user privacy
-"""
-        
-        # Create epic workflow rules
-        epic_workflow = """# Epic Workflow Rules
-
-## Task Breakdown
-- Use epic workflow for task breakdown (Initiative → Epic → Phase → Step)
-- Create task hierarchy in `/.epic-workflows/tasks/`
-- Use INDEX.md and REQUIREMENTS.md for each task
-- Follow Plan → Document → Execute → Track → Validate sequence
-
-## File Management
-- Maintain architecture docs in `docs/architecture/`
-- Use INDEX.md and REQUIREMENTS.md for each task
-- Create task hierarchies with clear naming conventions
-- Track progress and completion status
-
-## Workflow Integration
-- Integrate with existing project management tools
-- Maintain consistency across team members
-- Update task status regularly
-- Document decisions and trade-offs
-"""
-        
-        # Create problem solving rules
-        problem_solving = """# Problem Solving Framework Rules
-
-## When to Apply
-- Apply problem-solving framework after 3+ failed attempts
-- Use for multi-component system failures
-- Apply for complex technical issues
-- Use when explicitly requested
-
-## Research Protocol
-- Consult official documentation first
-- Use Context7 and Perplexity for research
-- Cross-check from multiple sources
-- Document decisions and trade-offs
-
-## Systematic Approach
-- Follow Research → Decompose → Execute → Validate → Cleanup
-- Create temporary files for investigation
-- Use systematic research-driven approach
-- Validate solutions thoroughly
-
-## Quality Standards
-- Plan thoroughly, implement incrementally
-- Validate after each milestone
-- Update architecture docs for significant changes
-- Maintain comprehensive documentation
-"""
-        
-        # Create architecture design rules
-        architecture_design = """# Architecture Design Process Rules
-
-## Design Methodology
-- Use architecture design process for system design
-- Start with requirements and constraints
-- Research patterns and technologies
-- Design components with clear boundaries
-
-## Quality Attributes
-- Plan for scalability, performance, security
-- Consider reliability and observability
-- Document decisions and trade-offs
-- Validate architectural decisions
-
-## Integration Patterns
-- Use REST + OpenAPI for API design
-- Consider event-driven patterns with Kafka/NATS
-- Implement microservices with gRPC
-- Plan for service mesh (Istio, Linkerd)
-
-## Documentation
-- Maintain architecture docs in `docs/architecture/`
-- Create architecture decision records (ADRs)
-- Document component boundaries and interfaces
-- Keep architecture docs up to date
-"""
-        
-        # Create execution standards rules
-        execution_standards = """# Execution Standards Rules
-
-## Quality Assurance
-- Follow execution standards for quality assurance
-- Research-first approach for all decisions
-- Multi-source validation for information
-- Quality over speed in all implementations
-
-## Development Process
-- Plan thoroughly before implementation
-- Implement incrementally with validation
-- Update documentation for all changes
-- Maintain comprehensive project documentation
-
-## Team Coordination
-- Ensure consistency across team members
-- Use framework standards for all projects
-- Maintain framework documentation
-- Coordinate framework updates across team
-
-## Best Practices
-- Follow established coding standards
-- Use version control effectively
-- Implement proper testing strategies
-- Maintain security best practices
-"""
-        
         # Write files to .kilocode/rules directory
-        with open(kilocode_rules_dir / "01-framework-overview.md", "w") as f:
-            f.write(framework_overview)
+        self.add_prompt_output(kilocode_rules_dir / "01-framework-overview.md", "kilo-code-specific/.kilocode/rules/01-framework-overview.md",
+                               user_rules=user_rules_content)
         
-        with open(kilocode_rules_dir / "02-epic-workflow.md", "w") as f:
-            f.write(epic_workflow)
+        self.add_output(kilocode_rules_dir / "02-epic-workflow.md", self.render_template("shared/02-epic-workflow.md"))
         
-        with open(kilocode_rules_dir / "03-problem-solving.md", "w") as f:
-            f.write(problem_solving)
+        self.add_output(kilocode_rules_dir / "03-problem-solving.md",
+                        self.render_template("shared/03-problem-solving.md"))
         
-        with open(kilocode_rules_dir / "04-architecture-design.md", "w") as f:
-            f.write(architecture_design)
+        self.add_output(kilocode_rules_dir / "04-architecture-design.md",
+                        self.render_template("shared/04-architecture-design.md"))
         
-        with open(kilocode_rules_dir / "05-execution-standards.md", "w") as f:
-            f.write(execution_standards)
+        self.add_output(kilocode_rules_dir / "05-execution-standards.md",
+                        self.render_template("shared/05-execution-standards.md"))
         
-        print(f"✅ Created Kilo Code configuration files with directory-based structure")
+        self.log(f"✅ Created Kilo Code configuration files with directory-based structure")
 
     def create_void_files(self, ide_dir):
         """Create Void IDE specific files."""
@@ -1178,30 +794,6 @@ This project uses the AI Epic Framework for systematic complex application devel
             }
         }
         
-        # Framework system prompt with full content
-        system_prompt = f"""# AI Epic Framework - Void IDE System Prompt
-
-## Privacy-Conscious AI Development
-Void IDE provides privacy-focused AI assistance with local processing capabilities and the AI Epic Framework.
-
-{user_rules_content}
-
-## Void IDE Specific Features
-- **Local AI Models**: Framework operates with local AI models for complete privacy
-- **Offline Processing**: Framework works without internet connectivity
-- **No Telemetry**: Zero data collection or tracking
-- **VS Code Compatible**: Seamless integration with VS Code ecosystem
-
-## Privacy-First Development
-- **Local Processing**: All framework operations happen locally
-- **Data Minimization**: Only essential data is processed
-- **Offline Capabilities**: Framework functions without cloud dependencies
-- **Privacy Controls**: Granular control over all data handling
-
-## Configuration
-See `void-config.json` and `privacy-rules.json` for detailed configuration settings.
-"""
-        
         # Privacy rules
         privacy_rules = {
             "privacy": {
@@ -1236,21 +828,17 @@ See `void-config.json` and `privacy-rules.json` for detailed configuration setti
                     content = f.read()
                 content = self.fix_relative_paths_for_ide(content, "void-specific")
                 
-                with open(target_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                print(f"✅ Copied {generic_file} to Void IDE directory")
+                self.add_output(target_file, content)
+                self.log(f"✅ Copied {generic_file} to Void IDE directory")
         
-        import json
-        with open(ide_dir / "void-config.json", "w") as f:
-            json.dump(void_config, f, indent=2)
+        self.add_output(ide_dir / "void-config.json", json.dumps(void_config, indent=2))
         
-        with open(ide_dir / "framework-system-prompt.md", "w") as f:
-            f.write(system_prompt)
+        self.add_prompt_output(ide_dir / "framework-system-prompt.md", "void-specific/framework-system-prompt.md",
+                               user_rules=user_rules_content)
         
-        with open(ide_dir / "privacy-rules.json", "w") as f:
-            json.dump(privacy_rules, f, indent=2)
+        self.add_output(ide_dir / "privacy-rules.json", json.dumps(privacy_rules, indent=2))
         
-        print(f"✅ Created Void IDE configuration files")
+        self.log(f"✅ Created Void IDE configuration files")
 
     def create_zencoder_files(self, ide_dir):
         """Create Zencoder specific files."""
@@ -1262,31 +850,6 @@ See `void-config.json` and `privacy-rules.json` for detailed configuration setti
         # Fix relative paths for Zencoder context
         user_rules_content = self.fix_relative_paths_for_ide(user_rules_content, "zencoder-specific")
         
-        # Framework rules with full content
-        framework_rules = f"""# AI Epic Framework - Zencoder Rules
-
-## Enterprise AI Development Framework
-Zencoder provides enterprise-grade AI assistance with multi-format rule support and the AI Epic Framework.
-
-{user_rules_content}
-
-## Zencoder Enterprise Features
-- **Multi-Format Support**: Framework rules in multiple formats (.rules, .cursorrules, .clinerules, etc.)
-- **Team Coordination**: Enterprise-wide framework consistency
-- **Security & Compliance**: Enterprise-grade security and compliance features
-- **Analytics & Monitoring**: Framework usage analytics and performance monitoring
-- **Scalability**: Framework scales across large enterprise teams
-
-## Enterprise Integration
-- **Multi-Team Support**: Framework coordination across multiple development teams
-- **Centralized Management**: Centralized framework configuration and updates
-- **Compliance Features**: Built-in compliance and governance features
-- **Performance Monitoring**: Framework performance and usage analytics
-
-## Configuration
-See `enterprise-config.json` for detailed enterprise configuration settings.
-"""
-        
         # Enterprise config
         enterprise_config = {
             "framework": {
@@ -1307,23 +870,6 @@ See `enterprise-config.json` for detailed enterprise configuration settings.
             }
         }
         
-        # Compatibility files
-        cursor_compatibility = """# Cursor AI Compatibility
-Cursor AI compatible rules for the AI Epic Framework.
-"""
-        
-        cline_compatibility = """# Cline Compatibility
-Cline compatible rules for the AI Epic Framework.
-"""
-        
-        windsurf_compatibility = """# Windsurf Compatibility
-Windsurf compatible rules for the AI Epic Framework.
-"""
-        
-        copilot_compatibility = """# GitHub Copilot Compatibility
-GitHub Copilot compatible instructions for the AI Epic Framework.
-"""
-        
         # Copy all framework files to Zencoder directory
         generic_files = [
             "epic-workflow-instructions.md",
@@ -1343,30 +889,27 @@ GitHub Copilot compatible instructions for the AI Epic Framework.
                     content = f.read()
                 content = self.fix_relative_paths_for_ide(content, "zencoder-specific")
                 
-                with open(target_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                print(f"✅ Copied {generic_file} to Zencoder directory")
+                self.add_output(target_file, content)
+                self.log(f"✅ Copied {generic_file} to Zencoder directory")
         
-        with open(ide_dir / "framework-rules.rules", "w") as f:
-            f.write(framework_rules)
+        self.add_prompt_output(ide_dir / "framework-rules.rules", "zencoder-specific/framework-rules.rules",
+                               user_rules=user_rules_content)
         
-        import json
-        with open(ide_dir / "enterprise-config.json", "w") as f:
-            json.dump(enterprise_config, f, indent=2)
+        self.add_output(ide_dir / "enterprise-config.json", json.dumps(enterprise_config, indent=2))
         
-        with open(ide_dir / "cursor-compatibility.cursorrules", "w") as f:
-            f.write(cursor_compatibility)
+        self.add_output(ide_dir / "cursor-compatibility.cursorrules",
+                        self.render_template("zencoder-specific/cursor-compatibility.cursorrules"))
         
-        with open(ide_dir / "cline-compatibility.clinerules", "w") as f:
-            f.write(cline_compatibility)
+        self.add_output(ide_dir / "cline-compatibility.clinerules",
+                        self.render_template("zencoder-specific/cline-compatibility.clinerules"))
         
-        with open(ide_dir / "windsurf-compatibility.windsurfrules", "w") as f:
-            f.write(windsurf_compatibility)
+        self.add_output(ide_dir / "windsurf-compatibility.windsurfrules",
+                        self.render_template("zencoder-specific/windsurf-compatibility.windsurfrules"))
         
-        with open(ide_dir / "copilot-compatibility.md", "w") as f:
-            f.write(copilot_compatibility)
+        self.add_output(ide_dir / "copilot-compatibility.md",
+                        self.render_template("zencoder-specific/copilot-compatibility.md"))
         
-        print(f"✅ Created Zencoder configuration files")
+        self.log(f"✅ Created Zencoder configuration files")
 
     def create_gemini_files(self, ide_dir):
         """Create Gemini CLI specific files."""
@@ -1378,36 +921,6 @@ GitHub Copilot compatible instructions for the AI Epic Framework.
         # Fix relative paths for Gemini CLI context
         user_rules_content = self.fix_relative_paths_for_ide(user_rules_content, "gemini-cli-specific")
         
-        # GEMINI.md system prompt with full content
-        gemini_prompt = f"""# AI Epic Framework - Gemini CLI System Prompt
-
-## Google Ecosystem AI Development
-Gemini CLI provides AI assistance with deep Google Cloud Platform and Google Workspace integration and the AI Epic Framework.
-
-{user_rules_content}
-
-## Gemini CLI Specific Features
-- **Google Cloud Integration**: Framework optimized for Google Cloud Platform services
-- **Google Workspace**: Integration with Google Docs, Sheets, and Drive
-- **GCP-Native Design**: Framework patterns optimized for Google Cloud architecture
-- **Google Cloud Build**: Automated framework deployment and CI/CD integration
-
-## Google Ecosystem Integration
-- **Google Cloud Platform**: Framework optimized for GCP services and patterns
-- **Google Workspace**: Documentation and collaboration through Google Workspace
-- **Google Cloud Build**: Automated framework deployment and testing
-- **Google Cloud Monitoring**: Framework performance and usage monitoring
-
-## GCP-Native Development
-- **Cloud-Native Patterns**: Framework optimized for cloud-native development
-- **GCP Services**: Integration with Compute Engine, Cloud Functions, Cloud Run, etc.
-- **Google Cloud Security**: Framework security patterns aligned with GCP best practices
-- **Scalability**: Framework designed for Google Cloud scalability patterns
-
-## Configuration
-See `gemini-config.json` and `google-cloud-integration.json` for detailed configuration settings.
-"""
-        
         # Gemini config
         gemini_config = {
             "framework": {
@@ -1472,21 +985,17 @@ See `gemini-config.json` and `google-cloud-integration.json` for detailed config
                     content = f.read()
                 content = self.fix_relative_paths_for_ide(content, "gemini-cli-specific")
                 
-                with open(target_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                print(f"✅ Copied {generic_file} to Gemini CLI directory")
+                self.add_output(target_file, content)
+                self.log(f"✅ Copied {generic_file} to Gemini CLI directory")
         
-        with open(ide_dir / "GEMINI.md", "w") as f:
-            f.write(gemini_prompt)
+        self.add_prompt_output(ide_dir / "GEMINI.md", "gemini-cli-specific/GEMINI.md",
+                               user_rules=user_rules_content)
         
-        import json
-        with open(ide_dir / "gemini-config.json", "w") as f:
-            json.dump(gemini_config, f, indent=2)
+        self.add_output(ide_dir / "gemini-config.json", json.dumps(gemini_config, indent=2))
         
-        with open(ide_dir / "google-cloud-integration.json", "w") as f:
-            json.dump(gcp_integration, f, indent=2)
+        self.add_output(ide_dir / "google-cloud-integration.json", json.dumps(gcp_integration, indent=2))
         
-        print(f"✅ Created Gemini CLI configuration files")
+        self.log(f"✅ Created Gemini CLI configuration files")
 
     def generate_configured_adaptations(self):
         """Generate all IDE adaptations."""
@@ -1503,6 +1012,14 @@ See `gemini-config.json` and `google-cloud-integration.json` for detailed config
         
         print("✅ All IDE adaptations generated successfully!")
         print()
+        
+        if self.content_store is not None:
+            stats = self.content_store.stats
+            count, size = self.content_store.usage()
+            print(f"📦 Shared store: {stats['logical_bytes']:,} bytes of outputs backed by {count} object(s), "
+                  f"{size:,} bytes (hardlinks: {stats['hardlink']}, reflinks: {stats['reflink']}, "
+                  f"copies: {stats['copy']}, unchanged: {stats['unchanged']})")
+            print()
         print("📁 Generated adaptations:")
         for ide_name in self.ide_configs.keys():
             print(f"   - {ide_name}/")
@@ -1519,7 +1036,56 @@ def main():
     
     parser = argparse.ArgumentParser(description="Run the IDE adaptation generator.")
     parser.add_argument('--ide', type=str, help="Specify the IDE to generate adaptation for")
+    parser.add_argument('--shared-store', action='store_true',
+                        help="Store identical outputs once in framework/.store and link them into place")
+    parser.add_argument('--link-mode', choices=LINK_MODES, default="auto",
+                        help="How shared-store outputs are materialized (default: auto)")
+    parser.add_argument('--overlay', action='append', default=[], metavar="DIR",
+                        help="Overlay directory patched over framework/generic (repeatable, lowest precedence first)")
+    parser.add_argument('--layout', choices=LAYOUTS, default=DEFAULT_LAYOUT,
+                        help="'cache' opens every prompt file with the byte-identical shared core (default: standard)")
+    parser.add_argument('--target-repo', default=None, metavar="DIR",
+                        help="Scan this repository and generate a repo-aware .rooignore for it")
+    subparsers = parser.add_subparsers(dest='command')
+    bundle_parser = subparsers.add_parser('bundle', help="Build reproducible per-IDE archives from in-memory outputs")
+    bundle_parser.add_argument('--format', choices=BUNDLE_FORMATS, default=DEFAULT_FORMAT,
+                               help=f"Archive format (default: {DEFAULT_FORMAT})")
+    bundle_parser.add_argument('--out', default="dist", help="Output folder for the archives (default: dist)")
+    bundle_parser.add_argument('--workers', type=int, default=None, help="Parallel compression workers")
+    serve_parser = subparsers.add_parser('serve', help="Serve rendered adaptations over HTTP from memory")
+    serve_parser.add_argument('--host', default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST})")
+    serve_parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    serve_parser.add_argument('--quiet', action='store_true', help="Do not log requests")
+    audit_parser = subparsers.add_parser('audit', help=f"Regenerate {AUDIT_REPORT} with stats and per-IDE coverage")
+    audit_parser.add_argument('--rendered', action='store_true',
+                              help="Audit freshly rendered outputs instead of framework/*-specific/ on disk")
+    audit_parser.add_argument('--output', default=None, help=f"Report path (default: {AUDIT_REPORT})")
+    audit_parser.add_argument('--check', action='store_true', help="Exit 1 if the report is out of date")
+    batch_parser = subparsers.add_parser('batch', help="Render adaptations for every variant in a variants file")
+    batch_parser.add_argument('variants', help="JSON or JSON Lines file of variants (name, project_name, stack, "
+                                               "compliance, task_root, ides)")
+    batch_parser.add_argument('--out', default="variants", help="Output root, one folder per variant (default: variants)")
+    batch_parser.add_argument('--workers', type=int, default=None, help="Parallel writer threads")
+    prefix_parser = subparsers.add_parser('prefix', help="Report the longest common prompt prefix across IDE targets")
+    prefix_parser.add_argument('--json', action='store_true', help="Print the report as JSON")
     args = parser.parse_args()
+    generator.layout = args.layout
+
+    if args.overlay:
+        stack = OverlayStack(generator.generic_dir, args.overlay, generator.framework_dir / ".cache" / "overlays")
+        try:
+            generator.generic_dir = stack.merge()
+        except OverlayError as e:
+            print(f"❌ {e}")
+            return 1
+        print(f"🧩 Applied {len(args.overlay)} overlay(s) ({stack.layers_applied} layer(s) re-merged)")
+
+    if args.target_repo:
+        generator.ignore_rules = RepoSurvey(args.target_repo).run()
+        print(f"🔎 Scanned {generator.ignore_rules['files_scanned']:,} files in {args.target_repo} for .rooignore rules")
+
+    if args.shared_store:
+        generator.content_store = ContentStore(generator.framework_dir / ".store", args.link_mode)
 
     if args.ide:
         ide_arg = args.ide.strip().lower()
@@ -1533,7 +1099,71 @@ def main():
             print(f"❌ Unknown IDE: {ide_arg}")
             return
 
+    if args.command == 'bundle':
+        rendered = generator.generate_all()
+        for ide_name, target, files, size in write_bundles(rendered, args.out, args.format, args.workers):
+            print(f"📦 {ide_name}: {target} ({files} files, {size:,} bytes)")
+        return
+
+    if args.command == 'prefix':
+        prompts = {}
+        for ide_name in generator.ide_configs:
+            outputs = generator.generate(ide_name)
+            if generator.prompt_files:
+                path = generator.prompt_files[0]
+                prompts[ide_name] = (path, outputs[path])
+        report = prefix_report(prompts, generator.prompt_core())
+        print(json.dumps(report, indent=2) if args.json else format_report(report, args.layout))
+        return
+
+    if args.command == 'batch':
+        try:
+            variants = load_variants(args.variants, list(generator.ide_configs))
+        except (OSError, ValueError) as e:
+            print(f"❌ {e}")
+            return 1
+        rendered = generator.generate_all()
+        results = render_variants(rendered, generator.ide_configs, variants, args.out, args.workers,
+                                  generator.content_store)
+        print(f"✅ Rendered {len(results)} variant(s), {sum(files for _, _, files in results):,} files into {args.out}/")
+        if generator.content_store is not None:
+            count, size = generator.content_store.usage()
+            print(f"📦 Shared store: {count} object(s), {size:,} bytes")
+        return
+
+    if args.command == 'audit':
+        auditor = AdaptationAuditor(generator.base_dir)
+        if args.rendered:
+            report = auditor.run(generator.generate_all())
+        else:
+            outputs = auditor.ide_outputs()
+            if args.ide:
+                outputs = {name: files for name, files in outputs.items() if name in generator.ide_configs}
+            report = auditor.run(outputs)
+        report_file = Path(args.output) if args.output else generator.base_dir / AUDIT_REPORT
+        current = report_file.read_text(encoding="utf-8") if report_file.exists() else None
+        if args.check:
+            print(f"{'✅' if current == report else '❌'} {report_file.name} is "
+                  f"{'up to date' if current == report else 'out of date'} ({auditor.scanned} file(s) scanned)")
+            return 0 if current == report else 1
+        if current != report:
+            report_file.write_text(report, encoding="utf-8")
+        print(f"✅ Wrote {report_file.name} ({auditor.scanned} file(s) scanned)")
+        return
+
+    if args.command == 'serve':
+        server = make_server(generator, args.host, args.port, verbose=not args.quiet)
+        host, port = server.server_address[:2]
+        print(f"🌐 Serving {len(generator.ide_configs)} adaptation(s) at http://{host}:{port}/ (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return
+
     generator.generate_configured_adaptations()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main()) 
\ No newline at end of file
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Decision Matrix Router
+
+This script compiles the "Decision Matrix: When to Load Which Documentation" from
+user-rules-template.md into an executable router. The keyword, directory path and
+file reference indicators of every framework doc are loaded into a single
+Aho-Corasick automaton, so a user query or file path is matched against all
+indicators in one pass over the text.
+
+The router table can be read straight from user-rules-template.md or from the
+`decision-router.json` that create_ide_adaptations.py emits into every IDE output
+that ships the framework docs as separate files.
+
+Usage:
+    python3 decision_router.py "this architecture doc is over 700 lines"
+    python3 decision_router.py .epic-workflows/tasks/Initiative_1_auth/INDEX.md --json
+    python3 decision_router.py "debugging" --table framework/cursor-specific/decision-router.json
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import deque
+from pathlib import Path
+
+ROUTER_VERSION = 1
+DEFAULT_DOC = "general-execution-standards.md"
+KEYWORD_WEIGHT = 1
+PATH_WEIGHT = 3
+MATRIX_HEADING_RE = re.compile(r"^###\s+\d+\.\s+(.*?)\s+\(\[([^\]]+)\]")
+QUOTED_RE = re.compile(r'"([^"]+)"')
+BACKTICK_RE = re.compile(r"`([^`]+)`")
+LINK_TARGET_RE = re.compile(r"\]\(\./([^)]+)\)")
+
+
+def parse_decision_matrix(text):
+    """Parse the decision matrix section of user-rules-template.md into a router table."""
+    routes = []
+    current = None
+    in_matrix = False
+    in_related = False
+    for line in text.splitlines():
+        if line.startswith("## "):
+            in_matrix = line.startswith("## Decision Matrix")
+            continue
+        if not in_matrix:
+            continue
+
+        match = MATRIX_HEADING_RE.match(line)
+        if match:
+            current = {"title": match.group(1), "doc": match.group(2), "keywords": [], "paths": [], "related": []}
+            routes.append(current)
+            in_related = False
+            continue
+        if current is None:
+            continue
+
+        stripped = line.strip()
+        if stripped.startswith("**"):
+            in_related = stripped.startswith("**Related Documentation")
+        if "Keywords:" in line:
+            current["keywords"] += [k.lower() for k in QUOTED_RE.findall(line)]
+        elif "Directory paths:" in line or "File references:" in line:
+            current["paths"] += [p.lower().lstrip("/") for p in BACKTICK_RE.findall(line)]
+        elif in_related:
+            current["related"] += LINK_TARGET_RE.findall(line)
+
+    return {"version": ROUTER_VERSION, "default": DEFAULT_DOC, "routes": routes}
+
+
+class AhoCorasick:
+    """Multi-pattern matcher: finds every occurrence of every pattern in one scan."""
+
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            self.add(pattern, pattern_id)
+        self.build()
+
+    def add(self, pattern, pattern_id):
+        state = 0
+        for char in pattern:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            state = next_state
+        self.output[state].append((pattern_id, len(pattern)))
+
+    def build(self):
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def iter_matches(self, text):
+        """Yield (pattern id, start, end) for every match in `text`."""
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            for pattern_id, length in self.output[state]:
+                yield pattern_id, index - length + 1, index + 1
+
+
+class DecisionRouter:
+    def __init__(self, table):
+        self.table = table
+        self.default = table.get("default", DEFAULT_DOC)
+        self.routes = table["routes"]
+        self.patterns = []  # (route index, weight, is_path)
+        texts = []
+        for route_index, route in enumerate(self.routes):
+            for keyword in route["keywords"]:
+                texts.append(keyword)
+                self.patterns.append((route_index, KEYWORD_WEIGHT, False))
+            for path in route["paths"]:
+                texts.append(path)
+                self.patterns.append((route_index, PATH_WEIGHT, True))
+        self.matcher = AhoCorasick(texts)
+
+    @classmethod
+    def from_rules_file(cls, rules_file):
+        with open(rules_file, "r", encoding="utf-8") as f:
+            return cls(parse_decision_matrix(f.read()))
+
+    @classmethod
+    def from_table_file(cls, table_file):
+        with open(table_file, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    @staticmethod
+    def is_word_match(text, start, end):
+        """Keywords must start on a word boundary and end on one (a plural `s` is allowed)."""
+        if start > 0 and text[start - 1].isalnum():
+            return False
+        if end < len(text) and text[end] == "s":
+            end += 1
+        return end >= len(text) or not text[end].isalnum()
+
+    def scores(self, text):
+        """Score every route against a query or path. Returns {route index: score}."""
+        text = text.lower()
+        scores = {}
+        seen = set()
+        for pattern_id, start, end in self.matcher.iter_matches(text):
+            route_index, weight, is_path = self.patterns[pattern_id]
+            if not is_path and not self.is_word_match(text, start, end):
+                continue
+            if pattern_id in seen:
+                continue
+            seen.add(pattern_id)
+            scores[route_index] = scores.get(route_index, 0) + weight
+        return scores
+
+    def route(self, text, limit=None):
+        """Return the docs to load for a query, best match first, with the default as fallback."""
+        scores = self.scores(text)
+        ranked = sorted(scores, key=lambda i: (-scores[i], i))
+        docs = [{"doc": self.routes[i]["doc"], "title": self.routes[i]["title"], "score": scores[i],
+                 "related": self.routes[i]["related"]} for i in ranked]
+        if not docs:
+            docs = [{"doc": self.default, "title": "Default", "score": 0, "related": []}]
+        return docs[:limit] if limit else docs
+
+
+def default_rules_file():
+    """user-rules-template.md from the project tree, falling back to this checkout."""
+    local = Path("framework") / "generic" / "user-rules-template.md"
+    if local.exists():
+        return local
+    return Path(__file__).resolve().parent / "framework" / "generic" / "user-rules-template.md"
+
+
+def main():
+    """Main function to run the decision matrix router."""
+    parser = argparse.ArgumentParser(description="Route a query or file path to the framework docs to load.")
+    parser.add_argument('query', help="User query or file path")
+    parser.add_argument('--rules', default=None, help="Path to user-rules-template.md")
+    parser.add_argument('--table', default=None, help="Path to an emitted decision-router.json table")
+    parser.add_argument('--limit', type=int, default=None, help="Maximum number of docs to return")
+    parser.add_argument('--json', action='store_true', help="Print the result as JSON")
+    args = parser.parse_args()
+
+    try:
+        if args.table:
+            router = DecisionRouter.from_table_file(args.table)
+        else:
+            router = DecisionRouter.from_rules_file(args.rules or default_rules_file())
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Could not load decision matrix: {e}")
+        return 1
+
+    docs = router.route(args.query, args.limit)
+    if args.json:
+        print(json.dumps(docs, indent=2))
+        return 0
+    for doc in docs:
+        related = f"  (related: {', '.join(doc['related'])})" if doc["related"] else ""
+        print(f"📄 {doc['doc']} [{doc['score']}]{related}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
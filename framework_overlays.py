@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Framework Overlays
+
+Layers ordered overlay directories (base → org → team → repo) over
+`framework/generic/`, so domain variants such as the fintech, gaming and
+healthcare adaptations in docs/customization-guide.md can be kept as small
+patches instead of forked copies.
+
+An overlay directory mirrors the generic file names. A file with no directives
+replaces (or adds) the whole document. Otherwise every directive patches one
+section, addressed by its heading path (titles joined with " > ", section numbers
+optional; a trailing part of the path is enough when it is unique):
+
+    <!-- overlay: replace "3. Pre-Execution Requirements > Feature Creep Prevention" -->
+    ### Feature Creep Prevention
+    Regulated changes need a compliance sign-off before scope changes.
+
+    <!-- overlay: append "Goal Validation Protocol" -->
+    - Map each goal to the relevant PCI-DSS control.
+
+    <!-- overlay: delete "Healthcare Application Development" -->
+
+Operations: replace, append (end of the section), prepend (right after its
+heading), insert-before, insert-after (as a sibling) and delete. A replace block
+without a heading keeps the original heading.
+
+Merges are cached per overlay-stack hash in `framework/.cache/overlays/<hash>/`.
+Each prefix of the stack is cached as well, so when only the team layer changes
+the base+org merge is reused and only the team and repo layers are re-applied.
+
+Usage:
+    python3 framework_overlays.py overlays/org overlays/team-payments
+    python3 create_ide_adaptations.py --overlay overlays/org --overlay overlays/team-payments
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+
+DIRECTIVE_RE = re.compile(r'^<!--\s*overlay:\s*([a-z-]+)(?:\s+"([^"]*)")?\s*-->\s*$')
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*$")
+NUMBERING_RE = re.compile(r"^\d+(?:\.\d+)*\.?\s+")
+OPERATIONS = ("replace", "append", "prepend", "insert-before", "insert-after", "delete")
+PATH_SEPARATOR = " > "
+
+
+class OverlayError(ValueError):
+    """An overlay directive that cannot be applied."""
+
+
+def parse_sections(lines):
+    """Return [(trail, level, start, end)] for every heading; `end` includes nested sections."""
+    sections = []
+    stack = []  # (level, title, index into sections)
+    in_fence = False
+    for number, line in enumerate(lines):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING_RE.match(line)
+        if not match:
+            continue
+        level = len(match.group(1))
+        while stack and stack[-1][0] >= level:
+            _, _, closed = stack.pop()
+            sections[closed][3] = number
+        trail = tuple(title for _, title, _ in stack) + (match.group(2),)
+        sections.append([trail, level, number, len(lines)])
+        stack.append((level, match.group(2), len(sections) - 1))
+    return [tuple(section) for section in sections]
+
+
+def title_matches(title, wanted):
+    """Heading titles match case-insensitively, with or without their section number ("6. ")."""
+    title = title.lower()
+    return title == wanted or NUMBERING_RE.sub("", title) == wanted
+
+
+def find_section(sections, path, file_name):
+    wanted = [part.strip().lower() for part in path.split(PATH_SEPARATOR)]
+    found = [s for s in sections if len(s[0]) >= len(wanted)
+             and all(title_matches(t, w) for t, w in zip(s[0][-len(wanted):], wanted))]
+    if not found:
+        raise OverlayError(f"{file_name}: no section matches '{path}'")
+    if len(found) > 1:
+        raise OverlayError(f"{file_name}: '{path}' is ambiguous ({len(found)} sections); use a longer heading path")
+    return found[0]
+
+
+def parse_directives(text):
+    """Split an overlay file into [(operation, heading path, block lines)], or None for a whole-file replacement."""
+    directives = []
+    in_fence = False
+    for line in text.splitlines(keepends=True):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else DIRECTIVE_RE.match(line.strip())
+        if match:
+            operation, path = match.group(1), match.group(2)
+            if operation not in OPERATIONS:
+                raise OverlayError(f"Unknown overlay operation '{operation}'")
+            if path is None:
+                raise OverlayError(f"Overlay operation '{operation}' needs a heading path")
+            directives.append((operation, path, []))
+        elif directives:
+            directives[-1][2].append(line)
+    return directives or None
+
+
+def trim_block(block):
+    while block and not block[0].strip():
+        block = block[1:]
+    while block and not block[-1].strip():
+        block = block[:-1]
+    block = [line if line.endswith("\n") else line + "\n" for line in block]
+    return block + ["\n"] if block else block
+
+
+def apply_overlay(base_text, overlay_text, file_name="document"):
+    """Apply one overlay file to a base document and return the patched text."""
+    directives = parse_directives(overlay_text)
+    if directives is None:
+        return overlay_text
+    lines = base_text.splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    for operation, path, block in directives:
+        _, level, start, end = find_section(parse_sections(lines), path, file_name)
+        block = trim_block(block)
+        if operation == "delete":
+            lines[start:end] = []
+        elif operation == "replace":
+            has_heading = block and HEADING_RE.match(block[0])
+            lines[start if has_heading else start + 1:end] = block if has_heading else ["\n"] + block
+        elif operation == "append":
+            lines[end:end] = block
+        elif operation == "prepend":
+            lines[start + 1:start + 1] = ["\n"] + block
+        elif operation == "insert-before":
+            lines[start:start] = block
+        else:  # insert-after
+            lines[end:end] = block
+    return "".join(lines)
+
+
+def tree_digest(folder):
+    """Content digest of every Markdown file in a folder (file names included)."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(folder).glob("*.md")):
+        digest.update(path.name.encode("utf-8") + b"\0")
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+class OverlayStack:
+    def __init__(self, base_dir, overlays, cache_dir):
+        self.base_dir = Path(base_dir)
+        self.overlays = [Path(overlay) for overlay in overlays]
+        self.cache_dir = Path(cache_dir)
+        self.layers_applied = 0
+
+    def stack_keys(self):
+        """Cache key of every prefix of the stack: base, base+org, base+org+team, ..."""
+        key = hashlib.sha256(b"base\0" + tree_digest(self.base_dir).encode("ascii")).hexdigest()
+        keys = [key[:20]]
+        for overlay in self.overlays:
+            if not overlay.is_dir():
+                raise OverlayError(f"Overlay directory not found: {overlay}")
+            key = hashlib.sha256(f"{key}\0{tree_digest(overlay)}".encode("ascii")).hexdigest()
+            keys.append(key[:20])
+        return keys
+
+    def merge(self):
+        """Return the folder holding the merged documents, reusing the longest cached prefix."""
+        keys = self.stack_keys()
+        if not self.overlays:
+            return self.base_dir
+        start = 0
+        for depth in range(len(keys) - 1, 0, -1):
+            if (self.cache_dir / keys[depth]).is_dir():
+                start = depth
+                break
+        if start == len(self.overlays):
+            return self.cache_dir / keys[-1]
+
+        source = self.base_dir if start == 0 else self.cache_dir / keys[start]
+        documents = {path.name: path.read_text(encoding="utf-8") for path in sorted(source.glob("*.md"))}
+        for depth in range(start, len(self.overlays)):
+            overlay = self.overlays[depth]
+            for path in sorted(overlay.glob("*.md")):
+                documents[path.name] = apply_overlay(documents.get(path.name, ""), path.read_text(encoding="utf-8"),
+                                                     f"{overlay.name}/{path.name}")
+            self.layers_applied += 1
+            self.write_layer(keys[depth + 1], documents)
+        return self.cache_dir / keys[-1]
+
+    def write_layer(self, key, documents):
+        """Write one merged layer atomically into its cache folder."""
+        target = self.cache_dir / key
+        if target.is_dir():
+            return
+        staging = self.cache_dir / f".{key}.{os.getpid()}.tmp"
+        staging.mkdir(parents=True, exist_ok=True)
+        for name, text in documents.items():
+            with open(staging / name, "w", encoding="utf-8") as f:
+                f.write(text)
+        try:
+            os.replace(staging, target)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)  # another process produced the same layer
+
+
+def main():
+    """Merge overlay directories over framework/generic and print the merged folder."""
+    parser = argparse.ArgumentParser(description="Merge overlay directories over the generic framework files.")
+    parser.add_argument('overlays', nargs='*', help="Overlay directories, lowest precedence first")
+    parser.add_argument('--base', default=None, help="Base folder (default: framework/generic)")
+    parser.add_argument('--cache-dir', default=None, help="Merge cache (default: framework/.cache/overlays)")
+    args = parser.parse_args()
+
+    framework_dir = Path(__file__).resolve().parent / "framework"
+    stack = OverlayStack(args.base or framework_dir / "generic", args.overlays,
+                         args.cache_dir or framework_dir / ".cache" / "overlays")
+    try:
+        merged = stack.merge()
+    except OverlayError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    print(f"✅ Merged {len(args.overlays)} overlay(s), {stack.layers_applied} layer(s) re-applied", file=sys.stderr)
+    print(merged)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Goal Alignment Checker
+
+Automates the "Goal Alignment Validation" checklist of the INDEX.md template
+(epic-workflow-instructions.md §3-4). For every parent → child edge in
+`.epic-workflows/tasks/`, the Business/Product Goal and Technical Goal blocks of
+both INDEX.md files are compared with a local lexical similarity model (cosine
+similarity of log-scaled term vectors, template field labels and stopwords
+removed). Edges below the threshold are flagged as possible goal drift, and goals
+that are empty or still contain template placeholders are flagged as unclear.
+
+Everything runs offline. Results are memoized per (parent goal hash, child goal
+hash) pair and goal blocks are cached by INDEX.md (mtime, size), so reruns over
+large trees only re-read changed files and only recompute changed edges.
+
+Usage:
+    python3 goal_alignment.py
+    python3 goal_alignment.py --threshold 0.15 --json
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+from task_hierarchy import TASKS_DIR, iter_task_dirs, parse_index
+
+DEFAULT_THRESHOLD = 0.1
+CACHE_VERSION = 1
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+FIELD_LABEL_RE = re.compile(r"\*\*[^*]+\*\*:?")
+PLACEHOLDER_RE = re.compile(r"\[[^\]]*\]")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have how in is it its of on or that the this to
+was were what when where which who will with into than then there these those not our
+we they their them can should must task goal goals parent
+""".split())
+
+
+def goal_terms(text):
+    """Term counts of a goal block, without field labels, placeholders and stopwords."""
+    text = FIELD_LABEL_RE.sub(" ", text)
+    text = PLACEHOLDER_RE.sub(" ", text)
+    terms = Counter()
+    for token in TOKEN_RE.findall(text.lower()):
+        if len(token) < 3 or token in STOPWORDS:
+            continue
+        if len(token) > 4 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms[token] += 1
+    return terms
+
+
+def cosine(a, b):
+    """Cosine similarity of two term-count vectors with log-scaled term frequency."""
+    if not a or not b:
+        return 0.0
+    wa = {t: 1 + math.log(c) for t, c in a.items()}
+    wb = {t: 1 + math.log(c) for t, c in b.items()}
+    dot = sum(w * wb[t] for t, w in wa.items() if t in wb)
+    norm = math.sqrt(sum(w * w for w in wa.values())) * math.sqrt(sum(w * w for w in wb.values()))
+    return dot / norm if norm else 0.0
+
+
+def is_unclear(text):
+    """A goal is unclear when nothing is left once labels and template placeholders are removed."""
+    return not goal_terms(text)
+
+
+class GoalAlignmentChecker:
+    def __init__(self, project_root=".", threshold=DEFAULT_THRESHOLD, cache_file=None):
+        self.project_root = Path(project_root).resolve()
+        self.tasks_root = self.project_root / TASKS_DIR
+        self.threshold = threshold
+        if cache_file is None:
+            cache_file = self.project_root / ".epic-workflows" / "cache" / "goal-alignment.json"
+        self.cache_file = Path(cache_file)
+        self.cache = self.load_cache()
+        self.edges_computed = 0
+
+    def load_cache(self):
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+                if cache.get("version") == CACHE_VERSION:
+                    return cache
+            except (OSError, ValueError):
+                pass
+        return {"version": CACHE_VERSION, "goals": {}, "edges": {}}
+
+    def save_cache(self):
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.cache, f, separators=(",", ":"))
+        os.replace(tmp_file, self.cache_file)
+
+    def task_goals(self, task_dir):
+        """Return the cached goal entry of a task, re-parsing INDEX.md only when it changed."""
+        index_file = task_dir / "INDEX.md"
+        key = task_dir.relative_to(self.tasks_root).as_posix()
+        try:
+            stat = os.stat(index_file)
+        except FileNotFoundError:
+            return None
+        signature = [stat.st_mtime_ns, stat.st_size]
+        cached = self.cache["goals"].get(key)
+        if cached and cached["sig"] == signature:
+            return cached
+
+        info = parse_index(index_file)
+        business, technical = info["business_goal"], info["technical_goal"]
+        entry = {
+            "sig": signature,
+            "hash": hashlib.sha1(f"{business}\0{technical}".encode("utf-8")).hexdigest()[:16],
+            "business": goal_terms(business),
+            "technical": goal_terms(technical),
+            "unclear": [name for name, text in (("business", business), ("technical", technical))
+                        if is_unclear(text)],
+        }
+        self.cache["goals"][key] = entry
+        return entry
+
+    def edge_scores(self, parent, child):
+        """Similarity of a parent/child pair, memoized on both goal hashes."""
+        key = f"{parent['hash']}:{child['hash']}"
+        cached = self.cache["edges"].get(key)
+        if cached is not None:
+            return cached
+        scores = {
+            "business": round(cosine(child["business"], parent["business"]), 4),
+            "technical": round(cosine(child["technical"], parent["technical"]), 4),
+        }
+        self.cache["edges"][key] = scores
+        self.edges_computed += 1
+        return scores
+
+    def run(self):
+        """Check every edge of the task tree. Returns a list of findings."""
+        findings = []
+        live_goals = set()
+        live_edges = set()
+
+        for task_dir, parent_dir in iter_task_dirs(self.tasks_root):
+            child = self.task_goals(task_dir)
+            live_goals.add(task_dir.relative_to(self.tasks_root).as_posix())
+            task = task_dir.relative_to(self.tasks_root).as_posix()
+            if child is None:
+                findings.append({"task": task, "issue": "missing", "detail": "INDEX.md not found"})
+                continue
+            for goal in child["unclear"]:
+                findings.append({"task": task, "issue": "unclear", "detail": f"{goal} goal is missing or a placeholder"})
+
+            if parent_dir is None:
+                continue
+            parent = self.task_goals(parent_dir)
+            if parent is None:
+                continue
+            live_edges.add(f"{parent['hash']}:{child['hash']}")
+            scores = self.edge_scores(parent, child)
+            drift = [name for name in ("business", "technical")
+                     if name not in child["unclear"] and scores[name] < self.threshold]
+            if drift:
+                findings.append({
+                    "task": task,
+                    "parent": parent_dir.relative_to(self.tasks_root).as_posix(),
+                    "issue": "drift",
+                    "detail": ", ".join(f"{name} {scores[name]:.2f}" for name in drift),
+                    "scores": scores,
+                })
+
+        # Drop entries for deleted tasks and edges that no longer exist
+        self.cache["goals"] = {k: v for k, v in self.cache["goals"].items() if k in live_goals}
+        self.cache["edges"] = {k: v for k, v in self.cache["edges"].items() if k in live_edges}
+        self.save_cache()
+        return findings
+
+
+def main():
+    """Main function to run the goal alignment checker."""
+    parser = argparse.ArgumentParser(description="Flag possible goal drift between parent and child tasks.")
+    parser.add_argument('--root', default=".", help="Project root (default: current directory)")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Minimum similarity before an edge is flagged (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument('--json', action='store_true', help="Print findings as JSON")
+    parser.add_argument('--fail-on-drift', action='store_true', help="Exit 1 when any drift is flagged")
+    args = parser.parse_args()
+
+    checker = GoalAlignmentChecker(args.root, args.threshold)
+    if not checker.tasks_root.is_dir():
+        print(f"❌ Task directory not found: {checker.tasks_root}")
+        return 1
+
+    findings = checker.run()
+    if args.json:
+        print(json.dumps(findings, indent=2))
+    else:
+        icons = {"drift": "⚠️ ", "unclear": "❓", "missing": "❌"}
+        for finding in findings:
+            against = f" vs {finding['parent']}" if "parent" in finding else ""
+            print(f"{icons[finding['issue']]} {finding['issue']}: {finding['task']}{against} — {finding['detail']}")
+        print(f"📊 {len(findings)} finding(s), {checker.edges_computed} edge(s) recomputed")
+
+    drift = any(f["issue"] == "drift" for f in findings)
+    return 1 if args.fail_on_drift and drift else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Repo-Aware Ignore Files
+
+Scans a target repository and writes tight AI-context ignore files
+(`.rooignore`, `.cursorignore`, `.clineignore`, ...) for it, instead of the fixed
+Node/Next.js list. The scan detects:
+
+- build outputs and caches – `__pycache__/`, `.tox/`, `*.egg-info/`, `dist/` or
+  `build/` next to a project manifest, Rust/Maven `target/`, any `CACHEDIR.TAG` dir
+- vendored dependencies    – `node_modules/`, Go `vendor/`, virtualenvs (`pyvenv.cfg`)
+- lockfiles                – `poetry.lock`, `go.sum`, `package-lock.json`, ...
+- large files              – binaries over 100 KB and text files over 1 MB
+
+Directories are scanned in parallel and detected trees are never descended into.
+The size/type survey (binary sniffing) is cached per file by mtime and size in
+the framework's own `framework/.cache/ignore-survey/` (one file per scanned repo),
+so reruns only sniff changed files and a print-only run never writes into the repo.
+
+Usage:
+    python3 ignore_files.py /path/to/repo                  # print the .rooignore
+    python3 ignore_files.py /path/to/repo --write          # write every ignore file
+    python3 ignore_files.py /path/to/repo --write --targets roo-code cursor
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+CACHE_VERSION = 1
+SURVEY_CACHE_DIR = Path(__file__).parent / "framework" / ".cache" / "ignore-survey"
+GENERATED_MARKER = "# Generated by ignore_files.py"
+IGNORE_FILES = {
+    "roo-code": ".rooignore",
+    "cursor": ".cursorignore",
+    "cline": ".clineignore",
+    "kilo-code": ".kilocodeignore",
+    "windsurf": ".codeiumignore",
+    "gemini-cli": ".geminiignore",
+}
+LOCKFILES = {
+    "package-lock.json", "npm-shrinkwrap.json", "yarn.lock", "pnpm-lock.yaml", "bun.lockb",
+    "poetry.lock", "Pipfile.lock", "pdm.lock", "uv.lock", "Cargo.lock", "go.sum",
+    "composer.lock", "Gemfile.lock", "mix.lock", "pubspec.lock", "packages.lock.json",
+}
+CACHE_DIRS = {
+    "__pycache__", ".pytest_cache", ".mypy_cache", ".ruff_cache", ".tox", ".nox", ".hypothesis",
+    ".gradle", ".next", ".nuxt", ".svelte-kit", ".parcel-cache", ".turbo", ".angular",
+    ".terraform", "htmlcov",
+}
+VENDOR_DIRS = {"node_modules", "bower_components", "jspm_packages", "Pods", "Carthage"}
+# Output folder name -> project manifests that make it a build output when found beside it
+BUILD_DIRS = {
+    "dist": ("package.json", "pyproject.toml", "setup.py", "setup.cfg"),
+    "build": ("package.json", "pyproject.toml", "setup.py", "setup.cfg", "build.gradle", "build.gradle.kts",
+              "CMakeLists.txt"),
+    "out": ("package.json", "build.gradle", "build.gradle.kts"),
+    "target": ("Cargo.toml", "pom.xml", "build.sbt"),
+    "coverage": ("package.json",),
+    "bin": (".csproj",),
+    "obj": (".csproj",),
+}
+# Framework working data: caches, search indexes, snapshots, the event journal and task archives
+FRAMEWORK_DATA = (".epic-workflows/cache/", ".epic-workflows/journal/", ".epic-workflows/archive/",
+                  "framework/.cache/", "framework/.store/")
+KEEP_PATHS = (".epic-workflows/tasks/", ".epic-workflows/rules/", "docs/architecture/")
+SKIP_DIRS = {".git", ".hg", ".svn"}
+BINARY_LIMIT = 100_000
+TEXT_LIMIT = 1_000_000
+SNIFF_BYTES = 8192
+EXTENSION_GROUP_MIN = 3
+# Characters with a meaning in gitignore patterns; file names containing them are escaped with \
+PATTERN_SPECIAL_RE = re.compile(r"[\\\[\]*?!#]")
+
+
+def has_manifest(names, manifests):
+    """True when a manifest file (or, for ".csproj"-style entries, any file with that suffix) is present."""
+    for manifest in manifests:
+        if manifest.startswith("."):
+            if any(name.endswith(manifest) for name in names):
+                return True
+        elif manifest in names:
+            return True
+    return False
+
+
+def classify_dir(path, name, sibling_names):
+    """Return "build", "vendor" or None for one directory."""
+    if name in CACHE_DIRS or name.endswith(".egg-info") or os.path.exists(os.path.join(path, "CACHEDIR.TAG")):
+        return "build"
+    if name in VENDOR_DIRS or os.path.exists(os.path.join(path, "pyvenv.cfg")):
+        return "vendor"
+    if name == "vendor" and ("go.mod" in sibling_names or "composer.json" in sibling_names
+                             or "Gemfile" in sibling_names or os.path.exists(os.path.join(path, "modules.txt"))):
+        return "vendor"
+    manifests = BUILD_DIRS.get(name)
+    if manifests and has_manifest(sibling_names, manifests):
+        return "build"
+    return None
+
+
+def escape_pattern(path):
+    """Escape a literal path for gitignore syntax: glob characters, `#`, `!` and trailing spaces."""
+    escaped = PATTERN_SPECIAL_RE.sub(r"\\\g<0>", path)
+    stripped = escaped.rstrip(" ")
+    return stripped + "\\ " * (len(escaped) - len(stripped))
+
+
+def is_binary(path):
+    try:
+        with open(path, "rb") as f:
+            return b"\0" in f.read(SNIFF_BYTES)
+    except OSError:
+        return False
+
+
+class RepoSurvey:
+    def __init__(self, repo_root, cache_file=None, workers=None):
+        self.repo_root = Path(repo_root).resolve()
+        if cache_file is None:
+            repo_key = hashlib.sha1(str(self.repo_root).encode("utf-8")).hexdigest()[:16]
+            cache_file = SURVEY_CACHE_DIR / f"{self.repo_root.name}-{repo_key}.json"
+        self.cache_file = Path(cache_file)
+        self.workers = workers
+        self.cache = self.load_cache()
+        self.sniffed = 0
+
+    def load_cache(self):
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+                if cache.get("version") == CACHE_VERSION:
+                    return cache
+            except (OSError, ValueError):
+                pass
+        return {"version": CACHE_VERSION, "files": {}}
+
+    def save_cache(self, files):
+        self.cache["files"] = files
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.cache, f, separators=(",", ":"))
+        os.replace(tmp_file, self.cache_file)
+
+    def scan_dir(self, relative):
+        """Survey one directory: (subdirectories to descend, findings, {large file: cache entry}, files sniffed)."""
+        folder = self.repo_root / relative if relative else self.repo_root
+        try:
+            entries = list(os.scandir(folder))
+        except OSError:
+            return [], [], {}, 0
+        names = {entry.name for entry in entries}
+        subdirs, findings, surveyed = [], [], {}
+        sniffed = 0
+        for entry in entries:
+            path = f"{relative}/{entry.name}" if relative else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in SKIP_DIRS:
+                    continue
+                kind = classify_dir(entry.path, entry.name, names)
+                if kind:
+                    findings.append((kind, path + "/", entry.name + "/"))
+                else:
+                    subdirs.append(path)
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            if entry.name in LOCKFILES:
+                findings.append(("lockfile", path, entry.name))
+                continue
+            stat = entry.stat(follow_symlinks=False)
+            extension = os.path.splitext(entry.name)[1].lower()
+            findings.append(("file", path, extension))
+            if stat.st_size < BINARY_LIMIT:
+                continue
+            cached = self.cache["files"].get(path)
+            if cached and cached[:2] == [stat.st_mtime_ns, stat.st_size]:
+                binary = cached[2]
+            else:
+                binary = is_binary(entry.path)
+                sniffed += 1
+            surveyed[path] = [stat.st_mtime_ns, stat.st_size, binary]
+            if binary or stat.st_size >= TEXT_LIMIT:
+                findings.append(("large", path, extension))
+        return subdirs, findings, surveyed, sniffed
+
+    def run(self):
+        """Scan the repository in parallel and return the survey."""
+        findings, surveyed = [], {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {pool.submit(self.scan_dir, "")}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    subdirs, dir_findings, dir_surveyed, sniffed = future.result()
+                    self.sniffed += sniffed
+                    findings += dir_findings
+                    surveyed.update(dir_surveyed)
+                    pending |= {pool.submit(self.scan_dir, subdir) for subdir in subdirs}
+        self.save_cache(surveyed)
+        return build_rules(findings)
+
+
+def build_rules(findings):
+    """Turn scan findings into ignore patterns grouped by category."""
+    by_kind = {"build": [], "vendor": [], "lockfile": [], "large": []}
+    extension_counts = {}
+    for kind, path, key in findings:
+        if kind == "file":
+            extension_counts[key] = extension_counts.get(key, 0) + 1
+        else:
+            by_kind[kind].append((path, key))
+
+    def collapse(items):
+        """Names found in several places become one unanchored pattern; single hits stay anchored."""
+        counts = {}
+        for _, name in items:
+            counts[name] = counts.get(name, 0) + 1
+        patterns = {escape_pattern(name) if counts[name] > 1 else f"/{escape_pattern(path)}" for path, name in items}
+        return sorted(patterns)
+
+    large_by_extension = {}
+    for path, extension in by_kind["large"]:
+        large_by_extension.setdefault(extension, []).append(path)
+    large = []
+    for extension, paths in large_by_extension.items():
+        # Every file of this type is large: ignore the type instead of listing each file
+        if extension and len(paths) >= EXTENSION_GROUP_MIN and len(paths) == extension_counts.get(extension):
+            large.append(f"*{escape_pattern(extension)}")
+        else:
+            large += [f"/{escape_pattern(path)}" for path in paths]
+
+    return {
+        "Build outputs and caches": collapse(by_kind["build"]),
+        "Vendored dependencies": collapse(by_kind["vendor"]),
+        "Lockfiles": sorted({escape_pattern(name) for _, name in by_kind["lockfile"]}),
+        "Large and binary files": sorted(large),
+        "files_scanned": sum(extension_counts.values()),
+    }
+
+
+def render_ignore_file(rules, target="roo-code"):
+    """Render the ignore file of one IDE (gitignore syntax) from the scan rules."""
+    lines = [
+        f"{GENERATED_MARKER} for {IGNORE_FILES[target]}; rerun it to refresh.",
+        "# Excludes generated, vendored and bulky files from AI context.",
+        "",
+    ]
+    for section, patterns in rules.items():
+        if section == "files_scanned" or not patterns:
+            continue
+        lines += [f"# {section}"] + patterns + [""]
+    lines += ["# AI Epic Framework generated data"] + list(FRAMEWORK_DATA) + [""]
+    lines += ["# AI Epic Framework (always kept in context)"] + [f"!{path}" for path in KEEP_PATHS]
+    return "\n".join(lines) + "\n"
+
+
+def write_ignore_files(repo_root, rules, targets, force=False):
+    """Write ignore files into the repo root. Returns [(path, status)]; hand-written files are kept unless forced."""
+    results = []
+    for target in targets:
+        path = Path(repo_root) / IGNORE_FILES[target]
+        content = render_ignore_file(rules, target)
+        if path.exists():
+            current = path.read_text(encoding="utf-8", errors="replace")
+            if current == content:
+                results.append((path, "unchanged"))
+                continue
+            if not current.startswith(GENERATED_MARKER) and not force:
+                results.append((path, "kept (not generated; use --force)"))
+                continue
+        path.write_text(content, encoding="utf-8")
+        results.append((path, "written"))
+    return results
+
+
+def main():
+    """Scan a repository and print or write its AI-context ignore files."""
+    parser = argparse.ArgumentParser(description="Generate repo-aware AI-context ignore files.")
+    parser.add_argument('repo', nargs='?', default=".", help="Repository to scan (default: current directory)")
+    parser.add_argument('--targets', nargs='+', choices=list(IGNORE_FILES), default=list(IGNORE_FILES),
+                        help="IDEs to write ignore files for (default: all)")
+    parser.add_argument('--write', action='store_true',
+                        help="Write the ignore files into the repository root (default: print the first target's)")
+    parser.add_argument('--force', action='store_true', help="Overwrite ignore files that were not generated")
+    parser.add_argument('--workers', type=int, default=None, help="Parallel scan threads")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.repo):
+        print(f"❌ Not a directory: {args.repo}", file=sys.stderr)
+        return 1
+    survey = RepoSurvey(args.repo, workers=args.workers)
+    rules = survey.run()
+    if not args.write:
+        print(render_ignore_file(rules, args.targets[0]), end="")
+        return 0
+    for path, status in write_ignore_files(survey.repo_root, rules, args.targets, args.force):
+        print(f"{'⚠️ ' if status.startswith('kept') else '✅'} {path.name}: {status}")
+    counts = {section: len(patterns) for section, patterns in rules.items() if section != "files_scanned"}
+    print(f"📊 Scanned {rules['files_scanned']:,} files ({survey.sniffed} sniffed): "
+          + ", ".join(f"{count} {section.lower()}" for section, count in counts.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Prompt-Cache Layout
+
+Model providers cache long, byte-identical prompt prefixes. In the standard
+layout every IDE prompt file opens with its own header ("AI Epic Framework -
+Roo Code Rules", ...) before the shared user rules, so no two targets share more
+than a few bytes. The `cache` layout (`create_ide_adaptations.py --layout cache`)
+puts a versioned shared core first instead:
+
+    <!-- ai-epic-framework shared-core v1 sha256:<12 hex> -->
+
+    <framework/generic/user-rules-template.md, verbatim>
+
+and appends the IDE-specific text after it. Required frontmatter (Cursor's
+`.mdc` YAML block) stays on top; IDEs strip it before the text reaches the model,
+so the report below measures prefixes after it.
+
+`create_ide_adaptations.py prefix` prints how many leading bytes each target's
+prompt file shares with the others and with the shared core.
+"""
+
+import hashlib
+import os
+
+CORE_VERSION = 1
+LAYOUTS = ("standard", "cache")
+DEFAULT_LAYOUT = "standard"
+BYTES_PER_TOKEN = 4  # rough size estimate for English Markdown
+
+
+def shared_core(user_rules):
+    """The byte-identical opening of every prompt file in the cache layout."""
+    data = user_rules.encode("utf-8") if isinstance(user_rules, str) else user_rules
+    banner = f"<!-- ai-epic-framework shared-core v{CORE_VERSION} sha256:{hashlib.sha256(data).hexdigest()[:12]} -->"
+    return banner.encode("utf-8") + b"\n\n" + data
+
+
+def strip_frontmatter(data):
+    """Drop a leading YAML frontmatter block (`---` ... `---`)."""
+    if data.startswith(b"---\n"):
+        end = data.find(b"\n---\n", 3)
+        if end != -1:
+            return data[end + 5:].lstrip(b"\n")
+    return data
+
+
+def prefix_report(prompts, core=None):
+    """Shared-prefix stats of {ide: (path, bytes)}: the common prefix of all targets and per-target rows."""
+    bodies = {ide_name: strip_frontmatter(data) for ide_name, (_, data) in prompts.items()}
+    common = len(os.path.commonprefix(list(bodies.values()))) if bodies else 0
+    rows = []
+    for ide_name, (path, _) in sorted(prompts.items()):
+        body = bodies[ide_name]
+        others = [other for name, other in bodies.items() if name != ide_name]
+        best = max((len(os.path.commonprefix([body, other])) for other in others), default=0)
+        rows.append({
+            "ide": ide_name,
+            "path": path,
+            "bytes": len(body),
+            "common_prefix": common,
+            "best_shared_prefix": best,
+            "core_prefix": len(os.path.commonprefix([body, core])) if core is not None else None,
+        })
+    return {"common_prefix": common, "common_prefix_tokens": common // BYTES_PER_TOKEN, "targets": rows}
+
+
+def format_report(report, layout):
+    lines = [
+        f"📊 Prompt prefix report ({layout} layout, shared core v{CORE_VERSION})",
+        f"   Common prefix across all targets: {report['common_prefix']:,} bytes "
+        f"(~{report['common_prefix_tokens']:,} tokens)",
+        "",
+        f"   {'IDE':<26} {'Prompt file':<42} {'Bytes':>8} {'Shared':>8} {'Core':>8} {'Common':>7}",
+    ]
+    for row in report["targets"]:
+        share = 100 * row["common_prefix"] // row["bytes"] if row["bytes"] else 0
+        core = "-" if row["core_prefix"] is None else f"{row['core_prefix']:,}"
+        lines.append(f"   {row['ide']:<26} {row['path']:<42} {row['bytes']:>8,} {row['best_shared_prefix']:>8,} "
+                     f"{core:>8} {share:>6}%")
+    return "\n".join(lines)
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Task Archive
+
+Moves fully Completed Initiative and Epic subtrees out of `.epic-workflows/tasks/`
+so directory listings and `find`/`grep` recipes stop paying for finished work.
+A subtree is archived when its own INDEX.md and every descendant's INDEX.md say
+Completed. Each subtree becomes one compressed zip in `.epic-workflows/archive/`
+(member paths relative to the tasks folder), and `.epic-workflows/archive/index.json`
+records its tasks – path, title, status, dates and requirement count – so
+archived work can be listed and searched without opening any archive. Zip
+members are compressed individually, so `show` reads one file without
+unpacking the rest.
+
+The parent's INDEX.md keeps a one-line stub under `## Archived` and its Subtasks
+row's Location becomes `<folder> (archived)`, both patched under the same file
+lock as `task_update.py`; archived Initiatives are listed in
+`.epic-workflows/tasks/ARCHIVED.md`. `restore` unpacks a subtree back in place,
+puts the original Subtasks row back and removes the stub (and the section once
+it is empty).
+
+Usage:
+    python3 task_archive.py archive --all --dry-run
+    python3 task_archive.py archive Initiative_1_auth/Epic_1_oauth
+    python3 task_archive.py list
+    python3 task_archive.py search oauth
+    python3 task_archive.py show Initiative_1_auth/Epic_1_oauth/INDEX.md
+    python3 task_archive.py restore Initiative_1_auth/Epic_1_oauth
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from task_hierarchy import TASKS_DIR, iter_task_dirs, parse_index, parse_requirements, parse_task_dir_name
+from task_update import UpdateError, patch_file, subtask_patcher
+
+INDEX_VERSION = 1
+ARCHIVE_DIR = ".epic-workflows/archive"
+ARCHIVABLE_TYPES = ("Initiative", "Epic")
+ARCHIVED_SECTION = "Archived"
+ROOT_STUB_FILE = "ARCHIVED.md"
+ROOT_STUB_TITLE = "# Archived Initiatives\n"
+COMPLETED = "Completed"
+
+
+class ArchiveError(ValueError):
+    """A subtree that cannot be archived or restored."""
+
+
+def archive_name(task):
+    """`Initiative_1_auth--Epic_1_oauth.zip` for `Initiative_1_auth/Epic_1_oauth`."""
+    return task.replace("/", "--") + ".zip"
+
+
+def stub_line(task, archive_file):
+    name = task.rsplit("/", 1)[-1]
+    return (f"- {name}: archived {datetime.now().strftime('%Y-%m-%d')} to `{ARCHIVE_DIR}/{archive_file}` "
+            f"(restore: `python3 task_archive.py restore {task}`)\n")
+
+
+def archived_location(name):
+    return f"{name} (archived)"
+
+
+def subtask_row(lines, location):
+    """Line number of the Subtasks row whose Location (or Name) is `location`, or None."""
+    try:
+        patched = subtask_patcher(location, "Location", "")(list(lines))
+    except UpdateError:
+        return None
+    return next((number for number, (old, new) in enumerate(zip(lines, patched)) if old != new), None)
+
+
+def stub_patcher(name, line):
+    """Point the Subtasks row at the archive and add a stub line to the `## Archived` section.
+
+    The section is created at the end of the file if needed.
+    """
+    heading = f"## {ARCHIVED_SECTION}".encode("utf-8")
+    data = line.encode("utf-8")
+
+    def patch(lines):
+        if subtask_row(lines, name) is not None:
+            lines = subtask_patcher(name, "Location", archived_location(name))(lines)
+        name_prefix = data.split(b":", 1)[0]
+        lines = [existing for existing in lines if existing.split(b":", 1)[0] != name_prefix]
+        for number, existing in enumerate(lines):
+            if existing.rstrip() == heading:
+                end = number + 1
+                while end < len(lines) and not lines[end].startswith(b"## "):
+                    end += 1
+                while end > number + 1 and not lines[end - 1].strip():
+                    end -= 1
+                return lines[:end] + [data] + lines[end:]
+        if lines and not lines[-1].endswith(b"\n"):
+            lines[-1] += b"\n"
+        if lines and lines[-1].strip():
+            lines.append(b"\n")
+        return lines + [heading + b"\n", data]
+    return patch
+
+
+def unstub_patcher(name, row=None):
+    """Remove the stub line of one archived subtree and put its Subtasks row back.
+
+    `row` is the original row text saved at archive time. An `## Archived` section
+    left without stubs is removed along with the blank line added before it.
+    """
+    prefix = f"- {name}:".encode("utf-8")
+    heading = f"## {ARCHIVED_SECTION}".encode("utf-8")
+
+    def patch(lines):
+        lines = [line for line in lines if not line.startswith(prefix)]
+        number = subtask_row(lines, archived_location(name))
+        if number is not None:
+            if row is not None:
+                lines[number] = row.encode("utf-8")
+            else:
+                lines = subtask_patcher(archived_location(name), "Location", name)(lines)
+        for start, line in enumerate(lines):
+            if line.rstrip() != heading:
+                continue
+            end = start + 1
+            while end < len(lines) and not lines[end].startswith(b"## "):
+                if lines[end].strip():
+                    return lines
+                end += 1
+            if end == len(lines) and start > 0 and not lines[start - 1].strip():
+                start -= 1
+            return lines[:start] + lines[end:]
+        return lines
+    return patch
+
+
+class TaskArchive:
+    def __init__(self, root="."):
+        self.root = Path(root)
+        self.tasks_root = self.root / TASKS_DIR
+        self.archive_dir = self.root / ARCHIVE_DIR
+        self.index_file = self.archive_dir / "index.json"
+        self.index = self.load_index()
+
+    def load_index(self):
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+                if index.get("version") == INDEX_VERSION:
+                    return index
+            except (OSError, ValueError):
+                pass
+        return {"version": INDEX_VERSION, "archives": {}}
+
+    def save_index(self):
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.index_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, self.index_file)
+
+    def relative(self, task_dir):
+        return Path(task_dir).relative_to(self.tasks_root).as_posix()
+
+    def status(self, task_dir):
+        index_file = task_dir / "INDEX.md"
+        return parse_index(index_file)["status"] if index_file.exists() else ""
+
+    def subtree(self, task_dir):
+        """The task folder and all task folders below it."""
+        return [task_dir] + [task for task, _ in iter_task_dirs(task_dir)]
+
+    def fully_completed(self, task_dir):
+        return all(self.status(task) == COMPLETED for task in self.subtree(task_dir))
+
+    def candidates(self):
+        """Top-most fully Completed Initiative/Epic folders (an archived Initiative covers its Epics)."""
+        selected = []
+        for task, _ in iter_task_dirs(self.tasks_root):
+            if any(parent in task.parents for parent in selected):
+                continue
+            if parse_task_dir_name(task.name)[0] in ARCHIVABLE_TYPES and self.fully_completed(task):
+                selected.append(task)
+        return selected
+
+    def describe(self, task_dir):
+        """Index metadata of one task folder."""
+        info = parse_index(task_dir / "INDEX.md")
+        requirements_file = task_dir / "REQUIREMENTS.md"
+        requirements = parse_requirements(requirements_file)["requirements"] if requirements_file.exists() else []
+        return {
+            "path": self.relative(task_dir),
+            "title": info["title"],
+            "status": info["status"],
+            "created": info["created"],
+            "updated": info["updated"],
+            "requirements": len(requirements),
+        }
+
+    def archive(self, task_dir, dry_run=False):
+        """Zip one fully Completed subtree, index it, stub it in the parent and remove it. Returns its entry."""
+        task_dir = Path(task_dir)
+        parsed = parse_task_dir_name(task_dir.name)
+        if parsed is None or parsed[0] not in ARCHIVABLE_TYPES:
+            raise ArchiveError(f"Only {' and '.join(ARCHIVABLE_TYPES)} folders can be archived: {task_dir.name}")
+        if not self.fully_completed(task_dir):
+            raise ArchiveError(f"{self.relative(task_dir)} has tasks that are not {COMPLETED}")
+        task = self.relative(task_dir)
+        files = sorted(path for path in task_dir.rglob("*") if path.is_file())
+        entry = {
+            "file": archive_name(task),
+            "archived": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "files": len(files),
+            "bytes": sum(path.stat().st_size for path in files),
+            "tasks": [self.describe(task) for task in self.subtree(task_dir)],
+        }
+        if dry_run:
+            return entry
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        archive_file = self.archive_dir / entry["file"]
+        tmp_file = archive_file.with_suffix(".tmp")
+        with zipfile.ZipFile(tmp_file, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as archive:
+            for path in files:
+                archive.write(path, self.relative(path))
+        with zipfile.ZipFile(tmp_file) as archive:
+            if archive.testzip() is not None or len(archive.namelist()) != len(files):
+                raise ArchiveError(f"Archive check failed for {task}; nothing was removed")
+        os.replace(tmp_file, archive_file)
+        with open(archive_file, "rb") as f:
+            entry["sha256"] = hashlib.sha256(f.read()).hexdigest()
+        entry["compressed_bytes"] = archive_file.stat().st_size
+
+        # Index and stub first, delete last: an interrupted run leaves the live tree in place
+        stub_file = self.stub_file(task_dir, create=True)
+        with open(stub_file, "rb") as f:
+            lines = f.read().splitlines(keepends=True)
+        number = subtask_row(lines, task_dir.name)
+        entry["row"] = lines[number].decode("utf-8") if number is not None else None
+        self.index["archives"][task] = entry
+        self.save_index()
+        patch_file(stub_file, stub_patcher(task_dir.name, stub_line(task, entry["file"])))
+        shutil.rmtree(task_dir)
+        return entry
+
+    def stub_file(self, task_dir, create=False):
+        """The parent INDEX.md, or ARCHIVED.md in the tasks folder for an Initiative."""
+        parent = Path(task_dir).parent
+        if parse_task_dir_name(parent.name):
+            return parent / "INDEX.md"
+        stub_file = self.tasks_root / ROOT_STUB_FILE
+        if create and not stub_file.exists():
+            stub_file.write_text(ROOT_STUB_TITLE, encoding="utf-8")
+        return stub_file
+
+    def restore(self, task):
+        """Unpack an archived subtree back into the task tree and drop its stub and index entry."""
+        entry = self.index["archives"].get(task)
+        if entry is None:
+            raise ArchiveError(f"Not archived: {task}")
+        target = self.tasks_root / task
+        if target.exists():
+            raise ArchiveError(f"{target} already exists; move it away before restoring")
+        if parse_task_dir_name(target.parent.name) and not target.parent.is_dir():
+            raise ArchiveError(f"Restore {self.relative(target.parent)} first")
+        root = self.tasks_root.resolve()
+        with zipfile.ZipFile(self.archive_dir / entry["file"]) as archive:
+            for name in archive.namelist():
+                destination = (root / name).resolve()
+                if root not in destination.parents or not name.startswith(task + "/"):
+                    raise ArchiveError(f"Refusing to extract {name} outside {task}")
+            archive.extractall(root)
+        stub_file = self.stub_file(target)
+        if stub_file.exists():
+            patch_file(stub_file, unstub_patcher(target.name, entry.get("row")))
+            if stub_file.name == ROOT_STUB_FILE and stub_file.read_text(encoding="utf-8") == ROOT_STUB_TITLE:
+                stub_file.unlink()
+        del self.index["archives"][task]
+        self.save_index()
+        (self.archive_dir / entry["file"]).unlink()
+        return entry
+
+    def search(self, text, content=False):
+        """Archived tasks whose path or title contains `text`; with `content`, also matching archived files."""
+        needle = text.lower()
+        matches = []
+        for task, entry in sorted(self.index["archives"].items()):
+            for info in entry["tasks"]:
+                if needle in info["path"].lower() or needle in info["title"].lower():
+                    matches.append((info["path"], info["title"]))
+            if not content:
+                continue
+            with zipfile.ZipFile(self.archive_dir / entry["file"]) as archive:
+                for name in archive.namelist():
+                    for number, line in enumerate(archive.read(name).decode("utf-8", errors="replace").splitlines(), 1):
+                        if needle in line.lower():
+                            matches.append((f"{name}:{number}", line.strip()))
+        return matches
+
+    def read(self, path):
+        """One archived file's bytes, e.g. `Initiative_1_auth/Epic_1_oauth/INDEX.md`."""
+        for task, entry in self.index["archives"].items():
+            if path.startswith(task + "/"):
+                with zipfile.ZipFile(self.archive_dir / entry["file"]) as archive:
+                    try:
+                        return archive.read(path)
+                    except KeyError:
+                        break
+        raise ArchiveError(f"Not in the archive: {path}")
+
+
+def main():
+    """Main function to archive, query and restore completed task subtrees."""
+    parser = argparse.ArgumentParser(description="Archive fully Completed Initiative/Epic task subtrees.")
+    parser.add_argument('--root', default=".", help="Project root (default: current directory)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    archive_parser = subparsers.add_parser('archive', help="Archive completed subtrees")
+    archive_parser.add_argument('tasks', nargs='*', help="Task paths relative to .epic-workflows/tasks")
+    archive_parser.add_argument('--all', action='store_true', help="Archive every fully Completed Initiative/Epic")
+    archive_parser.add_argument('--dry-run', action='store_true', help="Only list what would be archived")
+    subparsers.add_parser('list', help="List archived subtrees")
+    search_parser = subparsers.add_parser('search', help="Search archived task paths and titles")
+    search_parser.add_argument('text')
+    search_parser.add_argument('--content', action='store_true', help="Also search inside archived files")
+    show_parser = subparsers.add_parser('show', help="Print one archived file")
+    show_parser.add_argument('path', help="File path relative to .epic-workflows/tasks")
+    restore_parser = subparsers.add_parser('restore', help="Restore an archived subtree")
+    restore_parser.add_argument('task', help="Archived task path relative to .epic-workflows/tasks")
+    args = parser.parse_args()
+
+    archive = TaskArchive(args.root)
+    if not archive.tasks_root.is_dir():
+        print(f"❌ Task directory not found: {archive.tasks_root}")
+        return 1
+
+    try:
+        if args.command == 'archive':
+            if args.all:
+                targets = archive.candidates()
+            elif args.tasks:
+                targets = [archive.tasks_root / task for task in args.tasks]
+            else:
+                print("❌ Name task paths to archive or pass --all")
+                return 1
+            if not targets:
+                print("✅ Nothing to archive")
+            for task_dir in targets:
+                entry = archive.archive(task_dir, args.dry_run)
+                task = archive.relative(task_dir)
+                if args.dry_run:
+                    print(f"🔎 Would archive {task}: {len(entry['tasks'])} task(s), {entry['files']} file(s), "
+                          f"{entry['bytes']:,} bytes")
+                else:
+                    print(f"📦 Archived {task}: {len(entry['tasks'])} task(s), {entry['bytes']:,} → "
+                          f"{entry['compressed_bytes']:,} bytes in {entry['file']}")
+        elif args.command == 'list':
+            archives = archive.index["archives"]
+            print(f"📦 {len(archives)} archived subtree(s)")
+            for task, entry in sorted(archives.items()):
+                print(f"   {task} ({len(entry['tasks'])} task(s), archived {entry['archived'][:10]}) → {entry['file']}")
+        elif args.command == 'search':
+            matches = archive.search(args.text, args.content)
+            for location, text in matches:
+                print(f"{location}: {text}")
+            if not matches:
+                print(f"⚠️  No archived match for '{args.text}'")
+        elif args.command == 'show':
+            sys.stdout.write(archive.read(args.path).decode("utf-8", errors="replace"))
+        else:
+            entry = archive.restore(args.task)
+            print(f"✅ Restored {args.task}: {len(entry['tasks'])} task(s)")
+    except (ArchiveError, UpdateError, OSError, zipfile.BadZipFile) as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Task History Backfill
+
+Reconstructs task status transitions from local git history and writes them to
+the task event journal (`.epic-workflows/journal/git-history.jsonl`), next to
+the live `events.jsonl` that `task_update.py` maintains, so `task_journal.py
+report` covers work done before the journal existed.
+
+History is read with a single streaming `git log -p -U0` over every
+`.epic-workflows/tasks/**/INDEX.md` (one pathspec, oldest commit first) rather
+than one git call per file. For each commit and INDEX.md the removed and added
+`**Status**` lines give the transition and an added `**Updated**` line its
+recorded time (read in the author's UTC offset and converted to UTC; the commit
+time when there is none); new files start from no status. The last commit read is saved in
+`.epic-workflows/cache/git-history.json`, so reruns only read newer commits; if
+history was rewritten below that commit the backfill starts over.
+
+Usage:
+    python3 task_backfill.py
+    python3 task_backfill.py --rebuild
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from task_hierarchy import STATUS_RE, TASKS_DIR
+from task_journal import JOURNAL_DIR, append_events
+
+CACHE_VERSION = 2
+CURSOR_FILE = ".epic-workflows/cache/git-history.json"
+HISTORY_FILE = "git-history.jsonl"
+COMMIT_MARKER = b"\x1e"
+FLUSH_EVENTS = 10000
+UPDATED_PREFIX = "**Updated**:"
+UPDATED_FORMAT = "%Y-%m-%d %H:%M"
+TS_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+TASKS_MARKER = TASKS_DIR + "/"
+
+
+class GitError(RuntimeError):
+    """git is missing or the project is not inside a git repository."""
+
+
+def run_git(root, *args, check=True):
+    try:
+        result = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True)
+    except FileNotFoundError:
+        raise GitError("git is not installed")
+    if check and result.returncode != 0:
+        raise GitError(result.stderr.strip() or f"git {args[0]} failed")
+    return result
+
+
+def task_path(diff_path):
+    """`Initiative_1_auth/Epic_1_oauth` for `.../.epic-workflows/tasks/Initiative_1_auth/Epic_1_oauth/INDEX.md`."""
+    position = diff_path.find(TASKS_MARKER)
+    if position == -1:
+        return None
+    return diff_path[position + len(TASKS_MARKER):].rsplit("/", 1)[0]
+
+
+def parse_offset(offset):
+    """timedelta of a git `+0130` / `-0800` UTC offset (zero when malformed)."""
+    if len(offset) != 5 or offset[0] not in "+-" or not offset[1:].isdigit():
+        return timedelta(0)
+    delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[3:]))
+    return -delta if offset[0] == "-" else delta
+
+
+def updated_ts(updated, offset):
+    """UTC journal timestamp of an `**Updated**: YYYY-MM-DD HH:MM` stamp written at `offset`, or None."""
+    try:
+        local = datetime.strptime(updated, UPDATED_FORMAT)
+    except ValueError:
+        return None
+    return (local - offset).strftime(TS_FORMAT)
+
+
+def commit_events(commit, timestamp, offset, files):
+    """Status transitions of one commit from {task: [removed status, added status, updated, new file]}.
+
+    Each event is timed by the task's added `**Updated**` stamp, so transitions committed
+    together (or long after `task_update.py` journaled them) keep the time they were made.
+    """
+    commit_ts = datetime.fromtimestamp(timestamp, timezone.utc).strftime(TS_FORMAT)
+    events = []
+    for task, (removed, added, updated, new_file) in files.items():
+        if added is None or added == removed or (removed is None and not new_file):
+            continue
+        ts = (updated and updated_ts(updated, offset)) or commit_ts
+        events.append({"ts": ts, "task": task, "from": removed, "to": added, "source": "git", "commit": commit[:12]})
+    return events
+
+
+def iter_history(lines):
+    """Parse `git log -p` output into (commit, status transition events) pairs, oldest first."""
+    commit = None
+    timestamp = 0
+    offset = timedelta(0)
+    files = {}
+    task = None
+    for raw in lines:
+        if raw.startswith(COMMIT_MARKER):
+            if commit is not None:
+                yield commit, commit_events(commit, timestamp, offset, files)
+            # `<hash> <author time> <author date with its UTC offset last>`
+            fields = raw[1:].decode("ascii", errors="replace").split()
+            commit = fields[0]
+            timestamp = int(fields[1]) if len(fields) > 1 and fields[1].isdigit() else 0
+            offset = parse_offset(fields[-1]) if len(fields) > 2 else timedelta(0)
+            files = {}
+            task = None
+            continue
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        if line.startswith("diff --git "):
+            # `diff --git a/<path> b/<path>`: the destination path follows the last " b/"
+            task = task_path(line[line.rfind(" b/") + 3:])
+            if task is not None:
+                files[task] = [None, None, None, False]
+            continue
+        if task is None:
+            continue
+        state = files[task]
+        if line.startswith("new file mode"):
+            state[3] = True
+        elif line.startswith(("-**", "+**")):
+            text = line[1:]
+            match = STATUS_RE.match(text)
+            if match:
+                state[0 if line[0] == "-" else 1] = match.group(1)
+            elif line[0] == "+" and text.startswith(UPDATED_PREFIX):
+                state[2] = text[len(UPDATED_PREFIX):].strip()
+    if commit is not None:
+        yield commit, commit_events(commit, timestamp, offset, files)
+
+
+class HistoryBackfill:
+    def __init__(self, root=".", cursor_file=None, journal_file=None):
+        self.root = Path(root)
+        self.cursor_file = Path(cursor_file) if cursor_file else self.root / CURSOR_FILE
+        self.journal_file = Path(journal_file) if journal_file else self.root / JOURNAL_DIR / HISTORY_FILE
+        self.cursor = self.load_cursor()
+        self.commits = 0
+        self.events = 0
+
+    def load_cursor(self):
+        if self.cursor_file.exists():
+            try:
+                with open(self.cursor_file, "r", encoding="utf-8") as f:
+                    cursor = json.load(f)
+                if cursor.get("version") == CACHE_VERSION:
+                    return cursor
+            except (OSError, ValueError):
+                pass
+        return {"version": CACHE_VERSION, "commit": None, "events": 0}
+
+    def save_cursor(self, commit):
+        self.cursor["commit"] = commit
+        self.cursor["events"] = self.cursor.get("events", 0) + self.events
+        self.cursor_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cursor_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.cursor, f, indent=2)
+        os.replace(tmp_file, self.cursor_file)
+
+    def reset(self):
+        self.cursor = {"version": CACHE_VERSION, "commit": None, "events": 0}
+        if self.journal_file.exists():
+            self.journal_file.unlink()
+
+    def run(self, rebuild=False):
+        """Read commits after the cursor and append their transitions. Returns the new HEAD or None."""
+        head = run_git(self.root, "rev-parse", "--verify", "-q", "HEAD", check=False).stdout.strip()
+        if not head:
+            return None
+        since = self.cursor.get("commit")
+        if not since or rebuild or run_git(self.root, "merge-base", "--is-ancestor", since, head,
+                                           check=False).returncode != 0:
+            # No cursor (first run or an older cursor version), rebuild requested, or the cursor
+            # commit is gone (rebase, reset): start over
+            self.reset()
+            since = None
+        if since == head:
+            return head
+
+        command = ["git", "-c", "core.quotepath=off", "log", "--reverse", "--no-color", "--no-ext-diff",
+                   "--no-textconv", "-p", "-U0", "--format=%x1e%H %at %ai",
+                   f"{since}..{head}" if since else head, "--", f":(glob){TASKS_DIR}/**/INDEX.md"]
+        pending = []
+        # stderr goes to a file: a second pipe could fill up and stall git while stdout is streamed
+        with tempfile.TemporaryFile() as errors:
+            with subprocess.Popen(command, cwd=self.root, stdout=subprocess.PIPE, stderr=errors) as process:
+                for _, events in iter_history(process.stdout):
+                    pending += events
+                    self.commits += 1
+                    if len(pending) >= FLUSH_EVENTS:
+                        append_events(self.journal_file, pending)
+                        self.events += len(pending)
+                        pending = []
+            if process.returncode != 0:
+                errors.seek(0)
+                message = errors.read().decode("utf-8", errors="replace").strip()
+                raise GitError(f"git log exited with status {process.returncode}: {message or 'no error output'}")
+        append_events(self.journal_file, pending)
+        self.events += len(pending)
+        # The cursor only moves once the events are in the journal; a crash in between re-reads
+        # those commits, and the journal analytics tolerate the duplicate events
+        self.save_cursor(head)
+        return head
+
+
+def main():
+    """Main function to backfill the task journal from git history."""
+    parser = argparse.ArgumentParser(description="Backfill task status history from git into the task journal.")
+    parser.add_argument('--root', default=".", help="Project root inside a git repository (default: current directory)")
+    parser.add_argument('--rebuild', action='store_true', help="Discard the saved cursor and read the whole history")
+    args = parser.parse_args()
+
+    if not (Path(args.root) / TASKS_DIR).is_dir():
+        print(f"❌ Task directory not found: {Path(args.root) / TASKS_DIR}")
+        return 1
+    backfill = HistoryBackfill(args.root)
+    try:
+        head = backfill.run(args.rebuild)
+    except GitError as e:
+        print(f"❌ {e}")
+        return 1
+    if head is None:
+        print("⚠️  No commits yet; nothing to backfill")
+        return 0
+    if not backfill.commits:
+        print(f"✅ Up to date at {head[:12]}")
+        return 0
+    print(f"✅ Read {backfill.commits:,} commit(s) up to {head[:12]}: {backfill.events:,} status transition(s) "
+          f"appended to {backfill.journal_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
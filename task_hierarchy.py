@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Task Hierarchy Parser
+
+Shared helpers for reading the `.epic-workflows/tasks/` tree described in
+epic-workflow-instructions.md. Task folders follow
+`[TASK_TYPE]_[NUMBER]_[TASK_NAME]` (Initiative → Epic → Phase → Step) and each
+contains an INDEX.md and a REQUIREMENTS.md built from the framework templates.
+
+Running this module directly prints the parsed hierarchy as an indented tree.
+"""
+
+import argparse
+import os
+import re
+import sys
+from pathlib import Path
+
+TASKS_DIR = ".epic-workflows/tasks"
+TASK_TYPES = ("Initiative", "Epic", "Phase", "Step")
+TASK_DIR_RE = re.compile(r"^(Initiative|Epic|Phase|Step)_(\d+)_(.+)$")
+STATUS_RE = re.compile(r"^\*\*Status\*\*:\s*(.*?)\s*$")
+FIELD_RE = re.compile(r"^\*\*(Created|Updated)\*\*:\s*(.*?)\s*$")
+ARCH_REF_RE = re.compile(r"(docs/architecture/[^\s`\]\)\[,;]*)")
+REQUIREMENT_RE = re.compile(r"^\s*-\s*\*\*([A-Z]{2,3}-\d+)(?::\s*(.*?))?\*\*\s*$")
+REQUIREMENT_FIELD_RE = re.compile(r"^\s*-\s*\*\*(Status|Dependencies)\*\*:\s*(.*?)\s*$")
+
+BUSINESS_GOAL = "Business/Product Goal"
+TECHNICAL_GOAL = "Technical Goal"
+
+
+def parse_task_dir_name(name):
+    """Split `Epic_2_user-profile` into ("Epic", 2, "user-profile"), or None."""
+    match = TASK_DIR_RE.match(name)
+    if not match:
+        return None
+    return match.group(1), int(match.group(2)), match.group(3)
+
+
+def split_sections(text):
+    """Split Markdown into an ordered {`##` heading: body} dict, ignoring fenced code.
+
+    Text before the first `##` heading is stored under the empty key.
+    """
+    sections = {"": []}
+    current = ""
+    in_fence = False
+    for line in text.splitlines():
+        if line.strip().startswith("```"):
+            in_fence = not in_fence
+        if not in_fence and line.startswith("## "):
+            current = line[3:].strip()
+            sections.setdefault(current, [])
+            continue
+        sections[current].append(line)
+    return {heading: "\n".join(lines).strip() for heading, lines in sections.items()}
+
+
+def read_text(path):
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
+def parse_index(path):
+    """Parse a task INDEX.md into its status, dates, goals, references and subtasks."""
+    text = read_text(path)
+    sections = split_sections(text)
+    info = {
+        "title": "",
+        "status": "",
+        "created": "",
+        "updated": "",
+        "business_goal": sections.get(BUSINESS_GOAL, ""),
+        "technical_goal": sections.get(TECHNICAL_GOAL, ""),
+        "architecture_refs": architecture_refs(sections.get("Architecture References", "")),
+        "subtasks": parse_table(sections.get("Subtasks", "")),
+        "sections": sections,
+    }
+    for line in sections[""].splitlines():
+        stripped = line.strip()
+        if not info["title"] and stripped.startswith("# "):
+            info["title"] = stripped[2:].strip()
+        match = STATUS_RE.match(stripped)
+        if match and not info["status"]:
+            info["status"] = match.group(1)
+        match = FIELD_RE.match(stripped)
+        if match:
+            info[match.group(1).lower()] = match.group(2)
+    return info
+
+
+def parse_requirements(path):
+    """Parse REQUIREMENTS.md into its sections and FR/TR/... items with status and dependencies."""
+    text = read_text(path)
+    requirements = []
+    current = None
+    in_fence = False
+    for line in text.splitlines():
+        if line.strip().startswith("```"):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        match = REQUIREMENT_RE.match(line)
+        if match:
+            current = {"id": match.group(1), "name": match.group(2) or "", "status": "", "dependencies": ""}
+            requirements.append(current)
+            continue
+        match = REQUIREMENT_FIELD_RE.match(line)
+        if match and current is not None:
+            current[match.group(1).lower()] = match.group(2)
+    sections = split_sections(text)
+    return {
+        "sections": sections,
+        "requirements": requirements,
+        "architecture_refs": architecture_refs(text),
+    }
+
+
+def parse_table(text):
+    """Parse the first Markdown table in `text` into a list of row dicts."""
+    rows = []
+    header = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped.startswith("|"):
+            if header is not None:
+                break
+            continue
+        cells = [cell.strip() for cell in stripped.strip("|").split("|")]
+        if header is None:
+            header = cells
+        elif all(set(cell) <= set("-: ") for cell in cells):
+            continue
+        else:
+            rows.append(dict(zip(header, cells)))
+    return rows
+
+
+def architecture_refs(text):
+    """Concrete `docs/architecture/...` paths mentioned in text (template placeholders skipped)."""
+    refs = []
+    for match in ARCH_REF_RE.finditer(text):
+        ref = match.group(1).rstrip(".:")
+        if "[" in ref or ref in refs:
+            continue
+        refs.append(ref)
+    return refs
+
+
+def find_tasks_root(start):
+    """Return the `.epic-workflows/tasks` folder that contains `start`, or None."""
+    path = Path(start).resolve()
+    for candidate in [path] + list(path.parents):
+        if candidate.name == "tasks" and candidate.parent.name == ".epic-workflows":
+            return candidate
+    return None
+
+
+def task_ancestors(task_dir):
+    """Return the ancestor task folders of `task_dir`, nearest parent first."""
+    ancestors = []
+    parent = Path(task_dir).resolve().parent
+    while parse_task_dir_name(parent.name):
+        ancestors.append(parent)
+        parent = parent.parent
+    return ancestors
+
+
+def task_children(folder):
+    """Sorted task sub-folders of a folder."""
+    try:
+        entries = list(os.scandir(folder))
+    except FileNotFoundError:
+        return []
+    children = [Path(e.path) for e in entries if e.is_dir(follow_symlinks=False) and parse_task_dir_name(e.name)]
+    return sorted(children, key=lambda p: (TASK_TYPES.index(parse_task_dir_name(p.name)[0]),
+                                          parse_task_dir_name(p.name)[1], p.name))
+
+
+def iter_task_dirs(tasks_root):
+    """Walk the task tree depth-first in numbering order, yielding (task folder, parent folder or None)."""
+    stack = [(child, None) for child in reversed(task_children(tasks_root))]
+    while stack:
+        task, parent = stack.pop()
+        yield task, parent
+        stack.extend((child, task) for child in reversed(task_children(task)))
+
+
+def main():
+    """Print the parsed task hierarchy."""
+    parser = argparse.ArgumentParser(description="Print the parsed .epic-workflows task hierarchy.")
+    parser.add_argument('--root', default=".", help="Project root (default: current directory)")
+    args = parser.parse_args()
+
+    tasks_root = Path(args.root) / TASKS_DIR
+    if not tasks_root.is_dir():
+        print(f"❌ Task directory not found: {tasks_root}")
+        return 1
+
+    for task, _ in iter_task_dirs(tasks_root):
+        depth = len(task.relative_to(tasks_root).parts) - 1
+        index_file = task / "INDEX.md"
+        status = parse_index(index_file)["status"] if index_file.exists() else "missing INDEX.md"
+        print(f"{'  ' * depth}- {task.name} [{status}]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
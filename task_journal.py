@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Task Event Journal
+
+Append-only history of task status transitions. Framework tooling
+(`task_update.py`) appends one JSON object per line to
+`.epic-workflows/journal/events.jsonl`:
+
+    {"ts": "2025-03-04T09:12:45Z", "task": "Initiative_1_auth/Epic_1_oauth", "from": "In Progress",
+     "to": "Completed", "source": "task_update"}
+
+Requirement updates carry an extra "requirement" field. Each event is written
+with a single O_APPEND write, so concurrent writers never interleave lines.
+
+`report` computes cycle time (first In Progress → final Completed), weekly
+throughput and a daily burn-down per initiative in one streaming pass over every
+`*.jsonl` file in the journal folder. Only a few values per task are kept (first
+seen, first started, last event), so journals with millions of events are read
+in constant memory per task, and events may arrive in any order (e.g. history
+backfilled after live events).
+
+Usage:
+    python3 task_journal.py report
+    python3 task_journal.py report --type Step --weeks 12
+    python3 task_journal.py report --initiative Initiative_1_auth --json
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from task_hierarchy import TASK_TYPES, find_tasks_root, parse_task_dir_name
+
+JOURNAL_DIR = ".epic-workflows/journal"
+EVENTS_FILE = "events.jsonl"
+COMPLETED = "Completed"
+IN_PROGRESS = "In Progress"
+
+
+def utc_timestamp():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def encode_event(event):
+    return (json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def append_events(journal_file, events):
+    """Append events to a journal file with one O_APPEND write."""
+    data = b"".join(encode_event(event) for event in events)
+    if not data:
+        return 0
+    journal_file = Path(journal_file)
+    journal_file.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(journal_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return len(data)
+
+
+def record_transition(task_dir, previous, status, source, requirement=None):
+    """Journal one status change of a task (or one of its requirements).
+
+    Tasks outside an `.epic-workflows/tasks` tree are not journaled. Returns the event or None.
+    """
+    tasks_root = find_tasks_root(task_dir)
+    if tasks_root is None or previous == status:
+        return None
+    event = {
+        "ts": utc_timestamp(),
+        "task": Path(task_dir).resolve().relative_to(tasks_root).as_posix(),
+        "from": previous or None,
+        "to": status,
+        "source": source,
+    }
+    if requirement:
+        event["requirement"] = requirement
+    append_events(tasks_root.parent / "journal" / EVENTS_FILE, [event])
+    return event
+
+
+def journal_files(journal_dir):
+    """Every journal in a folder (live events plus any backfilled history)."""
+    return sorted(Path(journal_dir).glob("*.jsonl"))
+
+
+def iter_events(paths, errors=None):
+    """Stream events from journal files, skipping torn or malformed lines."""
+    decode = json.JSONDecoder().decode
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                try:
+                    event = decode(line)
+                    event["ts"], event["task"], event["to"]
+                except (ValueError, KeyError, TypeError):
+                    if errors is not None and line.strip():
+                        errors.append(path)
+                    continue
+                yield event
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def parse_ts(ts):
+    return datetime.strptime(ts, "%Y-%m-%dT%H:%M:%SZ")
+
+
+class JournalAnalytics:
+    """Per-task summaries folded from a stream of events in any order."""
+
+    def __init__(self, task_types=None, initiative=None):
+        self.task_types = set(task_types) if task_types else None
+        self.initiative = initiative
+        # task path -> [first seen, first started, last ts, last status]
+        self.tasks = {}
+        self.skipped = set()
+        self.weeks = {}
+        self.events = 0
+
+    def add(self, event):
+        if event.get("requirement"):
+            return
+        task = event["task"]
+        state = self.tasks.get(task)
+        if state is None:
+            if task in self.skipped:
+                return
+            parsed = parse_task_dir_name(task.rsplit("/", 1)[-1])
+            if ((self.initiative and task.split("/", 1)[0] != self.initiative) or parsed is None
+                    or (self.task_types and parsed[0] not in self.task_types)):
+                self.skipped.add(task)
+                return
+            state = self.tasks[task] = [event["ts"], None, "", None]
+        self.events += 1
+        ts = event["ts"]
+        if ts < state[0]:
+            state[0] = ts
+        if event["to"] == IN_PROGRESS and (state[1] is None or ts < state[1]):
+            state[1] = ts
+        if ts >= state[2]:
+            state[2] = ts
+            state[3] = event["to"]
+
+    def iso_week(self, day):
+        """`2025-W10` for a `2025-03-04` day string (memoized: many completions share a day)."""
+        key = self.weeks.get(day)
+        if key is None:
+            year, week, _ = date.fromisoformat(day).isocalendar()
+            key = self.weeks[day] = f"{year}-W{week:02d}"
+        return key
+
+    def consume(self, events):
+        for event in events:
+            self.add(event)
+        return self
+
+    def report(self, weeks=8):
+        """Cycle time, weekly throughput and daily burn-down per initiative."""
+        initiatives = {}
+        for task, (first_seen, started, last_ts, status) in self.tasks.items():
+            initiative = initiatives.setdefault(task.split("/", 1)[0], {
+                "tasks": 0, "completed": 0, "cycle_hours": [], "throughput": {}, "scope": {}, "done": {},
+            })
+            initiative["tasks"] += 1
+            day = first_seen[:10]
+            initiative["scope"][day] = initiative["scope"].get(day, 0) + 1
+            if status != COMPLETED:
+                continue
+            initiative["completed"] += 1
+            day = last_ts[:10]
+            initiative["done"][day] = initiative["done"].get(day, 0) + 1
+            key = self.iso_week(day)
+            initiative["throughput"][key] = initiative["throughput"].get(key, 0) + 1
+            if started is not None and started <= last_ts:
+                initiative["cycle_hours"].append((parse_ts(last_ts) - parse_ts(started)).total_seconds() / 3600)
+
+        report = {}
+        for name, data in sorted(initiatives.items()):
+            cycle = data["cycle_hours"]
+            report[name] = {
+                "tasks": data["tasks"],
+                "completed": data["completed"],
+                "remaining": data["tasks"] - data["completed"],
+                "cycle_time_hours": {
+                    "count": len(cycle),
+                    "median": percentile(cycle, 0.5),
+                    "p85": percentile(cycle, 0.85),
+                    "mean": sum(cycle) / len(cycle) if cycle else None,
+                },
+                "throughput": dict(sorted(data["throughput"].items())[-weeks:]),
+                "burndown": burndown(data["scope"], data["done"]),
+            }
+        return report
+
+
+def burndown(scope, done):
+    """Remaining (seen but not completed) tasks at the end of each day with activity."""
+    remaining = 0
+    points = []
+    for day in sorted(set(scope) | set(done)):
+        remaining += scope.get(day, 0) - done.get(day, 0)
+        points.append([day, remaining])
+    return points
+
+
+def format_hours(hours):
+    if hours is None:
+        return "-"
+    return f"{hours / 24:.1f}d" if hours >= 48 else f"{hours:.1f}h"
+
+
+def format_report(report, events, burndown_points=10):
+    lines = [f"📊 Task journal: {events:,} event(s), {len(report)} initiative(s)"]
+    for name, data in report.items():
+        cycle = data["cycle_time_hours"]
+        lines += [
+            "",
+            f"🧩 {name}: {data['completed']}/{data['tasks']} completed, {data['remaining']} remaining",
+            f"   Cycle time: median {format_hours(cycle['median'])}, p85 {format_hours(cycle['p85'])} "
+            f"({cycle['count']} task(s))",
+            "   Throughput: " + (", ".join(f"{week} {count}" for week, count in data["throughput"].items()) or "-"),
+            "   Burn-down:  " + (", ".join(f"{day} {left}" for day, left in data["burndown"][-burndown_points:])
+                                 or "-"),
+        ]
+    return "\n".join(lines)
+
+
+def main():
+    """Main function to report velocity and cycle time from the task journal."""
+    parser = argparse.ArgumentParser(description="Task status journal analytics.")
+    parser.add_argument('--root', default=".", help="Project root (default: current directory)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    report_parser = subparsers.add_parser('report', help="Cycle time, throughput and burn-down per initiative")
+    report_parser.add_argument('--type', nargs='+', choices=TASK_TYPES, default=None,
+                               help="Task types to count (default: all below Initiative)")
+    report_parser.add_argument('--initiative', default=None, help="Only this initiative folder")
+    report_parser.add_argument('--weeks', type=int, default=8, help="Weeks of throughput to show")
+    report_parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    args = parser.parse_args()
+
+    journal_dir = Path(args.root) / JOURNAL_DIR
+    paths = journal_files(journal_dir)
+    if not paths:
+        print(f"❌ No journal found in {journal_dir} (status changes made with task_update.py are recorded there)")
+        return 1
+    errors = []
+    analytics = JournalAnalytics(args.type or TASK_TYPES[1:], args.initiative)
+    analytics.consume(iter_events(paths, errors))
+    report = analytics.report(args.weeks)
+    if args.json:
+        print(json.dumps({"events": analytics.events, "initiatives": report}, indent=2))
+    else:
+        print(format_report(report, analytics.events))
+    if errors:
+        print(f"⚠️  Skipped {len(errors)} malformed journal line(s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Task Dependency Scheduler
+
+Builds a dependency DAG over `.epic-workflows/tasks/` so delegation (§6 of
+epic-workflow-instructions.md) can run independent Steps in parallel.
+
+The schedulable units are leaf tasks (usually Steps). Edges come from:
+
+- the REQUIREMENTS.md `## Dependencies` section (`**Blocked By**` / `**Blocks**`
+  bullets naming `[Task Type]_[Number]_[Task Name]` folders)
+- requirement `**Dependencies**` fields that name task folders or requirement IDs
+  (FR-001, TR-002, ...) defined in another task
+
+A dependency on a parent task means a dependency on all of its leaves, and a
+parent's own dependencies apply to every leaf below it. Task references resolve
+to the closest folder of that name (siblings before cousins).
+
+The scheduler reports the critical path (weighted by open requirements, at least
+one unit per task) and groups the open leaves into waves of at most N tasks,
+longest remaining chain first.
+
+Usage:
+    python3 task_scheduler.py --agents 3
+    python3 task_scheduler.py --agents 4 --json
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from task_hierarchy import TASKS_DIR, iter_task_dirs, parse_index, parse_requirements
+
+TASK_REF_RE = re.compile(r"\b((?:Initiative|Epic|Phase|Step)_\d+_[A-Za-z0-9][\w.-]*)")
+REQUIREMENT_ID_RE = re.compile(r"\b([A-Z]{2,3}-\d+)\b")
+LIST_FIELD_RE = re.compile(r"^\s*-\s*\*\*(Blocks|Blocked By)\*\*")
+OTHER_FIELD_RE = re.compile(r"^\s*-\s*\*\*")
+
+
+def is_completed(status):
+    return status.strip().lower().startswith("completed")
+
+
+def dependency_lists(section):
+    """Parse `**Blocks**` / `**Blocked By**` bullets of a Dependencies section into task name lists."""
+    found = {"Blocks": [], "Blocked By": []}
+    current = None
+    for line in section.splitlines():
+        match = LIST_FIELD_RE.match(line)
+        if match:
+            current = match.group(1)
+        elif OTHER_FIELD_RE.match(line) or line.startswith("#"):
+            current = None
+        if current and "[" not in line:
+            found[current] += TASK_REF_RE.findall(line)
+    return found
+
+
+class TaskScheduler:
+    def __init__(self, project_root="."):
+        self.project_root = Path(project_root).resolve()
+        self.tasks_root = self.project_root / TASKS_DIR
+        self.tasks = {}                      # path -> {"status", "weight", "children", "parent"}
+        self.by_name = defaultdict(list)     # folder name -> [paths]
+        self.requirement_owner = defaultdict(list)  # requirement id -> [paths]
+        self.raw_edges = []                  # (before path, after path)
+        self.warnings = []
+
+    def load(self):
+        """Parse every task folder once and collect raw (blocking → blocked) task edges."""
+        references = []  # (task path, referenced names, referenced requirement ids, blocks)
+        for task_dir, parent_dir in iter_task_dirs(self.tasks_root):
+            path = task_dir.relative_to(self.tasks_root).as_posix()
+            parent = parent_dir.relative_to(self.tasks_root).as_posix() if parent_dir else None
+            index_file, requirements_file = task_dir / "INDEX.md", task_dir / "REQUIREMENTS.md"
+            status = parse_index(index_file)["status"] if index_file.exists() else ""
+            task = {"status": status, "weight": 1, "children": [], "parent": parent}
+            self.tasks[path] = task
+            self.by_name[task_dir.name].append(path)
+            if parent:
+                self.tasks[parent]["children"].append(path)
+            if not requirements_file.exists():
+                continue
+
+            parsed = parse_requirements(requirements_file)
+            open_requirements = sum(1 for r in parsed["requirements"] if not is_completed(r["status"]))
+            task["weight"] = max(1, open_requirements)
+            lists = dependency_lists(parsed["sections"].get("Dependencies", ""))
+            names = list(lists["Blocked By"])
+            ids = []
+            for requirement in parsed["requirements"]:
+                self.requirement_owner[requirement["id"]].append(path)
+                if "[" in requirement["dependencies"]:
+                    continue
+                names += TASK_REF_RE.findall(requirement["dependencies"])
+                ids += REQUIREMENT_ID_RE.findall(requirement["dependencies"])
+            references.append((path, names, ids, lists["Blocks"]))
+
+        for path, names, ids, blocks in references:
+            for name in names:
+                target = self.resolve_name(name, path)
+                if target:
+                    self.raw_edges.append((target, path))
+            for name in blocks:
+                target = self.resolve_name(name, path)
+                if target:
+                    self.raw_edges.append((path, target))
+            for requirement_id in ids:
+                owners = self.requirement_owner.get(requirement_id, [])
+                if path in owners or not owners:
+                    continue  # same-task or unknown requirement: no task-level edge
+                self.raw_edges.append((self.closest(owners, path), path))
+
+    @staticmethod
+    def closest(candidates, path):
+        """The candidate sharing the longest folder prefix with `path`."""
+        parts = path.split("/")
+
+        def shared(candidate):
+            count = 0
+            for a, b in zip(candidate.split("/"), parts):
+                if a != b:
+                    break
+                count += 1
+            return count
+
+        return max(candidates, key=lambda c: (shared(c), -len(c)))
+
+    def resolve_name(self, name, path):
+        candidates = [c for c in self.by_name.get(name, []) if c != path]
+        if not candidates:
+            self.warnings.append(f"{path}: unknown task reference '{name}'")
+            return None
+        return self.closest(candidates, path)
+
+    def leaves(self, path):
+        """Leaf tasks at or below `path`."""
+        stack, found = [path], []
+        while stack:
+            current = stack.pop()
+            children = self.tasks[current]["children"]
+            if children:
+                stack.extend(children)
+            else:
+                found.append(current)
+        return found
+
+    def leaf_graph(self):
+        """Expand raw edges to leaf → leaf edges, inheriting each ancestor's dependencies."""
+        leaf_edges = defaultdict(set)
+        for before, after in self.raw_edges:
+            after_leaves = self.leaves(after)
+            for before_leaf in self.leaves(before):
+                for after_leaf in after_leaves:
+                    if before_leaf != after_leaf:
+                        leaf_edges[before_leaf].add(after_leaf)
+        nodes = [p for p, t in self.tasks.items() if not t["children"]]
+        return nodes, leaf_edges
+
+    def schedule(self, agents):
+        """Return {"critical_path", "critical_length", "waves", "cycles", "completed"} for the tree."""
+        nodes, edges = self.leaf_graph()
+        done = {n for n in nodes if is_completed(self.tasks[n]["status"])}
+        open_nodes = [n for n in nodes if n not in done]
+        successors = {n: sorted(m for m in edges.get(n, ()) if m not in done) for n in open_nodes}
+        indegree = {n: 0 for n in open_nodes}
+        for n in open_nodes:
+            for m in successors[n]:
+                indegree[m] += 1
+
+        # Topological order (Kahn); nodes left over sit on a cycle
+        order = []
+        remaining = dict(indegree)
+        ready = [n for n in open_nodes if remaining[n] == 0]
+        while ready:
+            n = ready.pop()
+            order.append(n)
+            for m in successors[n]:
+                remaining[m] -= 1
+                if remaining[m] == 0:
+                    ready.append(m)
+        cyclic = sorted(n for n in open_nodes if remaining[n] > 0)
+
+        # Longest remaining chain from each node (its priority), walked in reverse topological order
+        chain = {}
+        next_on_chain = {}
+        for n in reversed(order):
+            best = max((m for m in successors[n] if m in chain), key=lambda m: chain[m], default=None)
+            chain[n] = self.tasks[n]["weight"] + (chain[best] if best else 0)
+            next_on_chain[n] = best
+        critical = []
+        if chain:
+            node = max(chain, key=lambda n: (chain[n], n))
+            critical_length = chain[node]
+            while node:
+                critical.append(node)
+                node = next_on_chain[node]
+        else:
+            critical_length = 0
+
+        # List scheduling: each wave takes the N ready tasks with the longest remaining chains.
+        # Only nodes in `order` are schedulable; anything on or behind a cycle never becomes ready.
+        waves = []
+        remaining = {n: indegree[n] for n in order}
+        ready = {n for n in order if remaining[n] == 0}
+        while ready:
+            wave = sorted(ready, key=lambda n: (-chain[n], n))[:agents]
+            waves.append(wave)
+            ready -= set(wave)
+            for n in wave:
+                for m in successors[n]:
+                    if m in remaining:
+                        remaining[m] -= 1
+                        if remaining[m] == 0:
+                            ready.add(m)
+
+        return {
+            "critical_path": critical,
+            "critical_length": critical_length,
+            "waves": waves,
+            "cycles": cyclic,
+            "completed": sorted(done),
+        }
+
+
+def main():
+    """Main function to run the task dependency scheduler."""
+    parser = argparse.ArgumentParser(description="Plan parallel delegation waves from task dependencies.")
+    parser.add_argument('--root', default=".", help="Project root (default: current directory)")
+    parser.add_argument('--agents', type=int, default=1, help="Number of concurrent agents (default: 1)")
+    parser.add_argument('--json', action='store_true', help="Print the schedule as JSON")
+    args = parser.parse_args()
+
+    scheduler = TaskScheduler(args.root)
+    if not scheduler.tasks_root.is_dir():
+        print(f"❌ Task directory not found: {scheduler.tasks_root}")
+        return 1
+    if args.agents < 1:
+        print("❌ --agents must be at least 1")
+        return 1
+
+    scheduler.load()
+    plan = scheduler.schedule(args.agents)
+    plan["warnings"] = scheduler.warnings
+    if args.json:
+        print(json.dumps(plan, indent=2))
+        return 1 if plan["cycles"] else 0
+
+    for warning in scheduler.warnings:
+        print(f"⚠️  {warning}")
+    print(f"🧭 Critical path ({plan['critical_length']} units):")
+    for path in plan["critical_path"]:
+        print(f"   → {path}")
+    for number, wave in enumerate(plan["waves"], 1):
+        print(f"🚀 Wave {number}:")
+        for path in wave:
+            print(f"   - {path} [{scheduler.tasks[path]['status'] or 'Not Started'}]")
+    if plan["cycles"]:
+        print("❌ Dependency cycle between:")
+        for path in plan["cycles"]:
+            print(f"   - {path}")
+        return 1
+    print(f"✅ {sum(len(w) for w in plan['waves'])} open task(s) in {len(plan['waves'])} wave(s), "
+          f"{len(plan['completed'])} completed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
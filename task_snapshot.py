@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Task Hierarchy Snapshot
+
+Serializes the parsed `.epic-workflows/tasks/` hierarchy (paths, names, status,
+goals, requirement counts and architecture references) into one compact binary
+file, `.epic-workflows/cache/task-snapshot.bin`, so agents can load the whole tree
+without listing directories and opening every INDEX.md.
+
+File layout (little-endian, versioned by SNAPSHOT_VERSION):
+
+    header       magic, version, task count, section offsets
+    records      one fixed-size record per task, depth-first in numbering order
+    path index   record numbers sorted by task path (binary search by path)
+    string pool  length-prefixed UTF-8 strings, deduplicated
+
+The loader memory-maps the file and decodes records and strings only when they
+are accessed, so opening a 10k-task snapshot costs a header read. Rebuilds are
+incremental: tasks whose INDEX.md and REQUIREMENTS.md (mtime, size) match the
+previous snapshot are copied over without re-parsing.
+
+Usage:
+    python3 task_snapshot.py build
+    python3 task_snapshot.py show
+    python3 task_snapshot.py show Initiative_1_auth/Epic_1_oauth
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+
+from task_hierarchy import (
+    TASK_TYPES,
+    TASKS_DIR,
+    iter_task_dirs,
+    parse_index,
+    parse_requirements,
+    parse_task_dir_name,
+)
+
+SNAPSHOT_FILE = ".epic-workflows/cache/task-snapshot.bin"
+SNAPSHOT_MAGIC = b"EPICSNAP"
+SNAPSHOT_VERSION = 1
+HEADER = struct.Struct("<8sHHIIII")  # magic, version, reserved, count, records, path index, strings
+RECORD = struct.Struct("<iBxxxIIIIIIIIHHqqqq")
+INDEX_ENTRY = struct.Struct("<I")
+STRING_LEN = struct.Struct("<I")
+NO_PARENT = -1
+MISSING = -1
+
+# Record field names in RECORD order; string fields hold string pool offsets
+FIELDS = (
+    "parent", "type", "number", "path", "name", "title", "status", "business_goal",
+    "technical_goal", "architecture_refs", "requirements", "requirements_done",
+    "index_mtime", "index_size", "requirements_mtime", "requirements_size",
+)
+STRING_FIELDS = ("path", "name", "title", "status", "business_goal", "technical_goal", "architecture_refs")
+
+
+def file_signature(path):
+    """(mtime_ns, size) of a file, or (-1, -1) when it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return MISSING, MISSING
+    return stat.st_mtime_ns, stat.st_size
+
+
+class TaskRecord:
+    """Lazy view of one task record; string fields are decoded on first access."""
+
+    __slots__ = ("snapshot", "position", "_values", "_strings")
+
+    def __init__(self, snapshot, position):
+        self.snapshot = snapshot
+        self.position = position
+        self._values = None
+        self._strings = {}
+
+    def raw(self):
+        if self._values is None:
+            self._values = dict(zip(FIELDS, self.snapshot.record_values(self.position)))
+        return self._values
+
+    def __getattr__(self, field):
+        if field not in FIELDS:
+            raise AttributeError(field)
+        value = self.raw()[field]
+        if field in STRING_FIELDS:
+            if field not in self._strings:
+                self._strings[field] = self.snapshot.string(value)
+            return self._strings[field]
+        return value
+
+    @property
+    def task_type(self):
+        return TASK_TYPES[self.raw()["type"]]
+
+    @property
+    def refs(self):
+        refs = self.architecture_refs
+        return refs.split("\n") if refs else []
+
+    @property
+    def parent_record(self):
+        parent = self.raw()["parent"]
+        return None if parent == NO_PARENT else self.snapshot[parent]
+
+    def to_dict(self):
+        data = {field: getattr(self, field) for field in FIELDS}
+        data["type"] = self.task_type
+        data["architecture_refs"] = self.refs
+        return data
+
+
+class TaskSnapshot:
+    """Read-only, memory-mapped task hierarchy snapshot."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Empty snapshot file: {self.path}")
+        magic, version, _, count, records, path_index, strings = HEADER.unpack_from(self._map, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported snapshot format in {self.path}")
+        self.count = count
+        self.records_offset = records
+        self.path_index_offset = path_index
+        self.strings_offset = strings
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, position):
+        if not 0 <= position < self.count:
+            raise IndexError(position)
+        return TaskRecord(self, position)
+
+    def __iter__(self):
+        return (TaskRecord(self, position) for position in range(self.count))
+
+    def record_values(self, position):
+        return RECORD.unpack_from(self._map, self.records_offset + position * RECORD.size)
+
+    def string(self, offset):
+        start = self.strings_offset + offset
+        (length,) = STRING_LEN.unpack_from(self._map, start)
+        start += STRING_LEN.size
+        return self._map[start:start + length].decode("utf-8")
+
+    def record_path(self, position):
+        return self.string(self.record_values(position)[FIELDS.index("path")])
+
+    def find(self, task_path):
+        """Binary search the path index for a task path relative to the tasks folder."""
+        task_path = task_path.strip("/")
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            (position,) = INDEX_ENTRY.unpack_from(self._map, self.path_index_offset + middle * INDEX_ENTRY.size)
+            current = self.record_path(position)
+            if current == task_path:
+                return TaskRecord(self, position)
+            if current < task_path:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def children(self, position):
+        """Direct children of a record (NO_PARENT for the top-level Initiatives)."""
+        return [record for record in self if record.parent == position]
+
+
+class SnapshotWriter:
+    """Builds the snapshot file, reusing unchanged records from the previous snapshot."""
+
+    def __init__(self, project_root=".", snapshot_file=None):
+        self.project_root = Path(project_root).resolve()
+        self.tasks_root = self.project_root / TASKS_DIR
+        self.snapshot_file = Path(snapshot_file) if snapshot_file else self.project_root / SNAPSHOT_FILE
+        self.parsed = 0
+        self.reused = 0
+
+    def previous_records(self):
+        """{task path: record dict} from the existing snapshot, or {} when there is none."""
+        if not self.snapshot_file.exists():
+            return {}
+        try:
+            with TaskSnapshot(self.snapshot_file) as snapshot:
+                return {record.path: record.to_dict() for record in snapshot}
+        except (OSError, ValueError, struct.error):
+            return {}
+
+    def parse_task(self, task_dir, task_path, signatures):
+        task_type, number, name = parse_task_dir_name(task_dir.name)
+        index_file, requirements_file = task_dir / "INDEX.md", task_dir / "REQUIREMENTS.md"
+        record = {
+            "type": task_type, "number": number, "path": task_path, "name": name,
+            "title": "", "status": "", "business_goal": "", "technical_goal": "",
+            "architecture_refs": [], "requirements": 0, "requirements_done": 0,
+        }
+        refs = []
+        if signatures[1] != MISSING:
+            info = parse_index(index_file)
+            record.update(title=info["title"], status=info["status"],
+                          business_goal=info["business_goal"], technical_goal=info["technical_goal"])
+            refs += info["architecture_refs"]
+        if signatures[3] != MISSING:
+            parsed = parse_requirements(requirements_file)
+            record["requirements"] = len(parsed["requirements"])
+            record["requirements_done"] = sum(1 for r in parsed["requirements"]
+                                              if r["status"].lower() == "completed")
+            refs += [ref for ref in parsed["architecture_refs"] if ref not in refs]
+        record["architecture_refs"] = refs
+        return record
+
+    def collect(self):
+        """Walk the task tree, returning (records, parent positions) in depth-first order."""
+        previous = self.previous_records()
+        records = []
+        positions = {}
+        for task_dir, parent_dir in iter_task_dirs(self.tasks_root):
+            task_path = task_dir.relative_to(self.tasks_root).as_posix()
+            signatures = file_signature(task_dir / "INDEX.md") + file_signature(task_dir / "REQUIREMENTS.md")
+            old = previous.get(task_path)
+            if old and (old["index_mtime"], old["index_size"], old["requirements_mtime"],
+                        old["requirements_size"]) == signatures:
+                record = old
+                self.reused += 1
+            else:
+                record = self.parse_task(task_dir, task_path, signatures)
+                self.parsed += 1
+            record = dict(record, index_mtime=signatures[0], index_size=signatures[1],
+                          requirements_mtime=signatures[2], requirements_size=signatures[3])
+            parent_path = parent_dir.relative_to(self.tasks_root).as_posix() if parent_dir else None
+            record["parent"] = positions.get(parent_path, NO_PARENT)
+            positions[task_path] = len(records)
+            records.append(record)
+        return records
+
+    def encode(self, records):
+        strings = bytearray()
+        string_offsets = {}
+
+        def intern(text):
+            offset = string_offsets.get(text)
+            if offset is None:
+                data = text.encode("utf-8")
+                offset = len(strings)
+                strings.extend(STRING_LEN.pack(len(data)))
+                strings.extend(data)
+                string_offsets[text] = offset
+            return offset
+
+        intern("")
+        record_bytes = bytearray()
+        for record in records:
+            values = dict(record, type=TASK_TYPES.index(record["type"]),
+                          architecture_refs="\n".join(record["architecture_refs"]))
+            for field in STRING_FIELDS:
+                values[field] = intern(values[field])
+            values["requirements"] = min(values["requirements"], 0xFFFF)
+            values["requirements_done"] = min(values["requirements_done"], 0xFFFF)
+            record_bytes.extend(RECORD.pack(*(values[field] for field in FIELDS)))
+
+        order = sorted(range(len(records)), key=lambda i: records[i]["path"])
+        path_index = b"".join(INDEX_ENTRY.pack(i) for i in order)
+
+        records_offset = HEADER.size
+        path_index_offset = records_offset + len(record_bytes)
+        strings_offset = path_index_offset + len(path_index)
+        header = HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(records),
+                             records_offset, path_index_offset, strings_offset)
+        return header + bytes(record_bytes) + path_index + bytes(strings)
+
+    def build(self):
+        """Write the snapshot atomically. Returns the number of tasks in it."""
+        records = self.collect()
+        data = self.encode(records)
+        self.snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.snapshot_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, self.snapshot_file)
+        return len(records)
+
+
+def main():
+    """Main function to build or inspect the task snapshot."""
+    parser = argparse.ArgumentParser(description="Build or read the binary task hierarchy snapshot.")
+    parser.add_argument('--root', default=".", help="Project root (default: current directory)")
+    parser.add_argument('--file', default=None, help=f"Snapshot file (default: {SNAPSHOT_FILE})")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help="Build or incrementally refresh the snapshot")
+    show_parser = subparsers.add_parser('show', help="Print the snapshot tree or one task")
+    show_parser.add_argument('task', nargs='?', help="Task path relative to .epic-workflows/tasks")
+    args = parser.parse_args()
+
+    writer = SnapshotWriter(args.root, args.file)
+    if args.command == 'build':
+        if not writer.tasks_root.is_dir():
+            print(f"❌ Task directory not found: {writer.tasks_root}")
+            return 1
+        count = writer.build()
+        size = writer.snapshot_file.stat().st_size
+        print(f"✅ Snapshot of {count} task(s), {size:,} bytes: {writer.parsed} parsed, {writer.reused} reused")
+        return 0
+
+    try:
+        snapshot = TaskSnapshot(writer.snapshot_file)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not open snapshot: {e}")
+        return 1
+    with snapshot:
+        if args.task:
+            record = snapshot.find(args.task)
+            if record is None:
+                print(f"❌ Task not in snapshot: {args.task}")
+                return 1
+            data = record.to_dict()
+            for field in ("path", "type", "number", "title", "status"):
+                print(f"{field}: {data[field]}")
+            print(f"requirements: {data['requirements_done']}/{data['requirements']} completed")
+            for ref in data["architecture_refs"]:
+                print(f"architecture: {ref}")
+            return 0
+        for record in snapshot:
+            depth = record.path.count("/")
+            print(f"{'  ' * depth}- {record.path.rsplit('/', 1)[-1]} [{record.status or '—'}] "
+                  f"{record.requirements_done}/{record.requirements}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Transactional Task Updates
+
+Safe status updates for INDEX.md and REQUIREMENTS.md when several delegated
+agents finish work under the same parent at once. Every update:
+
+1. takes an exclusive advisory lock (`fcntl.flock`) on the file itself,
+2. checks the content hash against the caller's expected hash (compare-and-swap;
+   pass the hash printed by `task_update.py hash` to reject stale views),
+3. patches single lines – the `**Status**` / `**Updated**` header lines, one cell
+   of one Subtasks table row, or one requirement's `**Status**` – and
+4. writes back only the changed bytes: in place when the length is unchanged,
+   otherwise from the first changed line to the end of the file.
+
+Every status change is also appended to the task event journal
+(`task_journal.py`).
+
+Concurrent updates to different rows of the same parent table therefore
+serialize on the lock and never overwrite each other. Where `fcntl` is not
+available (Windows) the lock is skipped and the hash check still detects
+conflicting writes.
+
+Usage:
+    python3 task_update.py status .epic-workflows/tasks/Initiative_1_auth/Epic_1_oauth/Phase_1_setup Completed
+    python3 task_update.py requirement .epic-workflows/tasks/Initiative_1_auth/Epic_1_oauth FR-001 "In Progress"
+    python3 task_update.py hash .epic-workflows/tasks/Initiative_1_auth/INDEX.md
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: compare-and-swap only
+    fcntl = None
+
+from task_hierarchy import REQUIREMENT_RE, parse_task_dir_name
+from task_journal import record_transition
+
+STATUSES = ("Not Started", "In Progress", "Completed")
+DEFAULT_LOCK_TIMEOUT = 10.0
+LOCK_POLL_INTERVAL = 0.01
+STATUS_LINE_RE = re.compile(rb"^(\*\*Status\*\*:\s*)(.*?)(\s*)$")
+UPDATED_LINE_RE = re.compile(rb"^(\*\*Updated\*\*:\s*)(.*?)(\s*)$")
+REQUIREMENT_STATUS_RE = re.compile(rb"^(\s*-\s*\*\*Status\*\*:\s*)(.*?)(\s*)$")
+
+
+class UpdateError(ValueError):
+    """A patch that cannot be applied (missing line, row or requirement)."""
+
+
+class ConflictError(RuntimeError):
+    """The file changed since the caller read it (compare-and-swap failed)."""
+
+
+class LockTimeout(RuntimeError):
+    """The file stayed locked by another writer for longer than the timeout."""
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return content_hash(f.read())
+
+
+@contextmanager
+def exclusive_lock(f, timeout=DEFAULT_LOCK_TIMEOUT):
+    """Hold an exclusive advisory lock on an open file."""
+    if fcntl is None:
+        yield
+        return
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            break
+        except BlockingIOError:
+            if time.monotonic() >= deadline:
+                raise LockTimeout(f"{f.name} is locked by another writer")
+            time.sleep(LOCK_POLL_INTERVAL)
+    try:
+        yield
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def write_changes(f, old_lines, new_lines):
+    """Write the changed part of a file. Returns the number of bytes written."""
+    first = 0
+    while first < min(len(old_lines), len(new_lines)) and old_lines[first] == new_lines[first]:
+        first += 1
+    if first == len(old_lines) == len(new_lines):
+        return 0
+    offset = sum(len(line) for line in old_lines[:first])
+    old_size = sum(len(line) for line in old_lines)
+    new_size = sum(len(line) for line in new_lines)
+    if len(old_lines) == len(new_lines) and old_size == new_size:
+        # Same length: overwrite only the span between the first and last changed line
+        last = len(new_lines)
+        while new_lines[last - 1] == old_lines[last - 1]:
+            last -= 1
+        chunk = b"".join(new_lines[first:last])
+    else:
+        chunk = b"".join(new_lines[first:])
+    f.seek(offset)
+    f.write(chunk)
+    if new_size != old_size:
+        f.truncate(new_size)
+    f.flush()
+    os.fsync(f.fileno())
+    return len(chunk)
+
+
+def patch_file(path, patcher, expected_hash=None, timeout=DEFAULT_LOCK_TIMEOUT):
+    """Apply `patcher(lines) -> lines` (lists of byte lines) under the file lock.
+
+    Raises ConflictError when `expected_hash` no longer matches the file. Returns
+    (new content hash, bytes written).
+    """
+    with open(path, "r+b") as f:
+        with exclusive_lock(f, timeout):
+            data = f.read()
+            current = content_hash(data)
+            if expected_hash is not None and expected_hash != current:
+                raise ConflictError(f"{path} changed since it was read (expected {expected_hash[:12]}, "
+                                    f"found {current[:12]})")
+            lines = data.splitlines(keepends=True)
+            new_lines = patcher(list(lines))
+            written = write_changes(f, lines, new_lines)
+            return (content_hash(b"".join(new_lines)) if written else current), written
+
+
+def replace_value(line, pattern, value):
+    """Swap the value of a `**Field**: value` line, keeping its prefix and trailing Markdown line break."""
+    match = pattern.match(line.rstrip(b"\r\n"))
+    ending = line[len(line.rstrip(b"\r\n")):]
+    return match.group(1) + value.encode("utf-8") + match.group(3) + ending
+
+
+def header_end(lines):
+    """Index of the first `##` heading (the INDEX.md header fields come before it)."""
+    for number, line in enumerate(lines):
+        if line.startswith(b"## "):
+            return number
+    return len(lines)
+
+
+def previous_value(line, pattern):
+    return pattern.match(line.rstrip(b"\r\n")).group(2).decode("utf-8", errors="replace")
+
+
+def status_patcher(status, updated=None):
+    """Patch the INDEX.md `**Status**` line and stamp `**Updated**`.
+
+    The replaced status is left in `patch.previous`.
+    """
+    stamp = updated or datetime.now().strftime("%Y-%m-%d %H:%M")
+
+    def patch(lines):
+        header = range(header_end(lines))
+        status_line = next((number for number in header if STATUS_LINE_RE.match(lines[number].rstrip(b"\r\n"))),
+                           None)
+        if status_line is None:
+            raise UpdateError("no **Status** line in the INDEX.md header")
+        patch.previous = previous_value(lines[status_line], STATUS_LINE_RE)
+        if patch.previous == status:
+            # Unchanged status: keep the Updated stamp too, wherever it sits in the header
+            return lines
+        lines[status_line] = replace_value(lines[status_line], STATUS_LINE_RE, status)
+        for number in header:
+            if UPDATED_LINE_RE.match(lines[number].rstrip(b"\r\n")):
+                lines[number] = replace_value(lines[number], UPDATED_LINE_RE, stamp)
+        return lines
+    patch.previous = None
+    return patch
+
+
+def split_row(line):
+    return line.rstrip(b"\r\n").strip().strip(b"|").split(b"|")
+
+
+def subtask_patcher(key, column, value):
+    """Patch one cell of the Subtasks table row whose Location or Name is `key`."""
+
+    def patch(lines):
+        in_section = False
+        header = None
+        for number, line in enumerate(lines):
+            if line.startswith(b"## "):
+                in_section = line[3:].strip() == b"Subtasks"
+                continue
+            if not in_section or not line.lstrip().startswith(b"|"):
+                continue
+            cells = split_row(line)
+            stripped = [cell.strip().decode("utf-8", errors="replace") for cell in cells]
+            if header is None:
+                header = stripped
+                if column not in header:
+                    raise UpdateError(f"Subtasks table has no '{column}' column")
+                continue
+            if all(set(cell) <= set("-: ") for cell in stripped):
+                continue
+            row = dict(zip(header, stripped))
+            if key not in (row.get("Location"), row.get("Name")):
+                continue
+            index = header.index(column)
+            # Keep the cell width when the new value fits, so the row keeps its length
+            width = len(cells[index])
+            cell = f" {value} ".encode("utf-8")
+            cells[index] = cell.ljust(width) if len(cell) <= width else cell
+            indent = line[:len(line) - len(line.lstrip())]
+            ending = line[len(line.rstrip(b"\r\n")):]
+            lines[number] = indent + b"|" + b"|".join(cells) + b"|" + ending
+            return lines
+        raise UpdateError(f"no Subtasks row for '{key}'")
+    return patch
+
+
+def requirement_patcher(requirement_id, status):
+    """Patch the `**Status**` field of one REQUIREMENTS.md requirement (FR-001, TR-002, ...).
+
+    The replaced status is left in `patch.previous`.
+    """
+
+    def patch(lines):
+        current = None
+        in_fence = False
+        for number, line in enumerate(lines):
+            text = line.decode("utf-8", errors="replace")
+            if text.strip().startswith("```"):
+                in_fence = not in_fence
+                continue
+            if in_fence:
+                continue
+            match = REQUIREMENT_RE.match(text.rstrip("\r\n"))
+            if match:
+                current = match.group(1)
+                continue
+            if current == requirement_id and REQUIREMENT_STATUS_RE.match(line.rstrip(b"\r\n")):
+                patch.previous = previous_value(line, REQUIREMENT_STATUS_RE)
+                lines[number] = replace_value(line, REQUIREMENT_STATUS_RE, status)
+                return lines
+        raise UpdateError(f"no **Status** field for requirement {requirement_id}")
+    patch.previous = None
+    return patch
+
+
+def check_patch(path, patcher):
+    """Dry-run a patcher on the current file; raises UpdateError if it would not apply."""
+    with open(path, "rb") as f:
+        patcher(f.read().splitlines(keepends=True))
+
+
+def check_status(status):
+    if status not in STATUSES:
+        raise UpdateError(f"Unknown status '{status}'. Expected one of: {', '.join(STATUSES)}")
+
+
+def set_task_status(task_dir, status, expected_hash=None, timeout=DEFAULT_LOCK_TIMEOUT):
+    """Set a task's INDEX.md status and its row in the parent's Subtasks table.
+
+    Each file is locked on its own (child first, then parent), so no lock is ever
+    held while waiting for another. The parent's row is looked up before the child
+    is touched, so a missing row fails without changing anything. Returns
+    [(path, bytes written)].
+    """
+    check_status(status)
+    task_dir = Path(task_dir)
+    parent = task_dir.resolve().parent
+    parent_index = Path(os.path.relpath(parent / "INDEX.md"))
+    row_patcher = None
+    if parse_task_dir_name(parent.name) and parent_index.exists():
+        row_patcher = subtask_patcher(task_dir.name, "Status", status)
+        check_patch(parent_index, row_patcher)
+    results = []
+    index_file = task_dir / "INDEX.md"
+    patcher = status_patcher(status)
+    results.append((index_file, patch_file(index_file, patcher, expected_hash, timeout)[1]))
+    record_transition(task_dir, patcher.previous, status, "task_update")
+    if row_patcher is not None:
+        results.append((parent_index, patch_file(parent_index, row_patcher, timeout=timeout)[1]))
+    return results
+
+
+def set_requirement_status(task_dir, requirement_id, status, expected_hash=None, timeout=DEFAULT_LOCK_TIMEOUT):
+    check_status(status)
+    path = Path(task_dir) / "REQUIREMENTS.md"
+    patcher = requirement_patcher(requirement_id, status)
+    written = patch_file(path, patcher, expected_hash, timeout)[1]
+    record_transition(task_dir, patcher.previous, status, "task_update", requirement=requirement_id)
+    return [(path, written)]
+
+
+def main():
+    """Update task status lines under file locks."""
+    parser = argparse.ArgumentParser(description="Concurrency-safe INDEX.md / REQUIREMENTS.md status updates.")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_LOCK_TIMEOUT, help="Seconds to wait for a lock")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    status_parser = subparsers.add_parser('status', help="Set a task's status and its parent's Subtasks row")
+    status_parser.add_argument('task', help="Task folder")
+    status_parser.add_argument('status', help=" | ".join(STATUSES))
+    status_parser.add_argument('--expect', default=None, help="Content hash the task's INDEX.md must still have")
+    requirement_parser = subparsers.add_parser('requirement', help="Set one requirement's status")
+    requirement_parser.add_argument('task', help="Task folder")
+    requirement_parser.add_argument('requirement', help="Requirement ID, e.g. FR-001")
+    requirement_parser.add_argument('status', help=" | ".join(STATUSES))
+    requirement_parser.add_argument('--expect', default=None, help="Content hash REQUIREMENTS.md must still have")
+    hash_parser = subparsers.add_parser('hash', help="Print a file's content hash for --expect")
+    hash_parser.add_argument('file')
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'hash':
+            print(file_hash(args.file))
+            return 0
+        if args.command == 'status':
+            results = set_task_status(args.task, args.status, args.expect, args.timeout)
+        else:
+            results = set_requirement_status(args.task, args.requirement, args.status, args.expect, args.timeout)
+    except (OSError, UpdateError, ConflictError, LockTimeout) as e:
+        print(f"❌ {e}")
+        return 1
+    for path, written in results:
+        print(f"✅ {path}: {written} byte(s) written" if written else f"✅ {path}: already up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
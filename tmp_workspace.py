@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+AI Epic Framework - Problem-Solving Workspace Manager
+
+Manages the temporary workspace used by problem-solving-framework.md
+(`/.epic-workflows/rules/tmp/`). Instead of an ever-growing pile of
+`research-findings-[YYYYMMDD-HHMMSS].md` files that agents re-list and re-read,
+the workspace keeps:
+
+- `index.md`  – one compact table of every attempt log (stage, time, size, summary)
+- `digest.md` – old attempts folded into short summaries (headings + key lines)
+
+`gc` evicts attempt logs older than the age limit, then evicts least recently
+modified logs until the workspace fits its byte and file quotas. Every evicted log
+is summarized into the digest before it is deleted, so knowledge is preserved.
+
+Usage:
+    python3 tmp_workspace.py new research-findings
+    python3 tmp_workspace.py gc --max-age-days 7 --max-bytes 1000000 --max-files 50
+    python3 tmp_workspace.py index
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+TMP_DIR = ".epic-workflows/rules/tmp"
+INDEX_FILE = "index.md"
+DIGEST_FILE = "digest.md"
+STAGES = (
+    "research-findings",
+    "problem-breakdown",
+    "solution-tracking",
+    "validation-results",
+    "final-summary",
+)
+ATTEMPT_RE = re.compile(r"^(" + "|".join(STAGES) + r")-(\d{8}-\d{6})\.md$")
+DEFAULT_MAX_AGE_DAYS = 7
+DEFAULT_MAX_BYTES = 1_000_000
+DEFAULT_MAX_FILES = 50
+DEFAULT_DIGEST_BYTES = 200_000
+SUMMARY_LINES = 12
+
+
+def summarize_attempt(path, max_lines=SUMMARY_LINES):
+    """Condense an attempt log to its headings and first key lines (the title is skipped)."""
+    kept = []
+    seen_title = False
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("```"):
+                continue
+            if stripped.startswith("# ") and not seen_title:
+                seen_title = True
+                continue
+            if stripped.startswith("#"):
+                kept.append(stripped.lstrip("#").strip())
+            elif stripped.startswith(("-", "*", "•")) or re.match(r"^\d+\.", stripped) or not kept:
+                kept.append(stripped.lstrip("-*• "))
+            if len(kept) >= max_lines:
+                break
+    return kept
+
+
+def first_summary_line(path):
+    """First line of prose (or bullet) after the headings, for the index table."""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped and not stripped.startswith(("#", "```")):
+                text = stripped.lstrip("-*• ").replace("|", "\\|")
+                return text[:100] + ("…" if len(text) > 100 else "")
+    return "—"
+
+
+class TmpWorkspace:
+    def __init__(self, project_root=".", tmp_dir=TMP_DIR):
+        self.root = Path(project_root).resolve() / tmp_dir
+        self.index_file = self.root / INDEX_FILE
+        self.digest_file = self.root / DIGEST_FILE
+
+    def attempts(self):
+        """Return [(path, stage, timestamp, stat)] for every attempt log, oldest first."""
+        if not self.root.is_dir():
+            return []
+        found = []
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                match = ATTEMPT_RE.match(entry.name)
+                if match and entry.is_file():
+                    found.append((Path(entry.path), match.group(1), match.group(2), entry.stat()))
+        found.sort(key=lambda a: (a[2], a[0].name))
+        return found
+
+    def new(self, stage):
+        """Create an empty attempt log for a stage and return its path."""
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage '{stage}'. Expected one of: {', '.join(STAGES)}")
+        self.root.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = self.root / f"{stage}-{timestamp}.md"
+        if not path.exists():
+            title = stage.replace("-", " ").title()
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"# {title} – {timestamp}\n\n")
+        self.write_index()
+        return path
+
+    def fold_into_digest(self, evicted, max_digest_bytes):
+        """Append summaries of evicted logs to digest.md, trimming the oldest entries past the cap."""
+        if not evicted:
+            return
+        entries = []
+        for path, stage, timestamp, _ in evicted:
+            lines = summarize_attempt(path)
+            body = "\n".join(f"- {line}" for line in lines) if lines else "- (empty)"
+            entries.append(f"### {stage} {timestamp}\n{body}\n")
+
+        existing = ""
+        if self.digest_file.exists():
+            with open(self.digest_file, "r", encoding="utf-8") as f:
+                existing = f.read()
+        header = "# Problem-Solving Digest\n\nSummaries of evicted attempt logs, oldest first.\n\n"
+        blocks = [b for b in re.split(r"(?m)^(?=### )", existing[len(header):] if existing.startswith(header) else "") if b.strip()]
+        blocks += entries
+
+        while blocks and len(header) + sum(len(b) + 1 for b in blocks) > max_digest_bytes:
+            blocks.pop(0)
+
+        tmp_file = self.digest_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write(header + "\n".join(b.rstrip("\n") + "\n" for b in blocks))
+        os.replace(tmp_file, self.digest_file)
+
+    def gc(self, max_age_days=DEFAULT_MAX_AGE_DAYS, max_bytes=DEFAULT_MAX_BYTES,
+           max_files=DEFAULT_MAX_FILES, max_digest_bytes=DEFAULT_DIGEST_BYTES, dry_run=False):
+        """Evict by age, then least-recently-modified first until within quota. Returns evicted logs."""
+        attempts = self.attempts()
+        cutoff = time.time() - max_age_days * 86400
+        evicted = [a for a in attempts if a[3].st_mtime < cutoff]
+        remaining = sorted((a for a in attempts if a[3].st_mtime >= cutoff), key=lambda a: a[3].st_mtime)
+
+        total = sum(a[3].st_size for a in remaining)
+        while remaining and (total > max_bytes or len(remaining) > max_files):
+            oldest = remaining.pop(0)
+            total -= oldest[3].st_size
+            evicted.append(oldest)
+
+        if dry_run:
+            return evicted
+
+        evicted.sort(key=lambda a: (a[2], a[0].name))
+        self.fold_into_digest(evicted, max_digest_bytes)
+        for path, _, _, _ in evicted:
+            path.unlink()
+        self.write_index()
+        return evicted
+
+    def write_index(self):
+        """Rewrite the compact attempt index."""
+        if not self.root.is_dir():
+            return
+        lines = [
+            "# Problem-Solving Workspace Index",
+            "",
+            "| File | Stage | Created | Lines | Summary |",
+            "|------|-------|---------|-------|---------|",
+        ]
+        for path, stage, timestamp, _ in self.attempts():
+            created = f"{timestamp[:4]}-{timestamp[4:6]}-{timestamp[6:8]} {timestamp[9:11]}:{timestamp[11:13]}"
+            with open(path, "rb") as f:
+                line_count = sum(1 for _ in f)
+            lines.append(f"| [{path.name}](./{path.name}) | {stage} | {created} | {line_count} | {first_summary_line(path)} |")
+        if self.digest_file.exists():
+            lines += ["", f"Older attempts are summarized in [{DIGEST_FILE}](./{DIGEST_FILE})."]
+        content = "\n".join(lines) + "\n"
+
+        if self.index_file.exists():
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                if f.read() == content:
+                    return
+        with open(self.index_file, "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+def main():
+    """Main function to run the problem-solving workspace manager."""
+    parser = argparse.ArgumentParser(description="Manage the problem-solving tmp workspace.")
+    parser.add_argument('--root', default=".", help="Project root (default: current directory)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    new_parser = subparsers.add_parser('new', help="Create a timestamped attempt log")
+    new_parser.add_argument('stage', choices=STAGES)
+
+    gc_parser = subparsers.add_parser('gc', help="Evict old logs into the digest and enforce quotas")
+    gc_parser.add_argument('--max-age-days', type=float, default=DEFAULT_MAX_AGE_DAYS)
+    gc_parser.add_argument('--max-bytes', type=int, default=DEFAULT_MAX_BYTES)
+    gc_parser.add_argument('--max-files', type=int, default=DEFAULT_MAX_FILES)
+    gc_parser.add_argument('--max-digest-bytes', type=int, default=DEFAULT_DIGEST_BYTES)
+    gc_parser.add_argument('--dry-run', action='store_true', help="List what would be evicted")
+
+    subparsers.add_parser('index', help="Rebuild the attempt index")
+    args = parser.parse_args()
+
+    workspace = TmpWorkspace(args.root)
+    if args.command == 'new':
+        print(workspace.new(args.stage))
+    elif args.command == 'gc':
+        evicted = workspace.gc(args.max_age_days, args.max_bytes, args.max_files,
+                               args.max_digest_bytes, dry_run=args.dry_run)
+        for path, _, _, _ in evicted:
+            print(f"{'🔍 Would evict' if args.dry_run else '🗑️  Evicted'}: {path.name}")
+        print(f"✅ {len(evicted)} attempt log(s) {'to evict' if args.dry_run else 'folded into digest'}, "
+              f"{len(workspace.attempts())} kept")
+    elif args.command == 'index':
+        workspace.write_index()
+        print(f"✅ Indexed {len(workspace.attempts())} attempt log(s): {workspace.index_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())